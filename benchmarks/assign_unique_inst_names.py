@@ -0,0 +1,42 @@
+#!/usr/bin/env python3
+"""Times `qss.serialization._assign_unique_inst_names` on circuits with many custom instructions.
+
+Every instruction is a `ZZSwapGate` with a distinct parameter, which is the worst case for unique
+instruction naming (no instruction can be reused, and all of them share a name).
+"""
+import argparse
+import time
+from typing import List
+
+import qiskit
+
+import qiskit_superstaq as qss
+
+
+def build_circuit(num_insts: int) -> qiskit.QuantumCircuit:
+    circuit = qiskit.QuantumCircuit(2)
+    for i in range(num_insts):
+        circuit.append(qss.ZZSwapGate(1 + i / num_insts), [0, 1])
+    return circuit
+
+
+def main(sizes: List[int]) -> None:
+    print(f"{'instructions':>12}  {'seconds':>9}  {'us/instruction':>14}")
+    for num_insts in sizes:
+        circuit = build_circuit(num_insts)
+        start = time.perf_counter()
+        qss.serialization._assign_unique_inst_names(circuit)
+        elapsed = time.perf_counter() - start
+        print(f"{num_insts:>12}  {elapsed:>9.3f}  {1e6 * elapsed / num_insts:>14.2f}")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument(
+        "sizes",
+        nargs="*",
+        type=int,
+        default=[100, 1_000, 10_000, 100_000],
+        help="numbers of custom instructions to time",
+    )
+    main(parser.parse_args().sizes)
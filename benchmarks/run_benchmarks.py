@@ -0,0 +1,335 @@
+#!/usr/bin/env python3
+"""Benchmarks circuit serialization and the custom gates of qiskit-superstaq.
+
+Every benchmark is run over a grid of circuit sizes (numbers of gates), batch sizes and custom gate
+densities (the fraction of gates which are qiskit-superstaq custom gates). For each point of the
+grid, the best time over several repetitions and the peak memory allocated (traced by tracemalloc
+in a separate, untimed run) are printed. With `--history PATH`, they are also appended as JSON lines
+to the given history file, along with the qiskit-superstaq version and git commit they were
+measured at (nothing is recorded by default). Use `--compare` to compare the results against those
+of an earlier version or commit from that history.
+"""
+import argparse
+import datetime
+import gc
+import itertools
+import json
+import os
+import platform
+import random
+import subprocess
+import time
+import tracemalloc
+from typing import Any, Callable, Dict, Iterator, List, Optional, Tuple
+
+import numpy as np
+import qiskit
+
+import qiskit_superstaq as qss
+
+# A benchmark builds its inputs for (num_gates, batch_size, custom_gate_density), and returns the
+# function to measure
+Benchmark = Callable[[int, int, float], Callable[[], Any]]
+
+
+def _custom_gate(rng: random.Random) -> qiskit.circuit.Gate:
+    """Returns a random qiskit-superstaq custom gate (with random parameters)."""
+    kind = rng.randrange(3)
+    if kind == 0:
+        return qss.ZZSwapGate(rng.uniform(0, np.pi))
+    if kind == 1:
+        return qss.AceCR(rng.choice(["+-", "-+"]), rng.uniform(0, np.pi))
+    return qss.ParallelGates(qss.ZZSwapGate(rng.uniform(0, np.pi)), qss.AceCR("+-"))
+
+
+def build_circuit(
+    num_gates: int, custom_gate_density: float, seed: int = 0, num_qubits: int = 6
+) -> qiskit.QuantumCircuit:
+    """Builds a random circuit in which (about) `custom_gate_density` of the gates are
+    qiskit-superstaq custom gates, and the others are standard (H, CX and RZ) gates."""
+    rng = random.Random(seed)
+    circuit = qiskit.QuantumCircuit(num_qubits)
+    for _ in range(num_gates):
+        if rng.random() < custom_gate_density:
+            gate = _custom_gate(rng)
+        else:
+            gate = rng.choice(
+                [
+                    qiskit.circuit.library.HGate(),
+                    qiskit.circuit.library.CXGate(),
+                    qiskit.circuit.library.RZGate(rng.uniform(0, np.pi)),
+                ]
+            )
+        circuit.append(gate, rng.sample(range(num_qubits), gate.num_qubits))
+    return circuit
+
+
+def build_batch(
+    num_gates: int, batch_size: int, custom_gate_density: float
+) -> List[qiskit.QuantumCircuit]:
+    return [build_circuit(num_gates, custom_gate_density, seed) for seed in range(batch_size)]
+
+
+def build_gates(num_gates: int, gate_type: type) -> List[qiskit.circuit.Gate]:
+    """Builds `num_gates` gates of the given type with distinct random parameters."""
+    rng = random.Random(0)
+    gates = [_custom_gate(rng) for _ in range(3 * num_gates)]
+    return [gate for gate in gates if isinstance(gate, gate_type)][:num_gates]
+
+
+def _generic_gate(gate: qiskit.circuit.Gate) -> qiskit.circuit.Gate:
+    """Returns a generic Gate with the same name, parameters and definition as `gate` (as found in
+    deserialized circuits, before custom gates are resolved)."""
+    generic_gate = qiskit.circuit.Gate(gate.name, gate.num_qubits, gate.params, label=gate.label)
+    generic_gate.definition = gate.definition
+    return generic_gate
+
+
+def bench_serialize_circuits(
+    num_gates: int, batch_size: int, custom_gate_density: float
+) -> Callable[[], Any]:
+    circuits = build_batch(num_gates, batch_size, custom_gate_density)
+    return lambda: qss.serialization.serialize_circuits(circuits)
+
+
+def bench_deserialize_circuits(
+    num_gates: int, batch_size: int, custom_gate_density: float
+) -> Callable[[], Any]:
+    circuits = build_batch(num_gates, batch_size, custom_gate_density)
+    serialized_circuits = qss.serialization.serialize_circuits(circuits)
+    return lambda: qss.serialization.deserialize_circuits(serialized_circuits)
+
+
+def bench_assign_unique_inst_names(
+    num_gates: int, batch_size: int, custom_gate_density: float
+) -> Callable[[], Any]:
+    circuits = build_batch(num_gates, batch_size, custom_gate_density)
+    return lambda: [qss.serialization._assign_unique_inst_names(circuit) for circuit in circuits]
+
+
+def bench_custom_resolver(
+    num_gates: int, batch_size: int, custom_gate_density: float
+) -> Callable[[], Any]:
+    circuits = build_batch(num_gates, batch_size, custom_gate_density)
+    generic_gates = [
+        _generic_gate(inst)
+        for circuit in circuits
+        for inst, _, _ in circuit
+        if not type(inst).__module__.startswith("qiskit.")
+    ]
+    return lambda: [qss.custom_gates.custom_resolver(gate) for gate in generic_gates]
+
+
+def _bench_array(gate_type: type) -> Benchmark:
+    """Returns a benchmark of the (uncached) `__array__` method of the given custom gate type, on
+    `num_gates` gates (the batch size and custom gate density are ignored)."""
+
+    def bench_array(
+        num_gates: int, batch_size: int, custom_gate_density: float
+    ) -> Callable[[], Any]:
+        gates = build_gates(num_gates, gate_type)
+
+        def run() -> List[np.ndarray]:
+            qss.custom_gates._matrix_cache.clear()
+            return [np.array(gate) for gate in gates]
+
+        return run
+
+    return bench_array
+
+
+BENCHMARKS: Dict[str, Benchmark] = {
+    "serialize_circuits": bench_serialize_circuits,
+    "deserialize_circuits": bench_deserialize_circuits,
+    "assign_unique_inst_names": bench_assign_unique_inst_names,
+    "custom_resolver": bench_custom_resolver,
+    "array_zzswap": _bench_array(qss.ZZSwapGate),
+    "array_acecr": _bench_array(qss.AceCR),
+    "array_parallel_gates": _bench_array(qss.ParallelGates),
+}
+
+# Benchmarks which only depend on the number of gates (and only run at the first batch size and
+# custom gate density)
+_GATE_BENCHMARKS = ("array_zzswap", "array_acecr", "array_parallel_gates")
+
+
+def measure(run: Callable[[], Any], repeat: int) -> Tuple[float, int]:
+    """Returns the best time (in seconds) of `repeat` calls to `run`, and the peak number of bytes
+    allocated by one more (traced) call."""
+    times = []
+    for _ in range(repeat):
+        gc.collect()
+        start = time.perf_counter()
+        run()
+        times.append(time.perf_counter() - start)
+
+    gc.collect()
+    tracemalloc.start()
+    try:
+        run()
+        _, peak_bytes = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+
+    return min(times), peak_bytes
+
+
+def _git_commit() -> Optional[str]:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            cwd=os.path.dirname(os.path.abspath(__file__)),
+            capture_output=True,
+            check=True,
+            text=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def run_benchmarks(
+    names: List[str],
+    sizes: List[int],
+    batch_sizes: List[int],
+    densities: List[float],
+    max_total_gates: int,
+    repeat: int,
+) -> Iterator[Dict[str, Any]]:
+    """Runs the given benchmarks over the grid of parameters, yielding a record of each result."""
+    environment = {
+        "version": qss.__version__,
+        "git_commit": _git_commit(),
+        "python": platform.python_version(),
+        "qiskit_terra": qiskit.__version__,
+        "timestamp": datetime.datetime.now(datetime.timezone.utc).isoformat(),
+    }
+
+    for name in names:
+        grid = itertools.product(sizes, batch_sizes, densities)
+        if name in _GATE_BENCHMARKS:
+            grid = itertools.product(sizes, batch_sizes[:1], densities[:1])
+
+        for num_gates, batch_size, density in grid:
+            if num_gates * batch_size > max_total_gates:
+                continue
+
+            seconds, peak_bytes = measure(BENCHMARKS[name](num_gates, batch_size, density), repeat)
+            yield {
+                "benchmark": name,
+                "num_gates": num_gates,
+                "batch_size": batch_size,
+                "custom_gate_density": density,
+                "seconds": seconds,
+                "peak_bytes": peak_bytes,
+                **environment,
+            }
+
+
+def _record_key(record: Dict[str, Any]) -> Tuple[Any, ...]:
+    return (
+        record["benchmark"],
+        record["num_gates"],
+        record["batch_size"],
+        record["custom_gate_density"],
+    )
+
+
+def load_baseline(history_path: str, baseline: str) -> Dict[Tuple[Any, ...], Dict[str, Any]]:
+    """Returns the latest record of each benchmark measured at the given version or commit."""
+    records: Dict[Tuple[Any, ...], Dict[str, Any]] = {}
+    if os.path.exists(history_path):
+        with open(history_path) as history_file:
+            for line in history_file:
+                record = json.loads(line)
+                if baseline in (record["version"], record["git_commit"]):
+                    records[_record_key(record)] = record
+    return records
+
+
+def main(args: argparse.Namespace) -> None:
+    baseline = load_baseline(args.history, args.compare) if args.compare else {}
+
+    header = (
+        f"{'benchmark':<26}{'gates':>8}{'batch':>7}{'density':>9}{'seconds':>11}{'peak MB':>10}"
+    )
+    print(header + (f"{'time ratio':>12}{'mem ratio':>11}" if args.compare else ""))
+
+    results = run_benchmarks(
+        args.benchmarks,
+        args.sizes,
+        args.batch_sizes,
+        args.densities,
+        args.max_total_gates,
+        args.repeat,
+    )
+    for record in results:
+        line = (
+            f"{record['benchmark']:<26}{record['num_gates']:>8}{record['batch_size']:>7}"
+            f"{record['custom_gate_density']:>9.2f}{record['seconds']:>11.4f}"
+            f"{record['peak_bytes'] / 2**20:>10.2f}"
+        )
+        baseline_record = baseline.get(_record_key(record))
+        if baseline_record is not None:
+            time_ratio = record["seconds"] / max(baseline_record["seconds"], 1e-9)
+            memory_ratio = record["peak_bytes"] / max(baseline_record["peak_bytes"], 1)
+            line += f"{time_ratio:>12.2f}{memory_ratio:>11.2f}"
+        print(line, flush=True)
+
+        if args.history:
+            with open(args.history, "a") as history_file:
+                history_file.write(json.dumps(record) + "\n")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(
+        description=__doc__, formatter_class=argparse.RawDescriptionHelpFormatter
+    )
+    parser.add_argument(
+        "benchmarks",
+        nargs="*",
+        default=list(BENCHMARKS),
+        help=f"the benchmarks to run, among {', '.join(BENCHMARKS)} (defaults to all of them)",
+    )
+    parser.add_argument(
+        "--sizes",
+        nargs="+",
+        type=int,
+        default=[10, 100, 1_000, 10_000, 100_000],
+        help="numbers of gates per circuit",
+    )
+    parser.add_argument(
+        "--batch-sizes", nargs="+", type=int, default=[1, 10, 100], help="numbers of circuits"
+    )
+    parser.add_argument(
+        "--densities",
+        nargs="+",
+        type=float,
+        default=[0.0, 0.1, 1.0],
+        help="fractions of the gates which are qiskit-superstaq custom gates",
+    )
+    parser.add_argument(
+        "--max-total-gates",
+        type=int,
+        default=1_000_000,
+        help="skip the batches with more gates in total than this",
+    )
+    parser.add_argument(
+        "--repeat", type=int, default=3, help="number of timed runs (the best one is reported)"
+    )
+    parser.add_argument(
+        "--history",
+        metavar="PATH",
+        help="JSON lines file to which results are appended (by default, they are not recorded)",
+    )
+    parser.add_argument(
+        "--compare",
+        metavar="VERSION_OR_COMMIT",
+        help="compare results with those recorded in the history for this version or git commit",
+    )
+    args = parser.parse_args()
+    if args.compare and not args.history:
+        parser.error("--compare requires --history")
+    unknown_benchmarks = set(args.benchmarks) - set(BENCHMARKS)
+    if unknown_benchmarks:
+        parser.error(f"unknown benchmark(s): {', '.join(sorted(unknown_benchmarks))}")
+    main(args)
@@ -1,5 +1,11 @@
 from ._init_vars import API_URL, API_VERSION
-from . import compiler_output, serialization  # noqa: I100; b/c ._init_vars need to be init first
+from . import (  # noqa: I100; b/c ._init_vars need to be init first
+    caching,
+    compact_result,
+    compiler_output,
+    polling,
+    serialization,
+)
 from ._version import __version__
 from .custom_gates import (
     AceCR,
@@ -8,7 +14,7 @@ from .custom_gates import (
     ParallelGates,
     ZZSwapGate,
 )
-from .superstaq_backend import SuperstaQBackend
+from .superstaq_backend import SuperstaQBackend, SuperstaQPartialSubmissionException
 from .superstaq_job import SuperstaQJob
 from .superstaq_provider import SuperstaQProvider
 
@@ -18,11 +24,15 @@ __all__ = [
     "API_VERSION",
     "AQTiCCXGate",
     "AQTiToffoliGate",
+    "caching",
+    "compact_result",
     "compiler_output",
     "ITOFFOLIGate",
     "ParallelGates",
+    "polling",
     "serialization",
     "SuperstaQBackend",
+    "SuperstaQPartialSubmissionException",
     "SuperstaQJob",
     "SuperstaQProvider",
     "ZZSwapGate",
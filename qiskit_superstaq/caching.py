@@ -0,0 +1,381 @@
+import collections
+import os
+import sqlite3
+import threading
+import time
+from typing import Any, Callable, Dict, Hashable, NamedTuple, Optional, Set, Tuple
+
+
+class CacheInfo(NamedTuple):
+    """Statistics about the usage of a cache."""
+
+    hits: int
+    misses: int
+    evictions: int
+    entries: int
+    size: int
+    max_size: int
+
+
+class LRUCache:
+    """A thread-safe least-recently-used cache, bounded by the total size of its values.
+
+    By default every value has a size of 1, so `max_size` bounds the number of entries. A `sizeof`
+    function can be provided to bound e.g. the total number of bytes of cached payloads instead.
+    """
+
+    def __init__(self, max_size: int, sizeof: Optional[Callable[[Any], int]] = None) -> None:
+        """
+        Args:
+            max_size: the maximum total size of the cached values
+            sizeof: optional function returning the size of a value (defaults to 1 per value)
+        """
+        if max_size <= 0:
+            raise ValueError("The maximum size of a cache must be positive.")
+
+        self.max_size = max_size
+        self._sizeof = sizeof or (lambda _: 1)
+        self._data: "collections.OrderedDict[Hashable, Any]" = collections.OrderedDict()
+        self._sizes: dict = {}
+        self._size = 0
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        """Returns the value cached for `key` (marking it as recently used), or `default`."""
+        with self._lock:
+            if key not in self._data:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key: Hashable, value: Any) -> None:
+        """Caches `value` for `key`, evicting the least recently used values if needed.
+
+        Values larger than the maximum size of the cache are not cached.
+        """
+        size = self._sizeof(value)
+        with self._lock:
+            self._pop(key)
+            if size > self.max_size:
+                return
+
+            self._data[key] = value
+            self._sizes[key] = size
+            self._size += size
+
+            while self._size > self.max_size:
+                self._pop(next(iter(self._data)))
+                self._evictions += 1
+
+    def pop(self, key: Hashable, default: Any = None) -> Any:
+        """Removes the value cached for `key` (if any) and returns it, or `default`."""
+        with self._lock:
+            return self._pop(key, default)
+
+    def _pop(self, key: Hashable, default: Any = None) -> Any:
+        if key not in self._data:
+            return default
+        self._size -= self._sizes.pop(key)
+        return self._data.pop(key)
+
+    def clear(self) -> None:
+        """Removes all values from the cache (without resetting its statistics)."""
+        with self._lock:
+            self._data.clear()
+            self._sizes.clear()
+            self._size = 0
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the usage statistics of the cache."""
+        with self._lock:
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=len(self._data),
+                size=self._size,
+                max_size=self.max_size,
+            )
+
+    def __contains__(self, key: Hashable) -> bool:
+        return key in self._data
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def __repr__(self) -> str:
+        return f"qss.caching.LRUCache(max_size={self.max_size!r})"
+
+
+class TTLCache:
+    """A thread-safe cache of values which expire a fixed time after being loaded.
+
+    Values are loaded on demand by the loader passed to `get`. If `refresh_after` is set, values
+    older than that (but not yet expired) are still returned immediately, while a background
+    thread reloads them, so that frequently used values are kept fresh without blocking callers.
+    """
+
+    def __init__(
+        self,
+        ttl: float,
+        refresh_after: Optional[float] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            ttl: the number of seconds after which a cached value expires
+            refresh_after: optional number of seconds (less than `ttl`) after which a cached value
+                is reloaded in the background when it is accessed
+            clock: the function returning the current time in seconds
+        """
+        if ttl <= 0:
+            raise ValueError("The time-to-live of a cache must be positive.")
+        if refresh_after is not None and not 0 <= refresh_after < ttl:
+            raise ValueError("refresh_after must be nonnegative and less than the time-to-live.")
+
+        self.ttl = ttl
+        self.refresh_after = refresh_after
+        self._clock = clock
+        self._data: Dict[Hashable, Tuple[float, Any]] = {}
+        self._refreshing: Set[Hashable] = set()
+        # incremented on every invalidation, so that outdated (background) loads are discarded
+        self._generation = 0
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable, loader: Callable[[], Any]) -> Any:
+        """Returns the value cached for `key`, calling `loader()` to (re)load it if needed."""
+        with self._lock:
+            now = self._clock()
+            loaded_at, value = self._data.get(key, (None, None))
+            if loaded_at is not None and now - loaded_at < self.ttl:
+                if (
+                    self.refresh_after is not None
+                    and now - loaded_at >= self.refresh_after
+                    and key not in self._refreshing
+                ):
+                    self._refreshing.add(key)
+                    thread = threading.Thread(
+                        target=self._refresh, args=(key, loader, self._generation), daemon=True
+                    )
+                    thread.start()
+                return value
+
+            generation = self._generation
+
+        return self._load(key, loader, generation)
+
+    def _load(self, key: Hashable, loader: Callable[[], Any], generation: int) -> Any:
+        loaded_at = self._clock()
+        value = loader()
+        with self._lock:
+            if generation == self._generation:
+                self._data[key] = (loaded_at, value)
+        return value
+
+    def _refresh(self, key: Hashable, loader: Callable[[], Any], generation: int) -> None:
+        try:
+            self._load(key, loader, generation)
+        except Exception:
+            pass  # the current value is kept until it expires (and is then reloaded in `get`)
+        finally:
+            with self._lock:
+                self._refreshing.discard(key)
+
+    def invalidate(self, key: Optional[Hashable] = None) -> None:
+        """Removes the value cached for `key` (or all values if `key` is None), so that it is
+        reloaded on its next access. Loads in progress are not cached."""
+        with self._lock:
+            self._generation += 1
+            if key is None:
+                self._data.clear()
+            else:
+                self._data.pop(key, None)
+
+    def __contains__(self, key: Hashable) -> bool:
+        with self._lock:
+            loaded_at, _ = self._data.get(key, (None, None))
+            return loaded_at is not None and self._clock() - loaded_at < self.ttl
+
+    def __len__(self) -> int:
+        return sum(key in self for key in list(self._data))
+
+    def __repr__(self) -> str:
+        return f"qss.caching.TTLCache(ttl={self.ttl!r}, refresh_after={self.refresh_after!r})"
+
+
+class DiskCache:
+    """A persistent least-recently-used cache of bytes, stored in a SQLite database and bounded by
+    the total number of bytes it holds.
+
+    The database can be shared by several threads and processes (e.g. successive runs of a script).
+    Keys must be strings. Hit, miss and eviction counts are tracked per DiskCache instance.
+
+    If `max_age` is set, values also expire that many seconds after they were written (which is
+    recorded in the database, so that it also applies across sessions).
+    """
+
+    def __init__(
+        self,
+        path: str,
+        max_size: int,
+        max_age: Optional[float] = None,
+        clock: Callable[[], float] = time.time,
+    ) -> None:
+        """
+        Args:
+            path: the path of the SQLite database file (created if it does not exist)
+            max_size: the maximum total number of bytes of the cached values
+            max_age: optional number of seconds after which a cached value expires
+            clock: the function returning the current (wall-clock) time in seconds
+        """
+        if max_size <= 0:
+            raise ValueError("The maximum size of a cache must be positive.")
+        if max_age is not None and max_age <= 0:
+            raise ValueError("The maximum age of cached values must be positive.")
+
+        self.path = os.path.expanduser(path)
+        self.max_size = max_size
+        self.max_age = max_age
+        self._clock = clock
+        self._hits = 0
+        self._misses = 0
+        self._evictions = 0
+        self._lock = threading.Lock()
+
+        directory = os.path.dirname(os.path.abspath(self.path))
+        os.makedirs(directory, exist_ok=True)
+        self._connection = sqlite3.connect(self.path, timeout=30, check_same_thread=False)
+        with self._lock, self._connection:
+            # `accessed` is a logical clock, incremented whenever an entry is read or written
+            # and `created` the (wall-clock) time at which the entry was written
+            self._connection.execute(
+                "CREATE TABLE IF NOT EXISTS entries ("
+                "key TEXT PRIMARY KEY, value BLOB NOT NULL, size INTEGER NOT NULL, "
+                "accessed INTEGER NOT NULL, created REAL NOT NULL DEFAULT 0)"
+            )
+            columns = [row[1] for row in self._connection.execute("PRAGMA table_info(entries)")]
+            if "created" not in columns:  # (databases created before values could expire)
+                self._connection.execute(
+                    "ALTER TABLE entries ADD COLUMN created REAL NOT NULL DEFAULT 0"
+                )
+            self._connection.execute(
+                "CREATE INDEX IF NOT EXISTS entries_accessed ON entries (accessed)"
+            )
+
+    def _touch(self, key: str) -> None:
+        self._connection.execute(
+            "UPDATE entries SET accessed = (SELECT MAX(accessed) + 1 FROM entries) WHERE key = ?",
+            (key,),
+        )
+
+    def _is_expired(self, created: float) -> bool:
+        return self.max_age is not None and self._clock() - created >= self.max_age
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Returns the bytes cached for `key` (marking them as recently used), or `default`."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value, created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is not None and self._is_expired(row[1]):
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                row = None
+            if row is None:
+                self._misses += 1
+                return default
+
+            self._hits += 1
+            self._touch(key)
+            return bytes(row[0])
+
+    def put(self, key: str, value: bytes) -> None:
+        """Caches `value` for `key`, evicting the least recently used values if needed.
+
+        Values larger than the maximum size of the cache are not cached.
+        """
+        with self._lock, self._connection:
+            if len(value) > self.max_size:
+                self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+                return
+
+            self._connection.execute(
+                "INSERT OR REPLACE INTO entries (key, value, size, accessed, created) VALUES "
+                "(?, ?, ?, (SELECT COALESCE(MAX(accessed), 0) + 1 FROM entries), ?)",
+                (key, value, len(value), self._clock()),
+            )
+
+            (size,) = self._connection.execute("SELECT SUM(size) FROM entries").fetchone()
+            if size <= self.max_size:
+                return
+
+            evicted_keys = []
+            rows = self._connection.execute(
+                "SELECT key, size FROM entries WHERE key != ? ORDER BY accessed", (key,)
+            )
+            for evicted_key, evicted_size in rows:
+                if size <= self.max_size:
+                    break
+                evicted_keys.append((evicted_key,))
+                size -= evicted_size
+
+            self._connection.executemany("DELETE FROM entries WHERE key = ?", evicted_keys)
+            self._evictions += len(evicted_keys)
+
+    def pop(self, key: str, default: Any = None) -> Any:
+        """Removes the bytes cached for `key` (if any) and returns them, or `default`."""
+        with self._lock, self._connection:
+            row = self._connection.execute(
+                "SELECT value FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return default
+
+            self._connection.execute("DELETE FROM entries WHERE key = ?", (key,))
+            return bytes(row[0])
+
+    def clear(self) -> None:
+        """Removes all values from the cache (without resetting its statistics)."""
+        with self._lock, self._connection:
+            self._connection.execute("DELETE FROM entries")
+
+    def cache_info(self) -> CacheInfo:
+        """Returns the usage statistics of the cache."""
+        with self._lock:
+            entries, size = self._connection.execute(
+                "SELECT COUNT(*), COALESCE(SUM(size), 0) FROM entries"
+            ).fetchone()
+            return CacheInfo(
+                hits=self._hits,
+                misses=self._misses,
+                evictions=self._evictions,
+                entries=entries,
+                size=size,
+                max_size=self.max_size,
+            )
+
+    def close(self) -> None:
+        """Closes the connection to the database."""
+        with self._lock:
+            self._connection.close()
+
+    def __contains__(self, key: str) -> bool:
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT created FROM entries WHERE key = ?", (key,)
+            ).fetchone()
+            return row is not None and not self._is_expired(row[0])
+
+    def __len__(self) -> int:
+        return self.cache_info().entries
+
+    def __repr__(self) -> str:
+        return (
+            f"qss.caching.DiskCache(path={self.path!r}, max_size={self.max_size!r}, "
+            f"max_age={self.max_age!r})"
+        )
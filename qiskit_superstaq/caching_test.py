@@ -0,0 +1,257 @@
+import pathlib
+import sqlite3
+import threading
+import time
+from typing import Callable, List
+from unittest import mock
+
+import pytest
+
+import qiskit_superstaq as qss
+
+
+def test_lru_cache() -> None:
+    cache = qss.caching.LRUCache(2)
+    assert repr(cache) == "qss.caching.LRUCache(max_size=2)"
+
+    cache.put("a", 1)
+    cache.put("b", 2)
+    assert cache.get("a") == 1
+    assert cache.get("c") is None
+    assert cache.get("c", "default") == "default"
+
+    # "b" is now the least recently used value
+    cache.put("c", 3)
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert len(cache) == 2
+
+    assert cache.cache_info() == qss.caching.CacheInfo(
+        hits=1, misses=2, evictions=1, entries=2, size=2, max_size=2
+    )
+
+    # overwriting an entry doesn't evict anything
+    cache.put("c", 4)
+    assert cache.get("c") == 4
+    assert cache.cache_info().evictions == 1
+
+    assert cache.pop("c") == 4
+    assert cache.pop("c", "default") == "default"
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.cache_info().size == 0
+    assert cache.cache_info().hits == 2
+
+    with pytest.raises(ValueError, match="must be positive"):
+        _ = qss.caching.LRUCache(0)
+
+
+def test_lru_cache_sizeof() -> None:
+    cache = qss.caching.LRUCache(10, sizeof=len)
+
+    cache.put("a", b"12345")
+    cache.put("b", b"1234")
+    assert cache.cache_info().size == 9
+
+    cache.put("c", b"12")
+    assert "a" not in cache
+    assert cache.cache_info().size == 6
+
+    # values larger than the cache aren't stored
+    cache.put("d", b"12345678901")
+    assert "d" not in cache
+    assert cache.cache_info().size == 6
+
+
+def test_ttl_cache() -> None:
+    now = [0.0]
+    cache = qss.caching.TTLCache(10, clock=lambda: now[0])
+    assert repr(cache) == "qss.caching.TTLCache(ttl=10, refresh_after=None)"
+
+    loader = mock.MagicMock(side_effect=[1, 2, 3, 4])
+    assert cache.get("a", loader) == 1
+    assert "a" in cache and len(cache) == 1
+    now[0] = 9.9
+    assert cache.get("a", loader) == 1
+    assert loader.call_count == 1
+
+    # expired values are reloaded
+    now[0] = 10.0
+    assert "a" not in cache and len(cache) == 0
+    assert cache.get("a", loader) == 2
+    assert loader.call_count == 2
+
+    cache.invalidate("a")
+    assert cache.get("a", loader) == 3
+    cache.invalidate()
+    assert cache.get("a", loader) == 4
+
+    # loads overtaken by an invalidation are not cached
+    def invalidating_loader() -> int:
+        cache.invalidate()
+        return 5
+
+    assert cache.get("b", invalidating_loader) == 5
+    assert "b" not in cache
+
+    with pytest.raises(ValueError, match="must be positive"):
+        _ = qss.caching.TTLCache(0)
+    with pytest.raises(ValueError, match="less than the time-to-live"):
+        _ = qss.caching.TTLCache(10, refresh_after=10)
+
+
+def _wait_until(condition: Callable[[], bool]) -> None:
+    """Waits (for up to 5 seconds) until a condition set by another thread holds."""
+    deadline = time.monotonic() + 5
+    while not condition() and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert condition()
+
+
+def test_ttl_cache_refresh() -> None:
+    now = [0.0]
+    cache = qss.caching.TTLCache(10, refresh_after=5, clock=lambda: now[0])
+
+    started, finished, release = threading.Event(), threading.Event(), threading.Event()
+    values: List[int] = []
+
+    def loader() -> int:
+        if values:
+            started.set()
+            release.wait()
+        values.append(len(values))
+        if len(values) == 3:
+            raise RuntimeError("failed refresh")
+        finished.set()
+        return values[-1]
+
+    assert cache.get("a", loader) == 0
+
+    # stale values are returned while they are refreshed in the background (only once at a time)
+    now[0] = 5.0
+    assert cache.get("a", loader) == 0
+    assert started.wait(5)
+    assert cache.get("a", loader) == 0
+    finished.clear()
+    release.set()
+    assert finished.wait(5)
+    _wait_until(lambda: not cache._refreshing)
+    assert cache.get("a", loader) == 1
+    assert len(values) == 2
+
+    # failed refreshes keep the current value (until it expires)
+    now[0] = 10.0
+    assert cache.get("a", loader) == 1
+    _wait_until(lambda: len(values) == 3 and not cache._refreshing)
+    assert cache._data["a"] == (5.0, 1)
+
+    now[0] = 15.0
+    assert cache.get("a", loader) == 3
+
+
+def test_disk_cache(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "cache" / "cache.db")
+    cache = qss.caching.DiskCache(path, 4)
+    assert repr(cache) == f"qss.caching.DiskCache(path={path!r}, max_size=4, max_age=None)"
+
+    cache.put("a", b"1")
+    cache.put("b", b"22")
+    assert cache.get("a") == b"1"
+    assert cache.get("c") is None
+    assert cache.get("c", "default") == "default"
+
+    # "b" is now the least recently used value
+    cache.put("c", b"33")
+    assert "b" not in cache
+    assert "a" in cache and "c" in cache
+    assert len(cache) == 2
+
+    assert cache.cache_info() == qss.caching.CacheInfo(
+        hits=1, misses=2, evictions=1, entries=2, size=3, max_size=4
+    )
+
+    # overwriting an entry doesn't evict anything
+    cache.put("c", b"3")
+    assert cache.get("c") == b"3"
+    assert cache.cache_info().evictions == 1
+
+    # values larger than the cache are not cached (and replace any previous value)
+    cache.put("c", b"55555")
+    assert "c" not in cache
+    assert cache.cache_info().size == 1
+
+    # the cache is persistent
+    cache.put("d", b"444")
+    cache.close()
+    cache = qss.caching.DiskCache(path, 4)
+    assert cache.get("d") == b"444"
+    assert cache.cache_info() == qss.caching.CacheInfo(
+        hits=1, misses=0, evictions=0, entries=2, size=4, max_size=4
+    )
+
+    assert cache.pop("a") == b"1"
+    assert cache.pop("a", "default") == "default"
+    assert len(cache) == 1
+
+    cache.clear()
+    assert len(cache) == 0
+    assert cache.cache_info().size == 0
+
+    with pytest.raises(ValueError, match="must be positive"):
+        qss.caching.DiskCache(path, 0)
+    with pytest.raises(ValueError, match="must be positive"):
+        qss.caching.DiskCache(path, 4, max_age=0)
+
+
+def test_disk_cache_max_age(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "cache.db")
+    now = 1000.0
+    cache = qss.caching.DiskCache(path, 100, max_age=10, clock=lambda: now)
+
+    cache.put("a", b"1")
+    now += 5
+    cache.put("b", b"2")
+    assert cache.get("a") == b"1"
+    assert "a" in cache
+
+    # values expire `max_age` seconds after being written (even if they are accessed)
+    now += 5
+    assert "a" not in cache
+    assert cache.get("a") is None
+    assert cache.get("b") == b"2"
+    assert cache.cache_info()[:2] == (2, 1)
+    assert len(cache) == 1
+
+    # the write times are persistent
+    cache.close()
+    cache = qss.caching.DiskCache(path, 100, max_age=10, clock=lambda: now)
+    assert cache.get("b") == b"2"
+    now += 5
+    assert cache.get("b") is None
+
+    # (and without a maximum age, values never expire)
+    cache.put("c", b"3")
+    cache = qss.caching.DiskCache(path, 100)
+    now += 10**6
+    assert cache.get("c") == b"3"
+
+
+def test_disk_cache_schema_upgrade(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "cache.db")
+    with sqlite3.connect(path) as connection:
+        connection.execute(
+            "CREATE TABLE entries (key TEXT PRIMARY KEY, value BLOB NOT NULL, "
+            "size INTEGER NOT NULL, accessed INTEGER NOT NULL)"
+        )
+        connection.execute("INSERT INTO entries VALUES ('a', x'31', 1, 1)")
+    connection.close()
+
+    assert qss.caching.DiskCache(path, 100).get("a") == b"1"
+
+    # entries written before values could expire are considered expired
+    cache = qss.caching.DiskCache(path, 100, max_age=10)
+    assert cache.get("a") is None
+    cache.put("a", b"2")
+    assert cache.get("a") == b"2"
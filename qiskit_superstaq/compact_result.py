@@ -0,0 +1,264 @@
+import collections.abc
+import itertools
+from typing import Any, Dict, Iterator, List, Mapping, Optional, overload, Sequence, Union
+
+import numpy as np
+import qiskit
+
+# Bitstrings of up to this many bits are packed into uint64 integers (longer ones into bytes)
+MAX_PACKED_INT_BITS = 64
+
+
+class CompactCounts:
+    """The counts of a single circuit, stored as parallel arrays of outcomes and their counts.
+
+    Outcomes of up to `MAX_PACKED_INT_BITS` bits are stored as uint64 integers (with classical bit
+    `i` as bit `i` of the integer, as in qiskit bitstrings), and longer outcomes as rows of packed
+    bytes (in bitstring order, i.e. with the last classical bit first).
+    """
+
+    def __init__(
+        self,
+        outcomes: np.ndarray,
+        counts: np.ndarray,
+        num_bits: int,
+        register_sizes: Optional[Sequence[int]] = None,
+    ) -> None:
+        """
+        Args:
+            outcomes: a 1D uint64 array (if `num_bits <= MAX_PACKED_INT_BITS`) or 2D uint8 array
+                of packed bitstrings (otherwise), with one entry per distinct outcome
+            counts: a 1D integer array with the number of occurrences of each outcome
+            num_bits: the number of classical bits of each outcome
+            register_sizes: the sizes of the space-separated registers of the bitstrings returned
+                by `to_dict` (in bitstring order, i.e. with the last register first), or None for
+                bitstrings without spaces
+        """
+        if register_sizes is not None and sum(register_sizes) != num_bits:
+            raise ValueError("The register sizes must add up to the number of classical bits.")
+
+        self.outcomes = outcomes
+        self.counts = counts
+        self.num_bits = num_bits
+        self.register_sizes = None if register_sizes is None else tuple(register_sizes)
+
+    @classmethod
+    def from_counts(
+        cls, counts: Mapping[str, int], num_bits: Optional[int] = None
+    ) -> "CompactCounts":
+        """Builds a CompactCounts from a dictionary of counts keyed by bitstrings.
+
+        Args:
+            counts: the counts of each (binary) bitstring. Bitstrings may have spaces separating
+                registers (as in the counts of qiskit results), which are kept in the bitstrings
+                returned by `to_dict`.
+            num_bits: the number of classical bits (defaults to the length of the longest bitstring)
+        Returns:
+            the corresponding CompactCounts
+        """
+        register_sizes = None
+        first_bitstring = next(iter(counts), "")
+        if " " in first_bitstring:
+            register_sizes = [len(register) for register in first_bitstring.split(" ")]
+
+        bitstrings = [bitstring.replace(" ", "") for bitstring in counts]
+        max_length = max((len(bitstring) for bitstring in bitstrings), default=0)
+        num_bits = max_length if num_bits is None else num_bits
+        if register_sizes is not None:
+            # missing leading bits belong to the last register
+            register_sizes[0] += num_bits - sum(register_sizes)
+        count_array = np.fromiter(counts.values(), dtype=np.int64, count=len(counts))
+
+        if num_bits <= MAX_PACKED_INT_BITS:
+            outcomes = np.array([int(bitstring or "0", 2) for bitstring in bitstrings], np.uint64)
+            return cls(outcomes, count_array, num_bits, register_sizes)
+
+        padded = "".join(bitstring.zfill(num_bits) for bitstring in bitstrings).encode()
+        bits = np.frombuffer(padded, dtype=np.uint8).reshape(len(bitstrings), num_bits) - ord("0")
+        return cls(np.packbits(bits, axis=1), count_array, num_bits, register_sizes)
+
+    @property
+    def shots(self) -> int:
+        """The total number of shots."""
+        return int(self.counts.sum())
+
+    def bits(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Returns the values of some classical bits for each outcome.
+
+        Args:
+            indices: the classical bits to return (defaults to all of them, in order)
+        Returns:
+            a uint8 array with one row per outcome and one column per requested classical bit
+        """
+        indices = range(self.num_bits) if indices is None else indices
+        bits = np.empty((len(self.counts), len(indices)), dtype=np.uint8)
+        for column, index in enumerate(indices):
+            if not 0 <= index < self.num_bits:
+                raise IndexError(f"Classical bit index {index} out of range.")
+
+            if self.outcomes.ndim == 1:
+                bits[:, column] = (self.outcomes >> np.uint64(index)) & np.uint64(1)
+            else:
+                position = self.num_bits - 1 - index
+                bits[:, column] = (self.outcomes[:, position // 8] >> (7 - position % 8)) & 1
+
+        return bits
+
+    def marginal(self, indices: Sequence[int]) -> "CompactCounts":
+        """Marginalizes the counts over all but some classical bits.
+
+        Args:
+            indices: the classical bits to keep. Classical bit `i` of the marginal counts is
+                classical bit `indices[i]` of these counts.
+        Returns:
+            the marginal counts (whose bitstrings have no register separators)
+        """
+        return CompactCounts.from_bits(self.bits(indices), self.counts)
+
+    @classmethod
+    def from_bits(cls, bits: np.ndarray, counts: np.ndarray) -> "CompactCounts":
+        """Builds a CompactCounts from the bits of some (not necessarily distinct) outcomes.
+
+        Args:
+            bits: a 2D array with one row per outcome and one column per classical bit
+            counts: the number of occurrences of each outcome
+        Returns:
+            the corresponding CompactCounts, with the counts of repeated outcomes merged
+        """
+        num_bits = bits.shape[1]
+        if num_bits <= MAX_PACKED_INT_BITS:
+            weights = np.left_shift(np.uint64(1), np.arange(num_bits, dtype=np.uint64))
+            outcomes = (bits.astype(np.uint64) * weights).sum(axis=1, dtype=np.uint64)
+        else:
+            outcomes = np.packbits(bits[:, ::-1], axis=1)
+
+        unique_outcomes, inverse = np.unique(outcomes, axis=0, return_inverse=True)
+        merged_counts = np.bincount(inverse.ravel(), weights=counts, minlength=len(unique_outcomes))
+        return cls(unique_outcomes, merged_counts.astype(np.int64), num_bits)
+
+    def probabilities(self) -> np.ndarray:
+        """Returns the (empirical) probability of each outcome."""
+        return self.counts / self.shots
+
+    def expectation_value(self, indices: Optional[Sequence[int]] = None) -> float:
+        """Returns the expectation value of a Z-parity observable.
+
+        Args:
+            indices: the classical bits whose parity is measured (defaults to all of them)
+        Returns:
+            the expectation value of the product of Z over the given bits, i.e. the difference
+            between the probabilities of even- and odd-parity outcomes
+        """
+        parities = np.bitwise_xor.reduce(self.bits(indices), axis=1, initial=0)
+        return float(np.dot(1 - 2 * parities.astype(np.int64), self.counts) / self.shots)
+
+    def to_dict(self) -> Dict[str, int]:
+        """Returns the counts as a dictionary keyed by bitstrings."""
+        if self.outcomes.ndim == 1:
+            bitstrings = [
+                format(int(outcome), f"0{self.num_bits}b") if self.num_bits else ""
+                for outcome in self.outcomes
+            ]
+        else:
+            bits = np.unpackbits(self.outcomes, axis=1, count=self.num_bits) + ord("0")
+            bitstrings = [row.tobytes().decode() for row in bits]
+
+        if self.register_sizes is not None:
+            bitstrings = [self._split_registers(bitstring) for bitstring in bitstrings]
+
+        return dict(zip(bitstrings, self.counts.tolist()))
+
+    def _split_registers(self, bitstring: str) -> str:
+        """Inserts spaces between the registers of a bitstring."""
+        bits = iter(bitstring)
+        return " ".join("".join(itertools.islice(bits, size)) for size in self.register_sizes or ())
+
+    def __len__(self) -> int:
+        return len(self.counts)
+
+    def __eq__(self, other: Any) -> bool:
+        if not isinstance(other, CompactCounts):
+            return False
+        return self.num_bits == other.num_bits and self.to_dict() == other.to_dict()
+
+    def __repr__(self) -> str:
+        return f"qss.compact_result.CompactCounts.from_counts({self.to_dict()!r}, {self.num_bits})"
+
+
+class CompactResult(collections.abc.Sequence):
+    """The results of a job, holding the CompactCounts of each circuit.
+
+    The standard qiskit Result (with a dictionary of counts for every circuit) is only built if
+    requested, via `to_result`.
+    """
+
+    def __init__(
+        self,
+        counts: List[CompactCounts],
+        shots: List[int],
+        job_id: str,
+        backend_name: str,
+        backend_version: str,
+    ) -> None:
+        """
+        Args:
+            counts: the CompactCounts of each circuit
+            shots: the number of shots each circuit was run for
+            job_id: the ID of the job
+            backend_name: the name of the backend the job was run on
+            backend_version: the version of this backend
+        """
+        self._counts = counts
+        self.shots = shots
+        self.job_id = job_id
+        self.backend_name = backend_name
+        self.backend_version = backend_version
+        self._result: Optional[qiskit.result.Result] = None
+
+    @overload
+    def __getitem__(self, index: int) -> CompactCounts:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[CompactCounts]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Union[CompactCounts, List[CompactCounts]]:
+        return self._counts[index]
+
+    def __len__(self) -> int:
+        return len(self._counts)
+
+    def __iter__(self) -> Iterator[CompactCounts]:
+        return iter(self._counts)
+
+    def marginal(self, indices: Sequence[int]) -> List[CompactCounts]:
+        """Returns the marginal counts of every circuit over the given classical bits."""
+        return [counts.marginal(indices) for counts in self._counts]
+
+    def expectation_values(self, indices: Optional[Sequence[int]] = None) -> np.ndarray:
+        """Returns the expectation value of a Z-parity observable for every circuit (see
+        `CompactCounts.expectation_value`)."""
+        return np.array([counts.expectation_value(indices) for counts in self._counts])
+
+    def to_result(self) -> qiskit.result.Result:
+        """Returns (and memoizes) the equivalent qiskit Result."""
+        if self._result is None:
+            results_list = [
+                {"success": True, "shots": shots, "data": {"counts": counts.to_dict()}}
+                for counts, shots in zip(self._counts, self.shots)
+            ]
+            self._result = qiskit.result.Result.from_dict(
+                {
+                    "results": results_list,
+                    "qobj_id": -1,
+                    "backend_name": self.backend_name,
+                    "backend_version": self.backend_version,
+                    "success": True,
+                    "job_id": self.job_id,
+                }
+            )
+        return self._result
+
+    def __repr__(self) -> str:
+        return f"qss.compact_result.CompactResult({self._counts!r}, job_id={self.job_id!r})"
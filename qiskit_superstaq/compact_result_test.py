@@ -0,0 +1,113 @@
+from unittest import mock
+
+import numpy as np
+import pytest
+import qiskit
+
+import qiskit_superstaq as qss
+
+
+def test_compact_counts() -> None:
+    counts = qss.compact_result.CompactCounts.from_counts({"001": 10, "110": 20, "111": 70})
+    assert counts.num_bits == 3
+    assert counts.outcomes.dtype == np.uint64
+    assert counts.outcomes.tolist() == [1, 6, 7]
+    assert counts.shots == 100
+    assert len(counts) == 3
+    assert counts.to_dict() == {"001": 10, "110": 20, "111": 70}
+    assert np.allclose(counts.probabilities(), [0.1, 0.2, 0.7])
+
+    assert counts.bits().tolist() == [[1, 0, 0], [0, 1, 1], [1, 1, 1]]
+    assert counts.bits([2, 0]).tolist() == [[0, 1], [1, 0], [1, 1]]
+    with pytest.raises(IndexError, match="out of range"):
+        _ = counts.bits([3])
+
+    assert counts.marginal([0]).to_dict() == {"0": 20, "1": 80}
+    assert counts.marginal([2, 1]).to_dict() == {"00": 10, "11": 90}
+    assert counts.marginal([]).to_dict() == {"": 100}
+
+    assert counts.expectation_value([0]) == pytest.approx(0.2 - 0.8)
+    assert counts.expectation_value([1, 2]) == pytest.approx(1.0)
+    assert counts.expectation_value() == pytest.approx(-0.1 + 0.2 - 0.7)
+
+    # register separators are kept in the bitstrings, but not in the bits
+    spaced_counts = qss.compact_result.CompactCounts.from_counts({"0 01": 1, "1 10": 2})
+    assert spaced_counts.num_bits == 3
+    assert spaced_counts.register_sizes == (1, 2)
+    assert spaced_counts.to_dict() == {"0 01": 1, "1 10": 2}
+    assert spaced_counts.bits().tolist() == [[1, 0, 0], [0, 1, 1]]
+    assert spaced_counts.marginal([0, 2]).to_dict() == {"01": 1, "10": 2}
+    assert eval(repr(spaced_counts), {"qss": qss}) == spaced_counts
+    assert spaced_counts != qss.compact_result.CompactCounts.from_counts({"001": 1, "110": 2})
+    assert qss.compact_result.CompactCounts.from_counts({"1 1": 1}, 4).to_dict() == {"001 1": 1}
+    with pytest.raises(ValueError, match="must add up"):
+        _ = qss.compact_result.CompactCounts(np.array([0], np.uint64), np.array([1]), 3, [1, 1])
+
+    assert qss.compact_result.CompactCounts.from_counts({"1": 1}, 3).to_dict() == {"001": 1}
+    assert qss.compact_result.CompactCounts.from_counts({}).to_dict() == {}
+
+    assert counts == qss.compact_result.CompactCounts.from_counts(counts.to_dict())
+    assert counts != qss.compact_result.CompactCounts.from_counts({"001": 10})
+    assert counts != counts.to_dict()
+    assert eval(repr(counts), {"qss": qss}) == counts
+
+
+def test_wide_compact_counts() -> None:
+    bitstring_0 = "1" + "0" * 99
+    bitstring_1 = "01" * 50
+    counts = qss.compact_result.CompactCounts.from_counts({bitstring_0: 3, bitstring_1: 1})
+    assert counts.num_bits == 100
+    assert counts.outcomes.shape == (2, 13)
+    assert counts.to_dict() == {bitstring_0: 3, bitstring_1: 1}
+
+    assert counts.bits([99, 0, 1]).tolist() == [[1, 0, 0], [0, 1, 0]]
+    assert counts.marginal([99, 98]).to_dict() == {"01": 3, "10": 1}
+    assert counts.expectation_value([99]) == pytest.approx(-0.5)
+    assert counts.expectation_value([0, 2]) == pytest.approx(1.0)
+
+    marginal_counts = counts.marginal(list(range(1, 100)) + [0])
+    assert marginal_counts.num_bits == 100
+    assert marginal_counts.to_dict() == {"0" + bitstring_0[:-1]: 3, "1" + bitstring_1[:-1]: 1}
+
+    narrow_counts = counts.marginal(list(range(64)))
+    assert narrow_counts.outcomes.dtype == np.uint64
+    assert narrow_counts.to_dict() == {"0" * 64: 3, bitstring_1[-64:]: 1}
+
+
+def test_compact_result() -> None:
+    counts = [
+        qss.compact_result.CompactCounts.from_counts({"00": 30, "11": 70}),
+        qss.compact_result.CompactCounts.from_counts({"01": 50, "10": 50}),
+    ]
+    result = qss.compact_result.CompactResult(counts, [100, 100], "job_id", "backend", "v0")
+
+    assert len(result) == 2
+    assert result[0] is counts[0]
+    assert result[:1] == counts[:1]
+    assert list(result) == counts
+
+    assert [marginal.to_dict() for marginal in result.marginal([0])] == [
+        {"0": 30, "1": 70},
+        {"0": 50, "1": 50},
+    ]
+    assert np.allclose(result.expectation_values(), [1.0, -1.0])
+    assert np.allclose(result.expectation_values([1]), [-0.4, 0.0])
+
+    with mock.patch(
+        "qiskit.result.Result.from_dict", wraps=qiskit.result.Result.from_dict
+    ) as mock_from_dict:
+        qiskit_result = result.to_result()
+        assert result.to_result() is qiskit_result
+        mock_from_dict.assert_called_once()
+
+    assert qiskit_result.job_id == "job_id"
+    assert qiskit_result.backend_name == "backend"
+    assert qiskit_result.get_counts(0) == {"00": 30, "11": 70}
+    assert qiskit_result.get_counts(1) == {"01": 50, "10": 50}
+    assert qiskit_result.results[0].shots == 100
+
+    assert repr(result) == f"qss.compact_result.CompactResult({counts!r}, job_id='job_id')"
+
+    spaced_counts = qss.compact_result.CompactCounts.from_counts({"0 01": 1, "1 10": 2})
+    result = qss.compact_result.CompactResult([spaced_counts], [3], "job_id", "backend", "v0")
+    assert result.to_result().get_counts() == {"0 01": 1, "1 10": 2}
@@ -1,7 +1,6 @@
 import importlib
-from typing import Any, List, Optional, Union
+from typing import Any, Callable, Dict, List, Optional, Sequence, Union
 
-import applications_superstaq
 import qiskit
 
 import qiskit_superstaq as qss
@@ -15,7 +14,7 @@ except ModuleNotFoundError:
 class CompilerOutput:
     def __init__(
         self,
-        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        circuits: Union[qiskit.QuantumCircuit, Sequence[qiskit.QuantumCircuit]],
         pulse_sequences: Union[qiskit.pulse.Schedule, List[qiskit.pulse.Schedule]] = None,
         seq: Optional["qtrl.sequencer.Sequence"] = None,
         jaqal_programs: Optional[List[str]] = None,
@@ -34,6 +33,30 @@ class CompilerOutput:
 
         self.seq = seq
 
+    def _set_lazy_attribute(self, name: str, loader: Callable[[], Any]) -> None:
+        """Makes `name` an attribute which is computed by `loader` on first access (and cached
+        after that)."""
+        self.__dict__.pop(name, None)
+        self.__dict__.setdefault("_lazy_attributes", {})[name] = loader
+
+    def __getattr__(self, name: str) -> Any:
+        # (only called for attributes which haven't been set, i.e. unloaded lazy attributes)
+        lazy_attributes = self.__dict__.get("_lazy_attributes", {})
+        if name not in lazy_attributes:
+            raise AttributeError(f"'CompilerOutput' object has no attribute '{name}'")
+
+        value = lazy_attributes[name]()
+        setattr(self, name, value)
+        lazy_attributes.pop(name, None)
+        return value
+
+    def __getstate__(self) -> Dict[str, Any]:
+        for name in list(self.__dict__.get("_lazy_attributes", {})):
+            getattr(self, name)
+        state = self.__dict__.copy()
+        state.pop("_lazy_attributes", None)
+        return state
+
     def has_multiple_circuits(self) -> bool:
         """Returns True if this object represents multiple circuits.
 
@@ -77,76 +100,142 @@ class CompilerOutput:
         )
 
 
-def read_json_aqt(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
+def fan_out(compiler_output: CompilerOutput, indices: Optional[List[int]]) -> CompilerOutput:
+    """Maps the output of compiling a deduplicated batch of circuits back to the original batch.
+
+    Args:
+        compiler_output: the CompilerOutput of the distinct circuits returned by
+            qss.serialization.deduplicate_circuits
+        indices: the indices returned by qss.serialization.deduplicate_circuits (or None if the
+            batch was not deduplicated)
+    Returns:
+        a CompilerOutput with the compiled circuit (and its pulse sequence, jaqal program and
+        pulse list, if any) of each circuit in the original batch
+    """
+    if indices is None or not compiler_output.has_multiple_circuits():
+        return compiler_output
+
+    return CompilerOutput(
+        circuits=qss.serialization.fan_out(compiler_output.circuits, indices),
+        pulse_sequences=_fan_out_optional(compiler_output.pulse_sequences, indices),
+        seq=compiler_output.seq,
+        jaqal_programs=_fan_out_optional(compiler_output.jaqal_programs, indices),
+        pulse_lists=_fan_out_optional(compiler_output.pulse_lists, indices),
+    )
+
+
+def _fan_out_optional(items: Optional[Sequence[Any]], indices: List[int]) -> Optional[List[Any]]:
+    return None if items is None else qss.serialization.fan_out(items, indices)
+
+
+def read_json_aqt(
+    json_dict: dict, circuits_is_list: bool, keep_payload: bool = False
+) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's AQT compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /aqt_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        keep_payload: whether the qss.serialization.LazyCircuitList of multiple circuits keeps
+            their serialization (in its `serialized_circuits` attribute) after all of them have
+            been deserialized
     Returns:
         a CompilerOutput object with the compiled circuit(s). If qtrl is available locally,
         the returned object also stores the pulse sequence in the .seq attribute and the
-        list(s) of cycles in the .pulse_list(s) attribute.
+        list(s) of cycles in the .pulse_list(s) attribute. These are only deserialized (and the
+        pulse sequence compiled) when first accessed.
     """
-    seq = None
-    pulse_lists = None
+    if circuits_is_list:
+        compiled_circuits = qss.serialization.LazyCircuitList(
+            json_dict["qiskit_circuits"], keep_payload=keep_payload
+        )
+        compiler_output = CompilerOutput(circuits=compiled_circuits)
+    else:
+        compiled_circuit = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])[0]
+        compiler_output = CompilerOutput(circuits=compiled_circuit)
 
     if importlib.util.find_spec(
         "qtrl"
     ):  # pragma: no cover, b/c qtrl is not open source so it is not in qiskit-superstaq reqs
         state_str = json_dict["state_jp"]
-        state = applications_superstaq.converters.deserialize(state_str)
+        pulse_lists_str = json_dict["pulse_lists_jp"]
+        compiler_output._set_lazy_attribute("seq", lambda: _read_qtrl_sequence(state_str))
 
-        seq = qtrl.sequencer.Sequence(n_elements=1)
-        seq.__setstate__(state)
-        seq.compile()
+        if circuits_is_list:
+            compiler_output._set_lazy_attribute(
+                "pulse_lists", lambda: qss.serialization.deserialize_object(pulse_lists_str)
+            )
+        else:
+            compiler_output._set_lazy_attribute(
+                "pulse_list", lambda: qss.serialization.deserialize_object(pulse_lists_str)[0]
+            )
 
-        pulse_lists_str = json_dict["pulse_lists_jp"]
-        pulse_lists = applications_superstaq.converters.deserialize(pulse_lists_str)
+    return compiler_output
 
-    compiled_circuits = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
-    if circuits_is_list:
-        return CompilerOutput(circuits=compiled_circuits, seq=seq, pulse_lists=pulse_lists)
 
-    pulse_list = pulse_lists[0] if pulse_lists is not None else None
-    return CompilerOutput(circuits=compiled_circuits[0], seq=seq, pulse_lists=pulse_list)
+def _read_qtrl_sequence(
+    state_str: str,
+) -> "qtrl.sequencer.Sequence":  # pragma: no cover, b/c qtrl is not in qiskit-superstaq reqs
+    """Rebuilds (and compiles) the qtrl Sequence serialized in the "state_jp" field of the JSON
+    returned by the AQT compilation endpoint."""
+    state = qss.serialization.deserialize_object(state_str)
+
+    seq = qtrl.sequencer.Sequence(n_elements=1)
+    seq.__setstate__(state)
+    seq.compile()
+    return seq
 
 
-def read_json_qscout(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
+def read_json_qscout(
+    json_dict: dict, circuits_is_list: bool, keep_payload: bool = False
+) -> CompilerOutput:
     """Reads out returned JSON from SuperstaQ API's QSCOUT compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /qscout_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        keep_payload: whether the qss.serialization.LazyCircuitList of multiple circuits keeps
+            their serialization (in its `serialized_circuits` attribute) after all of them have
+            been deserialized
     Returns:
         a CompilerOutput object with the compiled circuit(s) and a list of
         jaqal programs in a string representation.
     """
-    compiled_circuits = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
     if circuits_is_list:
+        compiled_circuits = qss.serialization.LazyCircuitList(
+            json_dict["qiskit_circuits"], keep_payload=keep_payload
+        )
         return CompilerOutput(
             circuits=compiled_circuits, jaqal_programs=json_dict["jaqal_programs"]
         )
 
-    return CompilerOutput(
-        circuits=compiled_circuits[0], jaqal_programs=json_dict["jaqal_programs"][0]
-    )
+    compiled_circuit = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])[0]
+    return CompilerOutput(circuits=compiled_circuit, jaqal_programs=json_dict["jaqal_programs"][0])
 
 
-def read_json_only_circuits(json_dict: dict, circuits_is_list: bool) -> CompilerOutput:
+def read_json_only_circuits(
+    json_dict: dict, circuits_is_list: bool, keep_payload: bool = False
+) -> CompilerOutput:
     """Reads JSON returned from SuperstaQ API's CQ compilation endpoint.
 
     Args:
         json_dict: a JSON dictionary matching the format returned by /cq_compile endpoint
         circuits_is_list: bool flag that controls whether the returned object has a .circuits
             attribute (if True) or a .circuit attribute (False)
+        keep_payload: whether the qss.serialization.LazyCircuitList of multiple circuits keeps
+            their serialization (in its `serialized_circuits` attribute) after all of them have
+            been deserialized
     Returns:
-        a CompilerOutput object with the compiled circuit(s)
+        a CompilerOutput object with the compiled circuit(s). Multiple circuits are returned as a
+        qss.serialization.LazyCircuitList, which only deserializes each circuit when accessed.
     """
-    compiled_circuits = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
     if circuits_is_list:
+        compiled_circuits = qss.serialization.LazyCircuitList(
+            json_dict["qiskit_circuits"], keep_payload=keep_payload
+        )
         return CompilerOutput(circuits=compiled_circuits)
 
-    return CompilerOutput(circuits=compiled_circuits[0])
+    compiled_circuit = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])[0]
+    return CompilerOutput(circuits=compiled_circuit)
@@ -1,6 +1,7 @@
 import importlib
 import pickle
 import textwrap
+from typing import Any
 from unittest import mock
 
 import applications_superstaq
@@ -58,6 +59,11 @@ def test_read_json() -> None:
     assert out.circuits == [circuit, circuit]
     assert not hasattr(out, "circuit")
 
+    out = qss.compiler_output.read_json_aqt(json_dict, circuits_is_list=True, keep_payload=True)
+    assert out.circuits == [circuit, circuit]
+    assert isinstance(out.circuits, qss.serialization.LazyCircuitList)
+    assert out.circuits.serialized_circuits == json_dict["qiskit_circuits"]
+
     json_dict = {"qiskit_circuits": qss.serialization.serialize_circuits(circuit)}
 
     out = qss.compiler_output.read_json_only_circuits(json_dict, circuits_is_list=False)
@@ -65,7 +71,19 @@ def test_read_json() -> None:
 
     json_dict = {"qiskit_circuits": qss.serialization.serialize_circuits([circuit, circuit])}
     out = qss.compiler_output.read_json_only_circuits(json_dict, circuits_is_list=True)
+    assert isinstance(out.circuits, qss.serialization.LazyCircuitList)
+    assert out.circuits.num_decoded() == 0
+    assert out.circuits == [circuit, circuit]
+    assert repr(out) == f"CompilerOutput({list(out.circuits)!r}, None, None, None)"
+    assert pickle.loads(pickle.dumps(out)) == out
+    assert out.circuits.serialized_circuits is None
+
+    out = qss.compiler_output.read_json_only_circuits(
+        json_dict, circuits_is_list=True, keep_payload=True
+    )
     assert out.circuits == [circuit, circuit]
+    assert isinstance(out.circuits, qss.serialization.LazyCircuitList)
+    assert out.circuits.serialized_circuits == json_dict["qiskit_circuits"]
 
 
 def test_read_json_with_qtrl() -> None:  # pragma: no cover, b/c test requires qtrl installation
@@ -108,6 +126,78 @@ def test_read_json_with_qtrl() -> None:  # pragma: no cover, b/c test requires q
     assert not hasattr(out, "circuit") and not hasattr(out, "pulse_list")
 
 
+def test_read_json_aqt_lazy_qtrl() -> None:
+    class MockSequence:
+        def __init__(self, n_elements: int) -> None:
+            self.state = None
+            self.compiled = False
+
+        def __setstate__(self, state: Any) -> None:
+            self.state = state
+
+        def compile(self) -> None:
+            self.compiled = True
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.h(0)
+    json_dict = {
+        "qiskit_circuits": qss.serialization.serialize_circuits([circuit, circuit]),
+        "state_jp": applications_superstaq.converters.serialize({"state": 1}),
+        "pulse_lists_jp": applications_superstaq.converters.serialize([[[1]], [[2]]]),
+    }
+
+    find_spec = importlib.util.find_spec
+    mock_qtrl = mock.MagicMock()
+    mock_qtrl.sequencer.Sequence.side_effect = MockSequence
+
+    with mock.patch(
+        "importlib.util.find_spec",
+        side_effect=lambda name, *args: name == "qtrl" or find_spec(name, *args),
+    ), mock.patch.object(qss.compiler_output, "qtrl", mock_qtrl, create=True):
+        out = qss.compiler_output.read_json_aqt(json_dict, circuits_is_list=True)
+        assert out.circuits == [circuit, circuit]
+        mock_qtrl.sequencer.Sequence.assert_not_called()
+
+        # the sequence is only built and compiled when accessed
+        seq = out.seq
+        assert isinstance(seq, MockSequence)
+        assert seq.state == {"state": 1} and seq.compiled
+        assert out.seq is seq
+        mock_qtrl.sequencer.Sequence.assert_called_once_with(n_elements=1)
+
+        assert out.pulse_lists == [[[1]], [[2]]]
+        assert not hasattr(out, "pulse_list")
+
+        json_dict["qiskit_circuits"] = qss.serialization.serialize_circuits(circuit)
+        out = qss.compiler_output.read_json_aqt(json_dict, circuits_is_list=False)
+        assert out.pulse_list == [[1]]
+        assert not hasattr(out, "pulse_lists")
+        assert isinstance(out.seq, MockSequence)
+
+
+def test_lazy_attributes() -> None:
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.h(0)
+    out = qss.compiler_output.CompilerOutput([circuit])
+
+    loader = mock.MagicMock(return_value="seq")
+    out._set_lazy_attribute("seq", loader)
+    assert "seq" not in out.__dict__
+    loader.assert_not_called()
+    assert out.seq == "seq"
+    assert out.seq == "seq"
+    loader.assert_called_once_with()
+
+    with pytest.raises(AttributeError, match="no attribute 'pulse_list'"):
+        _ = out.pulse_list
+
+    out._set_lazy_attribute("pulse_lists", lambda: [[1]])
+    assert "pulse_lists" not in out.__dict__
+    new_out = pickle.loads(pickle.dumps(out))
+    assert new_out.pulse_lists == [[1]]
+    assert new_out == out
+
+
 def test_read_json_with_qscout() -> None:
     circuit = qiskit.QuantumCircuit(1)
     circuit.h(0)
@@ -139,6 +229,13 @@ def test_read_json_with_qscout() -> None:
     out = qss.compiler_output.read_json_qscout(json_dict, circuits_is_list=True)
     assert out.circuits == [circuit, circuit]
     assert out.jaqal_programs == json_dict["jaqal_programs"]
+    assert isinstance(out.circuits, qss.serialization.LazyCircuitList)
+    assert out.circuits.serialized_circuits is None
+
+    out = qss.compiler_output.read_json_qscout(json_dict, circuits_is_list=True, keep_payload=True)
+    assert out.circuits == [circuit, circuit]
+    assert isinstance(out.circuits, qss.serialization.LazyCircuitList)
+    assert out.circuits.serialized_circuits == json_dict["qiskit_circuits"]
 
 
 def test_compiler_output_eq() -> None:
@@ -151,3 +248,24 @@ def test_compiler_output_eq() -> None:
     circuit1.h(0)
 
     assert qss.compiler_output.CompilerOutput([circuit, circuit1]) != co
+
+
+def test_fan_out() -> None:
+    circuit_0 = qiskit.QuantumCircuit(1)
+    circuit_0.h(0)
+    circuit_1 = qiskit.QuantumCircuit(1)
+    circuit_1.x(0)
+
+    co = qss.compiler_output.CompilerOutput([circuit_0, circuit_1], jaqal_programs=["a", "b"])
+    assert qss.compiler_output.fan_out(co, None) is co
+
+    fanned_out = qss.compiler_output.fan_out(co, [0, 1, 0])
+    assert fanned_out == qss.compiler_output.CompilerOutput(
+        [circuit_0, circuit_1, circuit_0], jaqal_programs=["a", "b", "a"]
+    )
+    assert fanned_out.circuits[0] is circuit_0
+    assert fanned_out.circuits[2] is not circuit_0
+    assert fanned_out.pulse_sequences is None and fanned_out.pulse_lists is None
+
+    co = qss.compiler_output.CompilerOutput(circuit_0)
+    assert qss.compiler_output.fan_out(co, [0]) is co
@@ -1,9 +1,65 @@
 import functools
-from typing import Callable, Dict, Optional, Tuple, Union
+from typing import Callable, Dict, Hashable, Optional, Tuple, Union
 
 import numpy as np
 import qiskit
 
+import qiskit_superstaq.caching
+
+# Memoized unitaries of custom gates (and the components of ParallelGates), keyed by gate type and
+# parameters. Cached matrices are read-only (users get copies), and bounded by their total number
+# of bytes.
+_matrix_cache = qiskit_superstaq.caching.LRUCache(64 * 2**20, sizeof=lambda mat: mat.nbytes)
+
+
+def _matrix_key(gate: qiskit.circuit.Gate) -> Optional[Hashable]:
+    """Returns a key identifying the unitary of a gate, or None if it can't be keyed.
+
+    Only gates defined in qiskit's circuit library or in this module are keyed, as the unitary of
+    these is fully determined by their type, name, size and (numeric) parameters.
+    """
+    if isinstance(gate, ParallelGates):
+        component_keys = tuple(_matrix_key(component) for component in gate.component_gates)
+        return None if None in component_keys else (ParallelGates, component_keys)
+
+    if not type(gate).__module__.startswith(("qiskit.circuit.library", __name__)):
+        return None
+
+    try:
+        params = tuple(float(param) for param in gate.params)
+    except (TypeError, ValueError):  # (e.g. unbound parameters or array-valued parameters)
+        return None
+
+    return type(gate), gate.name, gate.num_qubits, params, getattr(gate, "ctrl_state", None)
+
+
+def _shared_matrix(key: Optional[Hashable], build: Callable[[], np.ndarray]) -> np.ndarray:
+    """Returns the (read-only) matrix cached for `key`, building (and caching) it if needed.
+
+    The returned matrix is shared by all callers, so it must not be returned to users.
+    """
+    if key is None:
+        return np.asarray(build(), dtype=complex)
+
+    mat = _matrix_cache.get(key)
+    if mat is None:
+        mat = np.array(build(), dtype=complex)
+        mat.setflags(write=False)
+        _matrix_cache.put(key, mat)
+    return mat
+
+
+def _cached_matrix(
+    key: Optional[Hashable], build: Callable[[], np.ndarray], dtype: Optional[type] = None
+) -> np.ndarray:
+    """Returns a (writeable) copy of the matrix cached for `key`, with the requested `dtype`."""
+    return np.array(_shared_matrix(key, build), dtype=dtype)
+
+
+def _gate_matrix(gate: qiskit.circuit.Gate) -> np.ndarray:
+    """Returns the (possibly cached and read-only) unitary of a gate."""
+    return _shared_matrix(_matrix_key(gate), gate.to_matrix)
+
 
 class AceCR(qiskit.circuit.Gate):
     """Active Cancellation Echoed Cross Resonance gate, supporting polarity switches and sandwiches.
@@ -47,6 +103,9 @@ class AceCR(qiskit.circuit.Gate):
         self.definition = qc
 
     def __array__(self, dtype: Optional[type] = None) -> np.ndarray:
+        return _cached_matrix(_matrix_key(self), self._build_matrix, dtype)
+
+    def _build_matrix(self) -> np.ndarray:
         cval = 1 / np.sqrt(2)
         if self.polarity == "+-":
             sval = 1j * cval
@@ -59,14 +118,13 @@ class AceCR(qiskit.circuit.Gate):
                 [cval, 0, -sval, 0],
                 [0, sval, 0, cval],
                 [-sval, 0, cval, 0],
-            ],
-            dtype=dtype,
+            ]
         )
 
         # sandwiched rx gate commutes and can just be multiplied with non-sandwiched part:
         return mat @ np.kron(
-            np.asarray(qiskit.circuit.library.RXGate(self.sandwich_rx_rads), dtype=dtype),
-            np.eye(2, dtype=dtype),
+            np.asarray(qiskit.circuit.library.RXGate(self.sandwich_rx_rads), dtype=complex),
+            np.eye(2),
         )
 
     def __repr__(self) -> str:
@@ -126,14 +184,16 @@ class ZZSwapGate(qiskit.circuit.Gate):
         self.definition = qc
 
     def __array__(self, dtype: Optional[type] = None) -> np.ndarray:
+        return _cached_matrix(_matrix_key(self), self._build_matrix, dtype)
+
+    def _build_matrix(self) -> np.ndarray:
         return np.array(
             [
                 [1, 0, 0, 0],
                 [0, 0, np.exp(1j * self.params[0]), 0],
                 [0, np.exp(1j * self.params[0]), 0, 0],
                 [0, 0, 0, 1],
-            ],
-            dtype=dtype,
+            ]
         )
 
     def __repr__(self) -> str:
@@ -185,8 +245,39 @@ class ParallelGates(qiskit.circuit.Gate):
         self.definition = qc
 
     def __array__(self, dtype: Optional[type] = None) -> np.ndarray:
-        mat = functools.reduce(np.kron, (gate.to_matrix() for gate in self.component_gates[::-1]))
-        return np.asarray(mat, dtype=dtype)
+        return _cached_matrix(_matrix_key(self), self._build_matrix, dtype)
+
+    def _build_matrix(self) -> np.ndarray:
+        return functools.reduce(
+            np.kron, (_gate_matrix(gate) for gate in self.component_gates[::-1])
+        )
+
+    def apply_to(self, state: np.ndarray) -> np.ndarray:
+        """Applies this gate to a state vector (or to each column of a matrix).
+
+        The component gates are applied one at a time to their own qubits, which is equivalent to
+        (but much cheaper than) multiplying `state` by the dense unitary of this gate.
+
+        Args:
+            state: an array whose first dimension has size 2 ** self.num_qubits
+        Returns:
+            the array resulting from applying this gate to `state`
+        """
+        state = np.asarray(state)
+        if state.shape[:1] != (2**self.num_qubits,):
+            raise ValueError(
+                f"The first dimension of the state must have size {2 ** self.num_qubits}."
+            )
+
+        # (in qiskit's little-endian ordering, the first component acts on the last axis)
+        components = self.component_gates[::-1]
+        tensor = state.reshape(
+            [2**gate.num_qubits for gate in components] + list(state.shape[1:])
+        )
+        for axis, gate in enumerate(components):
+            tensor = np.tensordot(_gate_matrix(gate), tensor, axes=([1], [axis]))
+            tensor = np.moveaxis(tensor, 0, axis)
+        return tensor.reshape(state.shape)
 
     def __str__(self) -> str:
         args = ", ".join(gate.qasm() for gate in self.component_gates)
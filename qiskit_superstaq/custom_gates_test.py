@@ -122,6 +122,62 @@ def test_parallel_gates() -> None:
         _ = qss.ParallelGates(qiskit.circuit.Measure())
 
 
+def test_matrix_cache() -> None:
+    qss.custom_gates._matrix_cache.clear()
+
+    # matrices are built once, but every caller gets its own (writeable) copy
+    mat = np.asarray(qss.AceCR("+-", sandwich_rx_rads=0.5))
+    assert mat.flags.writeable
+    expected_mat = mat.copy()
+    mat[:] = 0
+    assert np.array_equal(np.asarray(qss.AceCR("+-", sandwich_rx_rads=0.5)), expected_mat)
+    assert np.array_equal(qss.AceCR("+-", sandwich_rx_rads=0.5).to_matrix(), expected_mat)
+    assert qss.AceCR("+-", sandwich_rx_rads=0.5).to_matrix().flags.writeable
+    assert not np.array_equal(np.asarray(qss.AceCR("-+", sandwich_rx_rads=0.5)), expected_mat)
+    mat = np.asarray(qss.AceCR("+-", sandwich_rx_rads=0.5), dtype=np.complex64)
+    assert mat.dtype == np.complex64 and mat.flags.writeable
+
+    theta = qiskit.circuit.Parameter("theta")
+    mat = np.asarray(qss.ZZSwapGate(0.25))
+    assert np.array_equal(np.asarray(qss.ZZSwapGate(0.25)), mat)
+    qc = qiskit.QuantumCircuit(2)
+    qc.append(qss.ZZSwapGate(theta), [0, 1])
+    assert np.array_equal(np.asarray(qc.assign_parameters({theta: 0.25}).data[0][0]), mat)
+
+    gate = qss.ParallelGates(qss.ZZSwapGate(0.25), qiskit.circuit.library.RXGate(0.5))
+    mat = np.asarray(gate)
+    assert np.array_equal(np.asarray(gate.inverse().inverse()), mat)
+    assert len(qss.custom_gates._matrix_cache) == 5
+
+    # gates whose unitaries aren't determined by their type and parameters are never cached
+    assert qss.custom_gates._matrix_key(qss.ZZSwapGate(theta)) is None
+    assert qss.custom_gates._matrix_key(qiskit.circuit.library.PauliGate("XY")) is None
+    unitary_gate = qiskit.extensions.UnitaryGate(np.diag([1, -1]))
+    assert qss.custom_gates._matrix_key(unitary_gate) is None
+    gate = qss.ParallelGates(unitary_gate, qiskit.circuit.library.XGate())
+    assert qss.custom_gates._matrix_key(gate) is None
+    assert np.allclose(gate.to_matrix(), np.kron([[0, 1], [1, 0]], np.diag([1, -1])))
+    assert len(qss.custom_gates._matrix_cache) == 6
+
+
+def test_parallel_gates_apply_to() -> None:
+    gate = qss.ParallelGates(
+        qss.AceCR("+-"),
+        qiskit.circuit.library.RXGate(1.23),
+        qiskit.circuit.library.CCXGate(),
+    )
+    mat = gate.to_matrix()
+
+    state = np.random.uniform(size=2**6) + 1j * np.random.uniform(size=2**6)
+    assert np.allclose(gate.apply_to(state), mat @ state)
+
+    states = np.random.uniform(size=(2**6, 3))
+    assert np.allclose(gate.apply_to(states), mat @ states)
+
+    with pytest.raises(ValueError, match="must have size 64"):
+        _ = gate.apply_to(np.ones(8))
+
+
 def test_ix_gate() -> None:
     gate = qss.custom_gates.iXGate()
     _check_gate_definition(gate)
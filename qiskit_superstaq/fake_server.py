@@ -0,0 +1,342 @@
+import collections
+import http.server
+import json
+import random
+import threading
+import time
+import urllib.parse
+import uuid
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+import applications_superstaq
+import qiskit
+
+import qiskit_superstaq as qss
+
+# Names of the backends listed by the fake server's /backends endpoint
+FAKE_BACKENDS = [
+    "aqt_keysight_qpu",
+    "aws_sv1_simulator",
+    "cq_hilbert_qpu",
+    "ibmq_qasm_simulator",
+    "neutral_atom_qpu",
+    "qscout_qpu",
+]
+
+
+class FakeSuperstaQServer:
+    """A local stand-in for the SuperstaQ API, for testing and benchmarking the client offline.
+
+    The server runs in a background thread of the current process, handling every request in its
+    own thread, and can be used by pointing a provider at it (this module is not imported by
+    `import qiskit_superstaq`, so that the http.server machinery is only loaded when needed):
+
+    .. code-block:: python
+
+        from qiskit_superstaq.fake_server import FakeSuperstaQServer
+
+        with FakeSuperstaQServer(latency=0.05, queue_time=1.0) as server:
+            provider = qss.SuperstaQProvider(api_key="MY_TOKEN", remote_host=server.url)
+            job = provider.get_backend("ibmq_qasm_simulator").run(circuit, shots=100)
+            counts = job.result().get_counts()
+
+    It implements job submission (/jobs) and polling (/job/{id} and /get_jobs), the compilation
+    endpoints (/aqt_compile, /ibmq_compile, /qscout_compile, /cq_compile and /neutral_atom_compile),
+    and the /backends, /balance, /get_aqt_configs and /aqt_configs endpoints. "Compilation" returns
+    the submitted circuits unchanged (bound to each row of their parameter values, if any), along
+    with placeholder pulse sequences, and jobs return random counts over the classical bits of
+    their circuits.
+    """
+
+    def __init__(
+        self,
+        host: str = "127.0.0.1",
+        port: int = 0,
+        latency: float = 0.0,
+        queue_time: float = 0.0,
+        run_time: float = 0.0,
+        error_rate: float = 0.0,
+        payload_size: int = 0,
+        num_outcomes: int = 1,
+        seed: Optional[int] = None,
+        clock: Callable[[], float] = time.monotonic,
+    ) -> None:
+        """
+        Args:
+            host: the address on which to listen
+            port: the port on which to listen (defaults to an available port)
+            latency: the number of seconds every request is delayed by before being answered
+            queue_time: the number of seconds each job stays queued after being submitted
+            run_time: the number of seconds each job then runs for
+            error_rate: the probability with which each request fails with a (retriable) 503
+                response instead of being handled
+            payload_size: the number of bytes in each placeholder pulse sequence, pulse list or
+                Jaqal program returned by the compilation endpoints
+            num_outcomes: the maximum number of distinct outcomes in the counts of each job
+            seed: optional seed for the random errors and counts
+            clock: the function returning the current time (in seconds) against which jobs are
+                queued and run, which tests can replace to control the progress of jobs
+        """
+        if not 0 <= error_rate < 1:
+            raise ValueError("error_rate must be at least 0 and less than 1.")
+
+        self.latency = latency
+        self.queue_time = queue_time
+        self.run_time = run_time
+        self.error_rate = error_rate
+        self.payload_size = payload_size
+        self.num_outcomes = num_outcomes
+        self.clock = clock
+        self.balance = 100.0
+        self.aqt_configs = {"pulses": "", "variables": ""}
+        self.request_counts: "collections.Counter[Tuple[str, str]]" = collections.Counter()
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._random = random.Random(seed)
+        self._lock = threading.Lock()
+
+        self._server = http.server.ThreadingHTTPServer((host, port), _RequestHandler)
+        self._server.daemon_threads = True
+        self._server.fake_server = self  # type: ignore
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def url(self) -> str:
+        """The URL of the server, to be passed as `remote_host` to a SuperstaQProvider."""
+        host, port = self._server.socket.getsockname()[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> None:
+        """Starts serving requests in a background thread."""
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+            self._thread.start()
+
+    def stop(self) -> None:
+        """Stops the server and closes its socket."""
+        if self._thread is not None:
+            self._server.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._server.server_close()
+
+    def __enter__(self) -> "FakeSuperstaQServer":
+        self.start()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.stop()
+
+    def handle(self, method: str, path: str, body: Any) -> Tuple[int, Dict[str, str], Any]:
+        """Handles a single request (after the simulated latency and errors).
+
+        Args:
+            method: the HTTP method of the request ("GET" or "POST")
+            path: the path of the request, without its API version prefix (e.g. "/jobs")
+            body: the decoded JSON body of the request (None for GET requests)
+        Returns:
+            the status code, extra headers and JSON body of the response
+        """
+        if method == "GET" and path.startswith("/job/"):
+            job_id = path.partition("/job/")[2]
+            if job_id not in self._jobs:
+                return 404, {}, {"message": "Job not found."}
+
+            job, ready_at = self._job_status(job_id)
+            if ready_at is None:
+                return 200, {}, job
+            retry_after = max(ready_at - self.clock(), 0.0)
+            return 200, {"Retry-After": f"{retry_after:.3f}"}, job
+
+        if method == "POST" and path == "/get_jobs":
+            if any(job_id not in self._jobs for job_id in body["job_ids"]):
+                return 404, {}, {"message": "Job not found."}
+            return 200, {}, {job_id: self._job_status(job_id)[0] for job_id in body["job_ids"]}
+
+        routes: Dict[Tuple[str, str], Callable[[Any], Dict[str, Any]]] = {
+            ("POST", "/jobs"): self._create_jobs,
+            ("POST", "/aqt_compile"): self._aqt_compile,
+            ("POST", "/ibmq_compile"): self._ibmq_compile,
+            ("POST", "/qscout_compile"): self._qscout_compile,
+            ("POST", "/cq_compile"): self._cq_compile,
+            ("POST", "/neutral_atom_compile"): self._neutral_atom_compile,
+            ("POST", "/aqt_configs"): self._upload_aqt_configs,
+            ("GET", "/backends"): lambda _: {
+                "superstaq_backends": {"compile-and-run": FAKE_BACKENDS}
+            },
+            ("GET", "/balance"): lambda _: {"balance": self.balance},
+            ("GET", "/get_aqt_configs"): lambda _: self.aqt_configs,
+        }
+        if (method, path) not in routes:
+            return 404, {}, {"message": f"Unknown endpoint: {method} {path}"}
+
+        return 200, {}, routes[method, path](body)
+
+    def _random_error(self) -> bool:
+        with self._lock:
+            return self._random.random() < self.error_rate
+
+    def _circuits(self, body: Dict[str, Any]) -> List[qiskit.QuantumCircuit]:
+        """Returns the circuits submitted in a request, bound to each row of their parameter
+        values (if any)."""
+        circuits = qss.serialization.deserialize_circuits(body["qiskit_circuits"])
+        if "parameter_values" not in body:
+            return circuits
+
+        (circuit,) = circuits
+        parameters = {parameter.name: parameter for parameter in circuit.parameters}
+        values = qss.serialization.deserialize_parameter_values(body["parameter_values"])
+        return [
+            circuit.bind_parameters(
+                {parameters[name]: value for name, value in zip(body["parameters"], row)}
+            )
+            for row in values.tolist()
+        ]
+
+    def _create_jobs(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        circuits = self._circuits(body)
+        submitted_at = self.clock()
+
+        job_ids = []
+        with self._lock:
+            for circuit in circuits:
+                job_id = str(uuid.UUID(int=self._random.getrandbits(128)))
+                self._jobs[job_id] = {
+                    "backend": body["backend"],
+                    "shots": int(body["shots"]),
+                    "num_clbits": circuit.num_clbits,
+                    "running_at": submitted_at + self.queue_time,
+                    "done_at": submitted_at + self.queue_time + self.run_time,
+                }
+                job_ids.append(job_id)
+
+        return {"job_ids": job_ids, "status": "ready"}
+
+    def _job_status(self, job_id: str) -> Tuple[Dict[str, Any], Optional[float]]:
+        """Returns the JSON data of a job (with its counts if it is done), and the time at which
+        its status will next change (if it isn't done)."""
+        with self._lock:
+            job = self._jobs[job_id]
+            now = self.clock()
+            if now < job["running_at"]:
+                return {"status": "Queued", "target": job["backend"]}, job["running_at"]
+            if now < job["done_at"]:
+                return {"status": "Running", "target": job["backend"]}, job["done_at"]
+
+            if "samples" not in job:
+                job["samples"] = self._random_counts(job["num_clbits"], job["shots"])
+            job_data = {
+                "status": "Done",
+                "target": job["backend"],
+                "shots": job["shots"],
+                "samples": job["samples"],
+            }
+            return job_data, None
+
+    def _random_counts(self, num_bits: int, shots: int) -> Dict[str, int]:
+        """Spreads the shots of a job over up to `num_outcomes` random bitstrings (must be called
+        with the lock held)."""
+        num_outcomes = max(min(self.num_outcomes, 2**num_bits, shots), 1)
+        outcomes: Dict[int, int] = {}
+        while len(outcomes) < num_outcomes:
+            outcomes[self._random.getrandbits(num_bits) if num_bits else 0] = shots // num_outcomes
+        first_outcome = next(iter(outcomes))
+        outcomes[first_outcome] += shots - sum(outcomes.values())
+
+        return {
+            (format(outcome, f"0{num_bits}b") if num_bits else ""): count
+            for outcome, count in outcomes.items()
+        }
+
+    def _padding(self) -> bytes:
+        return b"\0" * self.payload_size
+
+    def _aqt_compile(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        circuits = self._circuits(body) * int(body.get("num_eca_circuits", 1))
+        return {
+            "qiskit_circuits": qss.serialization.serialize_circuits(circuits),
+            "state_jp": applications_superstaq.converters.serialize({}),
+            "pulse_lists_jp": applications_superstaq.converters.serialize(
+                [[[self._padding()]] for _ in circuits]
+            ),
+        }
+
+    def _ibmq_compile(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        circuits = self._circuits(body)
+        return {
+            "qiskit_circuits": qss.serialization.serialize_circuits(circuits),
+            "pulses": applications_superstaq.converters.serialize(
+                [self._padding() for _ in circuits]
+            ),
+        }
+
+    def _qscout_compile(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        circuits = self._circuits(body)
+        return {
+            "qiskit_circuits": qss.serialization.serialize_circuits(circuits),
+            "jaqal_programs": ["x" * self.payload_size for _ in circuits],
+        }
+
+    def _cq_compile(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        circuits = self._circuits(body)
+        return {"qiskit_circuits": qss.serialization.serialize_circuits(circuits)}
+
+    def _neutral_atom_compile(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        circuits = self._circuits(body)
+        return {
+            "pulses": applications_superstaq.converters.serialize(
+                [self._padding() for _ in circuits]
+            )
+        }
+
+    def _upload_aqt_configs(self, body: Dict[str, Any]) -> Dict[str, Any]:
+        with self._lock:
+            self.aqt_configs = {"pulses": body["pulses"], "variables": body["variables"]}
+        return {"status": "Your AQT configuration has been updated"}
+
+
+class _RequestHandler(http.server.BaseHTTPRequestHandler):
+    """Forwards the HTTP requests received by a FakeSuperstaQServer to its `handle` method."""
+
+    protocol_version = "HTTP/1.1"
+
+    def do_GET(self) -> None:
+        self._respond("GET")
+
+    def do_POST(self) -> None:
+        self._respond("POST")
+
+    def _respond(self, method: str) -> None:
+        fake_server: FakeSuperstaQServer = self.server.fake_server  # type: ignore
+        content_length = int(self.headers.get("Content-Length") or 0)
+        data = self.rfile.read(content_length) if content_length else b""
+
+        # strip the API version (e.g. "/v0.1.0/jobs" -> "/jobs")
+        path = urllib.parse.urlparse(self.path).path
+        path = "/" + path.lstrip("/").partition("/")[2]
+        endpoint = "/job/{job_id}" if path.startswith("/job/") else path
+        with fake_server._lock:
+            fake_server.request_counts[method, endpoint] += 1
+
+        time.sleep(fake_server.latency)
+        headers: Dict[str, str]
+        if fake_server._random_error():
+            status, headers, body = 503, {}, {"message": "Service unavailable (simulated)."}
+        else:
+            try:
+                status, headers, body = fake_server.handle(
+                    method, path, json.loads(data) if data else None
+                )
+            except Exception as e:
+                status, headers, body = 400, {}, {"message": f"{type(e).__name__}: {e}"}
+
+        payload = json.dumps(body).encode()
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def log_message(self, format: str, *args: Any) -> None:
+        pass  # don't log every request to stderr
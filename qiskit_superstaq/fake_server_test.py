@@ -0,0 +1,105 @@
+import pathlib
+
+import pytest
+import qiskit
+import requests
+
+import qiskit_superstaq as qss
+import qiskit_superstaq.fake_server
+
+
+def test_fake_server(tmp_path: pathlib.Path) -> None:
+    qc = qiskit.QuantumCircuit(2, 2)
+    qc.h(0)
+    qc.cx(0, 1)
+    qc.measure([0, 1], [0, 1])
+
+    with qiskit_superstaq.fake_server.FakeSuperstaQServer(
+        num_outcomes=2, payload_size=4, seed=0
+    ) as server:
+        provider = qss.SuperstaQProvider(api_key="MY_TOKEN", remote_host=server.url)
+        assert [
+            backend.name() for backend in provider.backends()
+        ] == qiskit_superstaq.fake_server.FAKE_BACKENDS
+        assert provider.get_balance() == "$100.00"
+
+        job = provider.get_backend("ibmq_qasm_simulator").run([qc, qc], shots=100)
+        for counts in job.result().get_counts():
+            assert len(counts) == 2
+            assert sum(counts.values()) == 100
+        assert server.request_counts["POST", "/jobs"] == 1
+
+        assert provider.cq_compile(qc).circuit == qc
+        assert provider.aqt_compile([qc]).circuits == [qc]
+        assert provider.qscout_compile(qc).jaqal_program == "xxxx"
+        assert provider.ibmq_compile([qc, qc]).pulse_sequences == [b"\0" * 4, b"\0" * 4]
+        assert provider.neutral_atom_compile(qc) == b"\0" * 4
+        assert len(provider.aqt_compile_eca(qc, num_equivalent_circuits=3).circuits) == 3
+
+        theta = qiskit.circuit.Parameter("theta")
+        parameterized_qc = qiskit.QuantumCircuit(1)
+        parameterized_qc.rx(theta, 0)
+        out = provider.aqt_compile(parameterized_qc, parameter_values=[[0.1], [0.2]])
+        assert out.circuits == [
+            parameterized_qc.bind_parameters({theta: 0.1}),
+            parameterized_qc.bind_parameters({theta: 0.2}),
+        ]
+
+        server.aqt_configs = {"pulses": "abc", "variables": "xyz"}
+        assert provider.aqt_get_configs() == {"pulses": "abc", "variables": "xyz"}
+        pulses_file = tmp_path / "Pulses.yaml"
+        variables_file = tmp_path / "Variables.yaml"
+        pulses_file.write_text("def")
+        variables_file.write_text("uvw")
+        _ = provider.aqt_upload_configs(str(pulses_file), str(variables_file))
+        assert server.aqt_configs == {"pulses": "def", "variables": "uvw"}
+        assert provider.aqt_get_configs() == {"pulses": "def", "variables": "uvw"}
+
+        url = f"{server.url}/{qss.API_VERSION}"
+        assert requests.get(f"{url}/job/unknown").status_code == 404
+        assert requests.post(f"{url}/get_jobs", json={"job_ids": ["unknown"]}).status_code == 404
+        assert requests.get(f"{url}/unknown").status_code == 404
+        response = requests.post(f"{url}/jobs", json={})
+        assert response.status_code == 400
+        assert "KeyError" in response.json()["message"]
+        assert server.request_counts["GET", "/job/{job_id}"] >= 1
+
+
+def test_fake_server_queue_and_errors() -> None:
+    qc = qiskit.QuantumCircuit(1, 1)
+    qc.measure(0, 0)
+
+    # jobs progress against the server's clock
+    now = 0.0
+    with qiskit_superstaq.fake_server.FakeSuperstaQServer(
+        queue_time=0.5, run_time=0.2, clock=lambda: now
+    ) as server:
+        provider = qss.SuperstaQProvider(api_key="MY_TOKEN", remote_host=server.url)
+        job = provider.get_backend("ibmq_qasm_simulator").run(qc, shots=10)
+        assert job.status() == qiskit.providers.jobstatus.JobStatus.QUEUED
+
+        url = f"{server.url}/{qss.API_VERSION}/job/{job.job_id()}"
+        response = requests.get(url)
+        assert response.json() == {"status": "Queued", "target": "ibmq_qasm_simulator"}
+        assert response.headers["Retry-After"] == "0.500"
+
+        now = 0.6
+        response = requests.get(url)
+        assert response.json() == {"status": "Running", "target": "ibmq_qasm_simulator"}
+        assert response.headers["Retry-After"] == "0.100"
+        assert job.status() == qiskit.providers.jobstatus.JobStatus.RUNNING
+
+        now = 0.7
+        assert "Retry-After" not in requests.get(url).headers
+        assert job.result().get_counts() in ({"0": 10}, {"1": 10})
+        assert job.status() == qiskit.providers.jobstatus.JobStatus.DONE
+
+    # failed requests are retried by the client
+    with qiskit_superstaq.fake_server.FakeSuperstaQServer(error_rate=0.5, seed=1) as server:
+        provider = qss.SuperstaQProvider(api_key="MY_TOKEN", remote_host=server.url)
+        for _ in range(4):
+            assert provider.get_balance(pretty_output=False) == 100.0
+        assert server.request_counts["GET", "/balance"] > 4
+
+    with pytest.raises(ValueError, match="error_rate"):
+        _ = qiskit_superstaq.fake_server.FakeSuperstaQServer(error_rate=1)
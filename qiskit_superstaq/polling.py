@@ -0,0 +1,151 @@
+import datetime
+import email.utils
+import random
+from typing import Optional
+
+
+class PollingStrategy:
+    """Base class for strategies deciding how long to wait between consecutive polls of a job.
+
+    Subclasses implement `wait_time`, which is called once per round of polling and may take into
+    account the hints sent by the server (if any) in its last responses.
+    """
+
+    def wait_time(
+        self,
+        num_polls: int,
+        retry_after: Optional[float] = None,
+        queue_position: Optional[int] = None,
+    ) -> float:
+        """Returns the number of seconds to wait before the next round of polling.
+
+        Args:
+            num_polls: the number of rounds of polling already performed (starting from 1)
+            retry_after: the longest delay (in seconds) requested by the server through the
+                `Retry-After` headers of its last responses, if any
+            queue_position: the smallest queue position reported by the server for the jobs
+                which are still pending, if any
+        Returns:
+            the delay in seconds
+        """
+        raise NotImplementedError
+
+
+class FixedInterval(PollingStrategy):
+    """Polls at a fixed interval, ignoring server hints."""
+
+    def __init__(self, wait: float = 5) -> None:
+        """
+        Args:
+            wait: the number of seconds to wait between polls
+        """
+        self.wait = wait
+
+    def wait_time(
+        self,
+        num_polls: int,
+        retry_after: Optional[float] = None,
+        queue_position: Optional[int] = None,
+    ) -> float:
+        return self.wait
+
+    def __repr__(self) -> str:
+        return f"qss.polling.FixedInterval({self.wait!r})"
+
+
+class ExponentialBackoff(PollingStrategy):
+    """Polls quickly at first, then backs off exponentially (with jitter) up to a maximum interval.
+
+    Short jobs (e.g. on simulators) are therefore picked up almost immediately, while long jobs
+    (e.g. queued on hardware) are polled rarely. Server hints are honored: the delay is never
+    shorter than a `Retry-After` header, and grows with the reported queue position.
+    """
+
+    def __init__(
+        self,
+        initial_wait: float = 0.1,
+        factor: float = 2.0,
+        max_wait: float = 30.0,
+        jitter: float = 0.1,
+        wait_per_queue_position: float = 1.0,
+        seed: Optional[int] = None,
+    ) -> None:
+        """
+        Args:
+            initial_wait: the delay (in seconds) after the first round of polling
+            factor: the factor by which the delay increases after every round of polling
+            max_wait: the maximum delay (in seconds) between two rounds of polling, unless the
+                server requests a longer one through a `Retry-After` header
+            jitter: the relative amount of random variation applied to every delay, to avoid many
+                clients polling in lockstep
+            wait_per_queue_position: the delay (in seconds) per job ahead in the queue
+            seed: optional seed for the random number generator used for jitter
+        """
+        if initial_wait < 0 or factor < 1 or max_wait < initial_wait or not 0 <= jitter < 1:
+            raise ValueError(
+                "ExponentialBackoff requires 0 <= initial_wait <= max_wait, factor >= 1 and "
+                "0 <= jitter < 1"
+            )
+
+        self.initial_wait = initial_wait
+        self.factor = factor
+        self.max_wait = max_wait
+        self.jitter = jitter
+        self.wait_per_queue_position = wait_per_queue_position
+        self._rng = random.Random(seed)
+
+    def wait_time(
+        self,
+        num_polls: int,
+        retry_after: Optional[float] = None,
+        queue_position: Optional[int] = None,
+    ) -> float:
+        # (the exponent is capped to avoid overflows, by which point max_wait has been reached)
+        exponent = min(max(num_polls - 1, 0), 64)
+        wait = min(self.initial_wait * self.factor**exponent, self.max_wait)
+
+        if queue_position:
+            wait = max(wait, min(queue_position * self.wait_per_queue_position, self.max_wait))
+
+        wait *= 1 + self.jitter * self._rng.uniform(-1, 1)
+        wait = min(wait, self.max_wait)
+
+        if retry_after is not None:
+            wait = max(wait, retry_after)
+
+        return wait
+
+    def __repr__(self) -> str:
+        return (
+            f"qss.polling.ExponentialBackoff(initial_wait={self.initial_wait!r}, "
+            f"factor={self.factor!r}, max_wait={self.max_wait!r}, jitter={self.jitter!r}, "
+            f"wait_per_queue_position={self.wait_per_queue_position!r})"
+        )
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Parses the value of a `Retry-After` HTTP header.
+
+    Args:
+        value: the header value, either a number of seconds or an HTTP date (or None)
+    Returns:
+        the requested delay in seconds, or None if the value is missing or invalid
+    """
+    if not value:
+        return None
+
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+
+    try:
+        retry_date = email.utils.parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+
+    if retry_date.tzinfo is None:
+        retry_date = retry_date.replace(tzinfo=datetime.timezone.utc)
+
+    now = datetime.datetime.now(datetime.timezone.utc)
+    return max((retry_date - now).total_seconds(), 0.0)
@@ -0,0 +1,65 @@
+import datetime
+import email.utils
+
+import pytest
+
+import qiskit_superstaq as qss
+
+
+def test_fixed_interval() -> None:
+    strategy = qss.polling.FixedInterval(2.5)
+    assert strategy.wait_time(1) == 2.5
+    assert strategy.wait_time(100, retry_after=10, queue_position=4) == 2.5
+    assert repr(strategy) == "qss.polling.FixedInterval(2.5)"
+
+    with pytest.raises(NotImplementedError):
+        qss.polling.PollingStrategy().wait_time(1)
+
+
+def test_exponential_backoff() -> None:
+    strategy = qss.polling.ExponentialBackoff(initial_wait=0.5, factor=2, max_wait=3, jitter=0)
+    assert [strategy.wait_time(n) for n in range(1, 6)] == [0.5, 1, 2, 3, 3]
+    assert strategy.wait_time(10**6) == 3
+
+    # server hints
+    assert strategy.wait_time(1, retry_after=10) == 10
+    assert strategy.wait_time(1, retry_after=0.1) == 0.5
+    assert strategy.wait_time(1, queue_position=2) == 2
+    assert strategy.wait_time(1, queue_position=100) == 3
+
+    assert repr(strategy) == (
+        "qss.polling.ExponentialBackoff(initial_wait=0.5, factor=2, max_wait=3, jitter=0, "
+        "wait_per_queue_position=1.0)"
+    )
+
+
+def test_exponential_backoff_jitter() -> None:
+    strategy = qss.polling.ExponentialBackoff(initial_wait=1, max_wait=100, jitter=0.5, seed=0)
+    wait_times = [strategy.wait_time(1) for _ in range(100)]
+    assert all(0.5 <= wait_time <= 1.5 for wait_time in wait_times)
+    assert len(set(wait_times)) > 1
+
+    # jitter never exceeds the maximum wait time
+    strategy = qss.polling.ExponentialBackoff(initial_wait=1, max_wait=1, jitter=0.5, seed=0)
+    assert all(strategy.wait_time(1) <= 1 for _ in range(100))
+
+    with pytest.raises(ValueError, match="ExponentialBackoff requires"):
+        qss.polling.ExponentialBackoff(jitter=1)
+
+    with pytest.raises(ValueError, match="ExponentialBackoff requires"):
+        qss.polling.ExponentialBackoff(initial_wait=2, max_wait=1)
+
+
+def test_parse_retry_after() -> None:
+    assert qss.polling.parse_retry_after(None) is None
+    assert qss.polling.parse_retry_after("") is None
+    assert qss.polling.parse_retry_after("120") == 120
+    assert qss.polling.parse_retry_after("-1") == 0
+    assert qss.polling.parse_retry_after("not a date") is None
+
+    future = datetime.datetime.now(datetime.timezone.utc) + datetime.timedelta(seconds=100)
+    retry_after = qss.polling.parse_retry_after(email.utils.format_datetime(future))
+    assert retry_after is not None and 90 < retry_after <= 100
+
+    past = datetime.datetime(2000, 1, 1)
+    assert qss.polling.parse_retry_after(email.utils.format_datetime(past)) == 0
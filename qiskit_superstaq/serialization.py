@@ -1,14 +1,70 @@
+import collections.abc
+import concurrent.futures
+import copy
+import hashlib
+import importlib
 import io
+import pickle
+import re
+import struct
+import threading
 import warnings
-from typing import Dict, List, Set, Tuple, Union
+import zlib
+from typing import (
+    Any,
+    Dict,
+    Hashable,
+    Iterator,
+    List,
+    Optional,
+    overload,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 
 import applications_superstaq
+import numpy as np
 import qiskit
+import qiskit.circuit.parametertable
 import qiskit.qpy
+import qiskit.qpy.binary_io
+import qiskit.qpy.common
 from qiskit.converters.ast_to_dag import AstInterpreter
 
 import qiskit_superstaq as qss
 
+try:
+    import zstandard
+except ModuleNotFoundError:  # pragma: no cover, b/c zstandard is in dev-requirements.txt
+    pass
+
+# Compression codecs which can be applied to serialized payloads, the HTTP header through which the
+# client asks the server to compress its responses with one of them, and the HTTP header through
+# which the server advertises (as a comma-separated list) the codecs it accepts in requests
+SUPPORTED_COMPRESSIONS = ("zlib", "zstd")
+COMPRESSION_HEADER = "X-SuperstaQ-Compression"
+ACCEPT_COMPRESSION_HEADER = "X-SuperstaQ-Accept-Compression"
+
+# Compressed payloads start with this marker, followed by the name of their codec and a newline
+# (uncompressed QPY files, pickles and .npy files can't start with it)
+_COMPRESSION_MARKER = b"QSS-COMPRESSED:"
+
+# Minimum number of circuits for which `serialize_circuits` uses worker processes (if requested)
+PARALLEL_SERIALIZATION_THRESHOLD = 64
+
+# Placeholder for the objects of a LazyObjectList which haven't been deserialized yet
+_UNDECODED = object()
+
+# Instructions whose QPY encoding is fully determined by their type and parameters
+_DIRECTIVE_TYPES = (
+    qiskit.circuit.Barrier,
+    qiskit.circuit.Delay,
+    qiskit.circuit.Measure,
+    qiskit.circuit.Reset,
+)
+
 
 def _assign_unique_inst_names(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumCircuit:
     """QPY requires unique custom gates to have unique `.name` attributes (including parameterized
@@ -17,65 +73,536 @@ def _assign_unique_inst_names(circuit: qiskit.QuantumCircuit) -> qiskit.QuantumC
     name of any custom instruction which shares a name with a non-equivalent prior instruction in
     the circuit.
 
+    The input circuit is never mutated: if no instruction needs to be renamed it is returned as-is,
+    and otherwise a shallow copy is returned in which only the renamed instructions are cloned.
+
     Args:
         circuit: qiskit.QuantumCircuit to be rewritten
 
     Returns:
-        A copy of the input circuit with unique custom instruction names
+        The input circuit or a copy of it, with unique custom instruction names
     """
 
-    unique_insts_by_name: Dict[str, List[qiskit.circuit.Instruction]] = {}
-    insts_to_update: List[Tuple[int, int]] = []
+    num_unique_insts_by_name: Dict[str, int] = {}
+    unique_insts_by_key: Dict[Hashable, List[Tuple[qiskit.circuit.Instruction, int]]] = {}
+    new_names: Dict[int, str] = {}
     unique_inst_ids: Set[int] = set()
 
     qiskit_gates = set(AstInterpreter.standard_extension) | {"measure"}
 
-    new_circuit = circuit.copy()
-    for inst, _, _ in new_circuit:
+    for inst, _, _ in circuit:
         if inst.name in qiskit_gates or id(inst) in unique_inst_ids:
             continue
 
         # save id() in case instruction instance is used more than once
         unique_inst_ids.add(id(inst))
 
-        if inst.name in unique_insts_by_name:
-            index = 0
-            for other in unique_insts_by_name[inst.name]:
-                # compare qasm strings first because equality checking is very slow
-                if inst.qasm() == other.qasm() and inst == other:
-                    break
-                index += 1
-
-            if index == len(unique_insts_by_name[inst.name]):
-                unique_insts_by_name[inst.name].append(inst)
-            if index > 0:
-                insts_to_update.append((inst, index))
+        # instructions can only be equal if they have the same type, name, size and parameters, so
+        # (because equality checking is very slow) only those are compared. Parameters which can't
+        # be hashed are left out of the key. qasm() isn't used as it can mutate the instruction
+        params = tuple(_param_key(param) for param in inst.params)
+        key = (
+            type(inst),
+            inst.name,
+            inst.num_qubits,
+            inst.num_clbits,
+            None if None in params else params,
+        )
+        candidates = unique_insts_by_key.setdefault(key, [])
+        equal_index = next(
+            (other_index for other, other_index in candidates if inst == other), None
+        )
+
+        if equal_index is not None:
+            index = equal_index
         else:
-            unique_insts_by_name[inst.name] = [inst]
+            index = num_unique_insts_by_name.get(inst.name, 0)
+            num_unique_insts_by_name[inst.name] = index + 1
+            candidates.append((inst, index))
+        if index > 0:
+            new_names[id(inst)] = f"{inst.name}_{index}"
+
+    if not new_names:
+        return circuit
+
+    return _rename_instructions(circuit, new_names)
+
+
+def _rename_instructions(
+    circuit: qiskit.QuantumCircuit, new_names: Dict[int, str]
+) -> qiskit.QuantumCircuit:
+    """Returns a shallow copy of `circuit` in which every instruction whose id() is in `new_names`
+    is replaced by a renamed clone (all other instructions are shared with the input circuit).
+    """
+    renamed_insts: Dict[int, qiskit.circuit.Instruction] = {}
+    for inst, _, _ in circuit:
+        if id(inst) in new_names and id(inst) not in renamed_insts:
+            renamed_insts[id(inst)] = inst.copy(name=new_names[id(inst)])
 
-    for inst, index in insts_to_update:
-        inst.name += f"_{index}"
+    def _get_inst(inst: qiskit.circuit.Instruction) -> qiskit.circuit.Instruction:
+        return renamed_insts.get(id(inst), inst)
 
+    new_circuit = copy.copy(circuit)
+    new_circuit._data = [(_get_inst(inst), qargs, cargs) for inst, qargs, cargs in circuit._data]
+    new_circuit._parameter_table = qiskit.circuit.parametertable.ParameterTable(
+        {
+            param: [(_get_inst(inst), index) for inst, index in circuit._parameter_table[param]]
+            for param in circuit._parameter_table
+        }
+    )
     return new_circuit
 
 
-def serialize_circuits(circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]) -> str:
+def _is_standard_instruction(inst: qiskit.circuit.Instruction) -> bool:
+    """Whether `inst` is a qiskit directive or standard gate (which is therefore neither custom
+    nor resolvable into a custom gate)."""
+    return isinstance(inst, _DIRECTIVE_TYPES) or type(inst).__module__.startswith(
+        "qiskit.circuit.library.standard_gates"
+    )
+
+
+def _param_key(param: Any) -> Optional[Hashable]:
+    if isinstance(param, np.ndarray):
+        return ("ndarray", param.shape, param.dtype.str, param.tobytes())
+
+    try:
+        hash(param)
+    except TypeError:
+        return None
+
+    # the type is included because e.g. 1 == 1.0 == True but they are encoded differently
+    return (type(param), param)
+
+
+def _instruction_key(
+    inst: qiskit.circuit.Instruction, memo: Dict[int, Optional[Hashable]]
+) -> Optional[Hashable]:
+    """Computes a hashable key identifying an instruction (regardless of its condition, which
+    depends on the circuit the instruction is in, see `_condition_key`)."""
+    if id(inst) in memo:
+        return memo[id(inst)]
+
+    params = tuple(_param_key(param) for param in inst.params)
+
+    key: Optional[Hashable] = None
+    if None not in params:
+        key = (
+            type(inst),
+            inst.name,
+            inst.num_qubits,
+            inst.num_clbits,
+            params,
+            inst.label,
+            getattr(inst, "ctrl_state", None),
+        )
+
+        # the encoding of other instructions also depends on their definition
+        if not _is_standard_instruction(inst) and inst.definition is not None:
+            definition_key = _circuit_key(inst.definition, memo)
+            key = None if definition_key is None else (key, definition_key)
+
+    memo[id(inst)] = key
+    return key
+
+
+def _condition_key(
+    inst: qiskit.circuit.Instruction, clbit_indices: Dict[qiskit.circuit.Clbit, int]
+) -> Optional[Hashable]:
+    if not inst.condition:
+        return None
+
+    register, value = inst.condition
+    if isinstance(register, qiskit.circuit.Clbit):
+        return ("clbit", clbit_indices.get(register), value)
+    return ("creg", register.name, register.size, value)
+
+
+def _has_default_name(circuit: qiskit.QuantumCircuit) -> bool:
+    """Whether the name of a circuit was generated by qiskit (e.g. "circuit-12")."""
+    return re.fullmatch(rf"{re.escape(circuit.cls_prefix())}-\d+(-\d+)?", circuit.name) is not None
+
+
+def _circuit_key(
+    circuit: qiskit.QuantumCircuit, memo: Optional[Dict[int, Optional[Hashable]]] = None
+) -> Optional[Hashable]:
+    """Computes a hashable key identifying the structure of a circuit, such that any two circuits
+    with the same key have the same serialization, up to their names if these were generated by
+    qiskit (which are unique to each circuit instance, and so are left out of the key). The names
+    of registers are part of the key, so registers should be named explicitly rather than be given
+    generated names (as is already the case for `QuantumCircuit(num_qubits, num_clbits)`).
+
+    Args:
+        circuit: the qiskit.QuantumCircuit to compute a key for
+        memo: optional dictionary of previously computed instruction keys (indexed by id()). It
+            can be shared between circuits, as these keys don't depend on the circuit.
+
+    Returns:
+        the key, or None if the circuit contains data which cannot be hashed (in which case the
+        circuit should not be cached)
+    """
+    if circuit.calibrations:
+        return None
+
+    memo = {} if memo is None else memo
+    qubit_indices = {bit: index for index, bit in enumerate(circuit.qubits)}
+    clbit_indices = {bit: index for index, bit in enumerate(circuit.clbits)}
+
+    registers = tuple(
+        (type(reg).__name__, reg.name, tuple(qubit_indices.get(bit) for bit in reg))
+        for reg in circuit.qregs
+    ) + tuple(
+        (type(reg).__name__, reg.name, tuple(clbit_indices.get(bit) for bit in reg))
+        for reg in circuit.cregs
+    )
+
+    instructions = []
+    for inst, qargs, cargs in circuit._data:
+        inst_key = _instruction_key(inst, memo)
+        if inst_key is None:
+            return None
+        instructions.append(
+            (
+                inst_key,
+                _condition_key(inst, clbit_indices),
+                tuple(qubit_indices[qubit] for qubit in qargs),
+                tuple(clbit_indices[clbit] for clbit in cargs),
+            )
+        )
+
+    return (
+        None if _has_default_name(circuit) else circuit.name,
+        _param_key(circuit.global_phase),
+        repr(circuit.metadata),
+        circuit.num_qubits,
+        circuit.num_clbits,
+        registers,
+        tuple(instructions),
+    )
+
+
+def deduplicate_circuits(
+    circuits: Sequence[qiskit.QuantumCircuit],
+) -> Tuple[List[qiskit.QuantumCircuit], List[int]]:
+    """Finds the distinct circuits in a batch.
+
+    Circuits are considered identical if they have the same structure (and would therefore be
+    serialized identically, up to names generated by qiskit, which are ignored). Circuits which
+    cannot be keyed (e.g. because they have calibrations) are always considered distinct.
+
+    Args:
+        circuits: the qiskit.QuantumCircuits to deduplicate
+
+    Returns:
+        the distinct circuits (in order of first appearance), and for each of the given circuits,
+        the index of its equivalent among the distinct circuits
+    """
+    memo: Dict[int, Optional[Hashable]] = {}
+    indices_by_key: Dict[Hashable, int] = {}
+    unique_circuits: List[qiskit.QuantumCircuit] = []
+    indices = []
+    for circuit in circuits:
+        key = _circuit_key(circuit, memo)
+        index = (
+            len(unique_circuits)
+            if key is None
+            else indices_by_key.setdefault(key, len(unique_circuits))
+        )
+        if index == len(unique_circuits):
+            unique_circuits.append(circuit)
+        indices.append(index)
+
+    return unique_circuits, indices
+
+
+def fan_out(items: Sequence[Any], indices: List[int]) -> List[Any]:
+    """Maps the per-circuit outputs for a deduplicated batch back to the original batch.
+
+    Args:
+        items: the outputs for each distinct circuit returned by `deduplicate_circuits`
+        indices: the indices returned by `deduplicate_circuits`
+
+    Returns:
+        the outputs for each circuit in the original batch. Repeated outputs are (deep) copies, so
+        that every output can be modified independently.
+    """
+    seen: Set[int] = set()
+    fanned_out = []
+    for index in indices:
+        fanned_out.append(copy.deepcopy(items[index]) if index in seen else items[index])
+        seen.add(index)
+    return fanned_out
+
+
+def _cache_key(circuit: qiskit.QuantumCircuit) -> Optional[str]:
+    """Returns a fixed-size digest of the key of a circuit (see `_circuit_key`), by which its QPY
+    file is cached, or None if the circuit can't be cached."""
+    key = _circuit_key(circuit)
+    if key is None:
+        return None
+
+    try:
+        key_bytes = pickle.dumps(key, protocol=pickle.HIGHEST_PROTOCOL)
+    except (AttributeError, TypeError, pickle.PicklingError):  # (e.g. locally defined gate types)
+        return None
+    return hashlib.sha256(key_bytes).hexdigest()
+
+
+def _set_qpy_circuit_name(qpy_file: bytes, name: str) -> bytes:
+    """Returns a copy of a single-circuit QPY file in which the circuit is renamed."""
+    start = qiskit.qpy.formats.FILE_HEADER_SIZE
+    end = start + qiskit.qpy.formats.CIRCUIT_HEADER_V2_SIZE
+    header = qiskit.qpy.formats.CIRCUIT_HEADER_V2._make(
+        struct.unpack(qiskit.qpy.formats.CIRCUIT_HEADER_V2_PACK, qpy_file[start:end])
+    )
+    new_name = name.encode(qiskit.qpy.common.ENCODE)
+    new_header = struct.pack(
+        qiskit.qpy.formats.CIRCUIT_HEADER_V2_PACK, *header._replace(name_size=len(new_name))
+    )
+    rest = end + header.name_size
+    return b"".join([qpy_file[:start], new_header, new_name, qpy_file[rest:]])
+
+
+def _get_cached_qpy(
+    circuit: qiskit.QuantumCircuit, key: Optional[str], cache: Optional["qss.caching.LRUCache"]
+) -> Optional[bytes]:
+    """Returns the cached QPY file of a circuit (if any). If the name of the circuit was generated
+    by qiskit, the cached file (which may be that of another such circuit) is renamed after it."""
+    if cache is None or key is None:
+        return None
+
+    qpy_file = cache.get(key)
+    if qpy_file is not None and _has_default_name(circuit):
+        qpy_file = _set_qpy_circuit_name(qpy_file, circuit.name)
+    return qpy_file
+
+
+def _circuit_to_qpy(
+    circuit: qiskit.QuantumCircuit, cache: Optional["qss.caching.LRUCache"] = None
+) -> bytes:
+    """Serializes a single circuit into a QPY file (reusing cached files if possible)."""
+    key = _cache_key(circuit) if cache is not None else None
+    qpy_file = _get_cached_qpy(circuit, key, cache)
+    if qpy_file is not None:
+        return qpy_file
+
+    buf = io.BytesIO()
+    qiskit.qpy.dump(_assign_unique_inst_names(circuit), buf)
+    qpy_file = buf.getvalue()
+
+    if cache is not None and key is not None:
+        cache.put(key, qpy_file)
+    return qpy_file
+
+
+def _circuits_to_qpy_files(circuits: List[qiskit.QuantumCircuit]) -> List[bytes]:
+    """Serializes each circuit into its own QPY file (this is run by worker processes)."""
+    return [_circuit_to_qpy(circuit) for circuit in circuits]
+
+
+def _parallel_circuits_to_qpy(
+    circuits: List[qiskit.QuantumCircuit],
+    num_processes: int,
+    cache: Optional["qss.caching.LRUCache"] = None,
+) -> List[bytes]:
+    """Serializes each circuit into its own QPY file, sharding the circuits across a process pool.
+
+    Cached circuits are looked up (and newly encoded circuits stored) in the calling process, so
+    only the circuits missing from the cache are sent to the workers. These are encoded serially
+    if there are too few of them to be worth starting a process pool.
+    """
+    keys = [_cache_key(circuit) if cache is not None else None for circuit in circuits]
+    qpy_files = [_get_cached_qpy(circuit, key, cache) for circuit, key in zip(circuits, keys)]
+    missing = [index for index, qpy_file in enumerate(qpy_files) if qpy_file is None]
+
+    if len(missing) < PARALLEL_SERIALIZATION_THRESHOLD:
+        for index in missing:
+            qpy_files[index] = _circuit_to_qpy(circuits[index])
+    else:
+        shards = [missing[i::num_processes] for i in range(num_processes)]
+        with concurrent.futures.ProcessPoolExecutor(num_processes) as executor:
+            shard_circuits = ([circuits[index] for index in shard] for shard in shards)
+            for shard, shard_files in zip(
+                shards, executor.map(_circuits_to_qpy_files, shard_circuits)
+            ):
+                for index, qpy_file in zip(shard, shard_files):
+                    qpy_files[index] = qpy_file
+
+    for index in missing:
+        key = keys[index]
+        if cache is not None and key is not None:
+            cache.put(key, qpy_files[index])
+
+    return [qpy_file for qpy_file in qpy_files if qpy_file is not None]
+
+
+def _compress(data: bytes, compression: Optional[str]) -> bytes:
+    """Compresses `data` with the given codec (one of `SUPPORTED_COMPRESSIONS`), if any. The
+    compressed data is prefixed with `_COMPRESSION_MARKER` and the name of the codec."""
+    if compression is None:
+        return data
+
+    if compression == "zlib":
+        compressed_data = zlib.compress(data)
+    elif compression == "zstd":
+        if not importlib.util.find_spec("zstandard"):
+            raise applications_superstaq.SuperstaQModuleNotFoundException(
+                name="zstandard", context="zstd compression"
+            )
+        compressed_data = zstandard.ZstdCompressor().compress(data)
+    else:
+        raise ValueError(
+            f"Unsupported compression {compression!r} (must be one of {SUPPORTED_COMPRESSIONS})."
+        )
+
+    return _COMPRESSION_MARKER + compression.encode() + b"\n" + compressed_data
+
+
+def _decompress(data: bytes) -> bytes:
+    """Decompresses data compressed by `_compress`, using the codec named after its marker. Data
+    without this marker is returned as-is."""
+    if not data.startswith(_COMPRESSION_MARKER):
+        return data
+
+    header, _, compressed_data = data.partition(b"\n")
+    compression = header.partition(b":")[2].decode()
+    if compression == "zlib":
+        return zlib.decompress(compressed_data)
+
+    if compression == "zstd":
+        if not importlib.util.find_spec("zstandard"):
+            raise applications_superstaq.SuperstaQModuleNotFoundException(
+                name="zstandard", context="zstd decompression"
+            )
+        return zstandard.ZstdDecompressor().decompress(compressed_data)
+
+    raise ValueError(
+        f"Unsupported compression {compression!r} (must be one of {SUPPORTED_COMPRESSIONS})."
+    )
+
+
+def _join_qpy_files(qpy_files: List[bytes]) -> bytes:
+    """Combines several QPY files into a single one (containing all of their circuits).
+
+    The circuits in a QPY file are encoded independently of each other following a common file
+    header, so this only requires rewriting the number of circuits in this header.
+    """
+    header_size = qiskit.qpy.formats.FILE_HEADER_SIZE
+    if not qpy_files:
+        buf = io.BytesIO()
+        qiskit.qpy.dump([], buf)
+        return buf.getvalue()
+
+    header = struct.unpack(qiskit.qpy.formats.FILE_HEADER_PACK, qpy_files[0][:header_size])
+    new_header = struct.pack(qiskit.qpy.formats.FILE_HEADER_PACK, *header[:-1], len(qpy_files))
+    return new_header + b"".join(qpy_file[header_size:] for qpy_file in qpy_files)
+
+
+def serialize_circuits(
+    circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+    cache: Optional["qss.caching.LRUCache"] = None,
+    num_processes: Optional[int] = None,
+    compression: Optional[str] = None,
+) -> str:
     """Serialize QuantumCircuit(s) into a single string
 
     Args:
         circuits: a QuantumCircuit or list of QuantumCircuits to be serialized
+        cache: an optional qss.caching.LRUCache in which the serialization of each circuit is
+            stored, keyed by the structure of the circuit. Structurally identical circuits are
+            then only encoded once.
+        num_processes: if greater than one, batches of at least `PARALLEL_SERIALIZATION_THRESHOLD`
+            circuits are encoded in parallel by this many worker processes. The output is the
+            same as when serializing serially.
+        compression: optional codec (one of `SUPPORTED_COMPRESSIONS`) with which to compress the
+            serialized circuits. Compressed circuits are marked with their codec, and are
+            decompressed automatically when deserializing.
 
     Returns:
         str representing the serialized circuit(s)
     """
     if isinstance(circuits, qiskit.QuantumCircuit):
-        circuits = [_assign_unique_inst_names(circuits)]
+        circuits = [circuits]
+
+    if num_processes and num_processes > 1 and len(circuits) >= PARALLEL_SERIALIZATION_THRESHOLD:
+        qpy_file = _join_qpy_files(_parallel_circuits_to_qpy(circuits, num_processes, cache))
+    elif cache is not None:
+        qpy_file = _join_qpy_files([_circuit_to_qpy(circuit, cache) for circuit in circuits])
     else:
-        circuits = [_assign_unique_inst_names(circuit) for circuit in circuits]
+        buf = io.BytesIO()
+        qiskit.qpy.dump([_assign_unique_inst_names(circuit) for circuit in circuits], buf)
+        qpy_file = buf.getvalue()
 
-    buf = io.BytesIO()
-    qiskit.qpy.dump(circuits, buf)
-    return applications_superstaq.converters._bytes_to_str(buf.getvalue())
+    return applications_superstaq.converters._bytes_to_str(_compress(qpy_file, compression))
+
+
+def _base64_size(num_bytes: int) -> int:
+    """Returns the length of the string `applications_superstaq.converters._bytes_to_str` produces
+    from `num_bytes` bytes (i.e. base64 with a newline after every 76 characters)."""
+    num_chars = 4 * -(-num_bytes // 3)
+    return num_chars + -(-num_chars // 76)
+
+
+def serialize_circuit_chunks(
+    circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+    max_circuits_per_chunk: Optional[int] = None,
+    max_size_per_chunk: Optional[int] = None,
+    cache: Optional["qss.caching.LRUCache"] = None,
+    num_processes: Optional[int] = None,
+    compression: Optional[str] = None,
+) -> List[Tuple[int, str]]:
+    """Serialize QuantumCircuit(s) into one or more strings, each holding a chunk of consecutive
+    circuits.
+
+    Args:
+        circuits: a QuantumCircuit or list of QuantumCircuits to be serialized
+        max_circuits_per_chunk: the maximum number of circuits in each chunk (or None for no limit)
+        max_size_per_chunk: the maximum length of each serialized chunk (or None for no limit),
+            before any compression. A circuit which exceeds this limit on its own is serialized in
+            a chunk of its own.
+        cache: an optional qss.caching.LRUCache (see `serialize_circuits`)
+        num_processes: the number of worker processes to use (see `serialize_circuits`)
+        compression: optional codec with which to compress each chunk (see `serialize_circuits`)
+
+    Returns:
+        a list of (number of circuits, serialized circuits) pairs, one per chunk (in order). There
+        is always at least one chunk, and a single chunk is identical to the output of
+        `serialize_circuits`.
+    """
+    if isinstance(circuits, qiskit.QuantumCircuit):
+        circuits = [circuits]
+
+    if num_processes and num_processes > 1 and len(circuits) >= PARALLEL_SERIALIZATION_THRESHOLD:
+        qpy_files = _parallel_circuits_to_qpy(circuits, num_processes, cache)
+    else:
+        qpy_files = [_circuit_to_qpy(circuit, cache) for circuit in circuits]
+
+    header_size = qiskit.qpy.formats.FILE_HEADER_SIZE
+    chunks: List[List[bytes]] = [[]]
+    chunk_bytes = header_size
+    for qpy_file in qpy_files:
+        num_bytes = len(qpy_file) - header_size
+        if chunks[-1] and (
+            (max_circuits_per_chunk is not None and len(chunks[-1]) >= max_circuits_per_chunk)
+            or (
+                max_size_per_chunk is not None
+                and _base64_size(chunk_bytes + num_bytes) > max_size_per_chunk
+            )
+        ):
+            chunks.append([])
+            chunk_bytes = header_size
+
+        chunks[-1].append(qpy_file)
+        chunk_bytes += num_bytes
+
+    return [
+        (
+            len(chunk),
+            applications_superstaq.converters._bytes_to_str(
+                _compress(_join_qpy_files(chunk), compression)
+            ),
+        )
+        for chunk in chunks
+    ]
 
 
 def deserialize_circuits(serialized_circuits: str) -> List[qiskit.QuantumCircuit]:
@@ -87,16 +614,354 @@ def deserialize_circuits(serialized_circuits: str) -> List[qiskit.QuantumCircuit
     Returns:
         a list of QuantumCircuits
     """
-    buf = io.BytesIO(applications_superstaq.converters._str_to_bytes(serialized_circuits))
+    qpy_file = _decompress(applications_superstaq.converters._str_to_bytes(serialized_circuits))
+    buf = io.BytesIO(qpy_file)
 
     with warnings.catch_warnings(record=False):
         warnings.filterwarnings("ignore", "The qiskit version", UserWarning, "qiskit")
         circuits = qiskit.qpy.load(buf)
 
     for circuit in circuits:
-        for pc, (inst, qargs, cargs) in enumerate(circuit._data):
-            new_inst = qss.custom_gates.custom_resolver(inst)
-            if new_inst is not None:
-                circuit._data[pc] = (new_inst, qargs, cargs)
+        _resolve_custom_gates(circuit)
 
     return circuits
+
+
+def deserialize_object(serialized_obj: str) -> Any:
+    """Deserialize an object serialized by applications_superstaq.converters.serialize(), which
+    may have been compressed with one of `SUPPORTED_COMPRESSIONS` (e.g. the pulse sequences
+    returned by the server).
+
+    Args:
+        serialized_obj: the serialized object
+
+    Returns:
+        the deserialized object
+    """
+    data = _decompress(applications_superstaq.converters._str_to_bytes(serialized_obj))
+    return pickle.loads(data)
+
+
+def serialize_parameter_values(
+    circuit: qiskit.QuantumCircuit,
+    parameter_values: Union[np.ndarray, Sequence[Sequence[float]]],
+    compression: Optional[str] = None,
+) -> Dict[str, Any]:
+    """Serialize a table of values for the parameters of a (template) circuit.
+
+    Args:
+        circuit: the parameterized QuantumCircuit
+        parameter_values: a 2D array with one row per binding, and one column per parameter of
+            `circuit` (in the order of `circuit.parameters`, i.e. sorted by name)
+        compression: optional codec (one of `SUPPORTED_COMPRESSIONS`) with which to compress the
+            serialized values
+
+    Returns:
+        the request fields describing the binding table, i.e. the names of the parameters and the
+        serialized array of their values
+
+    Raises:
+        ValueError: if the shape of `parameter_values` doesn't match the circuit's parameters.
+    """
+    values = np.asarray(parameter_values, dtype=float)
+    if values.ndim != 2 or values.shape[1] != circuit.num_parameters or not len(values):
+        raise ValueError(
+            "parameter_values must be a 2D array with at least one row, and one column per "
+            f"parameter of the circuit ({circuit.num_parameters}), but has shape {values.shape}."
+        )
+
+    buf = io.BytesIO()
+    np.save(buf, values, allow_pickle=False)
+    return {
+        "parameters": [parameter.name for parameter in circuit.parameters],
+        "parameter_values": applications_superstaq.converters._bytes_to_str(
+            _compress(buf.getvalue(), compression)
+        ),
+    }
+
+
+def deserialize_parameter_values(serialized_values: str) -> np.ndarray:
+    """Deserialize a table of parameter values serialized by `serialize_parameter_values`.
+
+    Args:
+        serialized_values: the "parameter_values" field returned by `serialize_parameter_values`
+
+    Returns:
+        the 2D array of parameter values
+    """
+    data = _decompress(applications_superstaq.converters._str_to_bytes(serialized_values))
+    return np.load(io.BytesIO(data), allow_pickle=False)
+
+
+def _copy_instruction(
+    inst: Optional[qiskit.circuit.Instruction],
+) -> Optional[qiskit.circuit.Instruction]:
+    """Returns a new instance of an instruction with its own list of parameters. Unlike
+    `Instruction.copy`, its definition (if it has already been built) is shared rather than
+    deep-copied."""
+    if inst is None:
+        return None
+
+    new_inst = copy.copy(inst)
+    new_inst.params = inst.params
+    return new_inst
+
+
+def _resolve_custom_gates(circuit: qiskit.QuantumCircuit) -> None:
+    """Replaces the generic gates in a deserialized circuit with their qiskit-superstaq custom gate
+    types (in place).
+
+    Standard gates are skipped without being resolved (which would require building their
+    definitions). Within a QPY circuit all custom instructions sharing a name also share their
+    definition, so each unique (name, params, label) combination is resolved only once. Each of its
+    occurrences then gets its own (shallow) copy of the resolved gate.
+    """
+    resolved_insts: Dict[Hashable, Optional[qiskit.circuit.Instruction]] = {}
+    for pc, (inst, qargs, cargs) in enumerate(circuit._data):
+        if _is_standard_instruction(inst):
+            continue
+
+        params = tuple(_param_key(param) for param in inst.params)
+        if None in params:
+            new_inst = qss.custom_gates.custom_resolver(inst)
+        else:
+            key = (inst.name, params, inst.label)
+            if key not in resolved_insts:
+                resolved_insts[key] = qss.custom_gates.custom_resolver(inst)
+            new_inst = _copy_instruction(resolved_insts[key])
+
+        if new_inst is not None:
+            circuit._data[pc] = (new_inst, qargs, cargs)
+
+
+class LazyCircuitList(collections.abc.Sequence):
+    """A read-only list of serialized QuantumCircuits, each of which is only deserialized the first
+    time it is accessed.
+
+    QPY circuits are stored back-to-back without an index, so accessing a circuit also decodes all
+    of the circuits preceding it (but each circuit is only ever decoded once).
+    """
+
+    def __init__(self, serialized_circuits: str, keep_payload: bool = False) -> None:
+        """
+        Args:
+            serialized_circuits: str generated via qss.serialization.serialize_circuits()
+            keep_payload: whether to keep the raw serialized circuits (in the `serialized_circuits`
+                attribute) after all of them have been deserialized. Otherwise the payload is
+                dropped once it is no longer needed, and `serialized_circuits` is set to None.
+        """
+        self.serialized_circuits: Optional[str] = serialized_circuits
+        self._keep_payload = keep_payload
+        self._buf: Optional[io.BytesIO] = io.BytesIO(
+            _decompress(applications_superstaq.converters._str_to_bytes(serialized_circuits))
+        )
+
+        header = qiskit.qpy.formats.FILE_HEADER._make(
+            struct.unpack(
+                qiskit.qpy.formats.FILE_HEADER_PACK,
+                self._buf.read(qiskit.qpy.formats.FILE_HEADER_SIZE),
+            )
+        )
+        if header.preface != b"QISKIT":
+            raise ValueError("Input is not a valid serialization of QuantumCircuits")
+
+        self._qpy_version = header.qpy_version
+        self._num_circuits = header.num_circuits
+        self._circuits: List[qiskit.QuantumCircuit] = []
+        self._lock = threading.Lock()
+        self._release_payload()
+
+    def _release_payload(self) -> None:
+        if len(self._circuits) == self._num_circuits:
+            self._buf = None
+            if not self._keep_payload:
+                self.serialized_circuits = None
+
+    def _decode(self, index: int) -> qiskit.QuantumCircuit:
+        with self._lock:
+            while len(self._circuits) <= index:
+                assert self._buf is not None
+                circuit = qiskit.qpy.binary_io.read_circuit(self._buf, self._qpy_version)
+                _resolve_custom_gates(circuit)
+                self._circuits.append(circuit)
+                self._release_payload()
+
+        return self._circuits[index]
+
+    def num_decoded(self) -> int:
+        """Returns the number of circuits which have been deserialized so far."""
+        return len(self._circuits)
+
+    @overload
+    def __getitem__(self, index: int) -> qiskit.QuantumCircuit:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[qiskit.QuantumCircuit]:
+        ...
+
+    def __getitem__(
+        self, index: Union[int, slice]
+    ) -> Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(self._num_circuits))]
+
+        position = index + self._num_circuits if index < 0 else index
+        if not 0 <= position < self._num_circuits:
+            raise IndexError("circuit index out of range")
+        return self._decode(position)
+
+    def __len__(self) -> int:
+        return self._num_circuits
+
+    def __iter__(self) -> Iterator[qiskit.QuantumCircuit]:
+        for index in range(self._num_circuits):
+            yield self._decode(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazyCircuitList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # pickle the deserialized circuits (the lock and buffer can't be pickled)
+        _ = self[:]
+        state = self.__dict__.copy()
+        del state["_lock"]
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
+
+
+class LazyObjectList(collections.abc.Sequence):
+    """A read-only list of objects serialized by applications_superstaq.converters.serialize()
+    (e.g. the pulse sequences returned by the server), which are only deserialized when accessed.
+
+    The objects may be serialized individually (as a list of strings), in which case each one is
+    deserialized separately on first access, or as a single serialized list, which is deserialized
+    as a whole on first access. Either way, deserialized objects are kept for later accesses.
+    """
+
+    def __init__(
+        self,
+        serialized_objects: Union[str, List[str]],
+        cache: Optional["qss.caching.LRUCache"] = None,
+        context: Optional[str] = None,
+    ) -> None:
+        """
+        Args:
+            serialized_objects: a list of individually serialized objects, or a single serialized
+                list of objects
+            cache: an optional qss.caching.LRUCache in which the decoded (and decompressed)
+                pickles of objects are memoized, keyed by the hash of their serialization (so that
+                identical payloads are only decoded once, even across LazyObjectLists). Each
+                LazyObjectList still unpickles its own objects, so they are never shared.
+            context: if provided, a ModuleNotFoundError raised when deserializing an object is
+                turned into a SuperstaQModuleNotFoundException for this context
+        """
+        self._cache = cache
+        self._context = context
+        self._serialized_list: Optional[str] = None
+        self._serialized_objects: List[Optional[str]] = []
+        self._objects: List[Any] = []
+        self._lock = threading.Lock()
+
+        if isinstance(serialized_objects, str):
+            self._serialized_list = serialized_objects
+        else:
+            self._serialized_objects = list(serialized_objects)
+            self._objects = [_UNDECODED] * len(self._serialized_objects)
+
+    def _pickled_bytes(self, serialized_obj: str) -> bytes:
+        """Returns the (decoded and decompressed) pickle of a serialized object."""
+        key = None
+        if self._cache is not None:
+            key = hashlib.sha256(serialized_obj.encode()).hexdigest()
+            data = self._cache.get(key)
+            if data is not None:
+                return data
+
+        data = _decompress(applications_superstaq.converters._str_to_bytes(serialized_obj))
+        if self._cache is not None:
+            self._cache.put(key, data)
+        return data
+
+    def _deserialize(self, serialized_obj: str) -> Any:
+        try:
+            return pickle.loads(self._pickled_bytes(serialized_obj))
+        except ModuleNotFoundError as e:
+            if self._context is None:
+                raise
+            raise applications_superstaq.SuperstaQModuleNotFoundException(
+                name=str(e.name), context=self._context
+            )
+
+    def _load_list(self) -> None:
+        # (must be called with the lock held)
+        if self._serialized_list is not None:
+            self._objects = list(self._deserialize(self._serialized_list))
+            self._serialized_objects = [None] * len(self._objects)
+            self._serialized_list = None
+
+    def _decode(self, index: int) -> Any:
+        with self._lock:
+            self._load_list()
+            obj = self._objects[index]
+            if obj is _UNDECODED:
+                serialized_obj = self._serialized_objects[index]
+                assert serialized_obj is not None
+                obj = self._objects[index] = self._deserialize(serialized_obj)
+                self._serialized_objects[index] = None
+
+        return obj
+
+    def num_decoded(self) -> int:
+        """Returns the number of objects which have been deserialized so far."""
+        return sum(obj is not _UNDECODED for obj in self._objects)
+
+    @overload
+    def __getitem__(self, index: int) -> Any:
+        ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[Any]:
+        ...
+
+    def __getitem__(self, index: Union[int, slice]) -> Any:
+        if isinstance(index, slice):
+            return [self._decode(i) for i in range(*index.indices(len(self)))]
+        return self._decode(index)
+
+    def __len__(self) -> int:
+        with self._lock:
+            self._load_list()
+            return len(self._objects)
+
+    def __iter__(self) -> Iterator[Any]:
+        for index in range(len(self)):
+            yield self._decode(index)
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, (list, LazyObjectList)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+    def __getstate__(self) -> Dict[str, Any]:
+        # pickle the deserialized objects (the lock can't be pickled, and the cache isn't kept)
+        _ = self[:]
+        state = self.__dict__.copy()
+        del state["_lock"]
+        state["_cache"] = None
+        return state
+
+    def __setstate__(self, state: Dict[str, Any]) -> None:
+        self.__dict__.update(state)
+        self._lock = threading.Lock()
@@ -1,8 +1,10 @@
 import io
+import pickle
 import warnings
 from unittest import mock
 
 import applications_superstaq
+import numpy as np
 import pytest
 import qiskit
 
@@ -34,6 +36,82 @@ def test_assign_unique_inst_names() -> None:
     new_circuit = qss.serialization._assign_unique_inst_names(circuit)
     assert [inst.name for inst, _, _ in new_circuit] == expected_inst_names
 
+    # the input circuit is not mutated, and only renamed instructions are cloned
+    assert [inst.name for inst, _, _ in circuit] == ["zzswap"] * 4 + ["rxx"] * 2
+    assert new_circuit[0][0] is inst_0
+    assert new_circuit[1][0] is not inst_1
+    assert new_circuit[1][0] is new_circuit[3][0]
+    assert new_circuit[4][0] is circuit[4][0]
+
+    # circuits which don't need any renaming are returned as-is
+    circuit = qiskit.QuantumCircuit(4)
+    circuit.append(inst_0, [0, 1])
+    circuit.append(inst_2, [2, 0])
+    circuit.rxx(1.1, 0, 1)
+    assert qss.serialization._assign_unique_inst_names(circuit) is circuit
+
+
+def test_assign_unique_inst_names_parameter_table() -> None:
+    theta = qiskit.circuit.Parameter("theta")
+    inst_0 = qiskit.circuit.Gate("custom", 1, [theta])
+    inst_1 = qiskit.circuit.Gate("custom", 1, [2 * theta])
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.append(inst_0, [0])
+    circuit.append(inst_1, [0])
+
+    new_circuit = qss.serialization._assign_unique_inst_names(circuit)
+    assert [inst.name for inst, _, _ in new_circuit] == ["custom", "custom_1"]
+    assert [inst.name for inst, _, _ in circuit] == ["custom", "custom"]
+
+    # the parameter table refers to the renamed instruction
+    assert [inst.name for inst, _ in new_circuit._parameter_table[theta]] == ["custom", "custom_1"]
+    assert new_circuit._parameter_table[theta][1][0] is new_circuit[1][0]
+    assert [inst.name for inst, _ in circuit._parameter_table[theta]] == ["custom", "custom"]
+
+    bound_circuit = new_circuit.bind_parameters({theta: 0.5})
+    assert [inst.params for inst, _, _ in bound_circuit] == [[0.5], [1.0]]
+    assert circuit.parameters == {theta}
+
+
+def test_assign_unique_inst_names_same_qasm() -> None:
+    # custom gates with identical qasm strings but different definitions
+    definition_0 = qiskit.QuantumCircuit(1)
+    definition_0.x(0)
+    definition_1 = qiskit.QuantumCircuit(1)
+    definition_1.z(0)
+
+    insts = [qiskit.circuit.Gate("custom", 1, []) for _ in range(4)]
+    for inst, definition in zip(insts, [definition_0, definition_1, definition_0, definition_1]):
+        inst.definition = definition
+
+    circuit = qiskit.QuantumCircuit(1)
+    for inst in insts:
+        circuit.append(inst, [0])
+    circuit.append(qiskit.circuit.Gate("custom", 1, [0.5]), [0])
+
+    new_circuit = qss.serialization._assign_unique_inst_names(circuit)
+    assert [inst.name for inst, _, _ in new_circuit] == [
+        "custom",
+        "custom_1",
+        "custom",
+        "custom_1",
+        "custom_2",
+    ]
+
+
+def test_assign_unique_inst_names_unitary_gates() -> None:
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.unitary(np.eye(2), [0])
+    circuit.unitary(np.eye(2), [0])
+    circuit.unitary(-np.eye(2), [0])
+
+    new_circuit = qss.serialization._assign_unique_inst_names(circuit)
+    assert [inst.name for inst, _, _ in new_circuit] == ["unitary", "unitary", "unitary_1"]
+
+    # the gates of the input circuit are left untouched (UnitaryGate.qasm() would mutate them)
+    assert all(inst._qasm_name is None for inst, _, _ in circuit)
+
 
 def test_circuit_serialization() -> None:
     circuit_0 = qiskit.QuantumCircuit(3)
@@ -88,6 +166,512 @@ def test_circuit_serialization() -> None:
     assert qss.serialization.deserialize_circuits(serialized_circuits) == circuits
 
 
+def test_circuit_key() -> None:
+    theta = qiskit.circuit.Parameter("theta")
+
+    def build_circuit(angle: float = 0.1) -> qiskit.QuantumCircuit:
+        circuit = qiskit.QuantumCircuit(
+            qiskit.QuantumRegister(3, "q"), qiskit.ClassicalRegister(2, "c")
+        )
+        circuit.append(qss.ZZSwapGate(angle), [0, 1])
+        parallel_gates = qss.ParallelGates(qss.ZZSwapGate(angle), qiskit.circuit.library.XGate())
+        circuit.append(parallel_gates, [0, 1, 2])
+        circuit.rx(theta, 2)
+        circuit.x(1).c_if(circuit.clbits[0], 1)
+        circuit.x(1).c_if(circuit.cregs[0], 2)
+        circuit.measure([0, 1], [0, 1])
+        return circuit
+
+    key = qss.serialization._circuit_key(build_circuit())
+    assert key is not None
+    assert hash(key) == hash(qss.serialization._circuit_key(build_circuit()))
+    assert key == qss.serialization._circuit_key(build_circuit())
+    assert key != qss.serialization._circuit_key(build_circuit(0.2))
+
+    # names generated by qiskit are left out of the key, but explicit names are not
+    assert build_circuit().name != build_circuit().name
+    circuit = build_circuit()
+    circuit.name = "my_circuit"
+    assert key != qss.serialization._circuit_key(circuit)
+    circuit.name = f"circuit-{qiskit.QuantumCircuit.cls_instances()}-123"
+    assert key == qss.serialization._circuit_key(circuit)
+
+    circuit = build_circuit()
+    circuit.global_phase = 1
+    assert key != qss.serialization._circuit_key(circuit)
+
+    circuit = build_circuit()
+    circuit.unitary(np.eye(2), [0])
+    key = qss.serialization._circuit_key(circuit)
+    assert key is not None
+    circuit = build_circuit()
+    circuit.unitary(-np.eye(2), [0])
+    assert key != qss.serialization._circuit_key(circuit)
+
+    # integer and float parameters have different encodings
+    circuit_0 = qiskit.QuantumCircuit(1)
+    circuit_0.rx(1, 0)
+    circuit_1 = qiskit.QuantumCircuit(1)
+    circuit_1.rx(1.0, 0)
+    assert qss.serialization._circuit_key(circuit_0) != qss.serialization._circuit_key(circuit_1)
+
+    # circuits with unhashable data can't be keyed
+    circuit.append(qiskit.circuit.Instruction("custom", 1, 0, [[1, 2]]), [0])
+    assert qss.serialization._circuit_key(circuit) is None
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.add_calibration("x", [0], qiskit.pulse.Schedule())
+    assert qss.serialization._circuit_key(circuit) is None
+
+
+def test_serialization_cache() -> None:
+    cache = qss.caching.LRUCache(10**6, sizeof=len)
+
+    circuit_0 = qiskit.QuantumCircuit(3)
+    circuit_0.cx(2, 1)
+    circuit_0.append(qss.ZZSwapGate(0.1), [0, 1])
+    circuit_0.append(qss.ZZSwapGate(0.2), [1, 2])
+
+    circuit_1 = qiskit.QuantumCircuit(2, 2)
+    circuit_1.append(qss.AceCR("+-"), [0, 1])
+    circuit_1.measure([0, 1], [0, 1])
+
+    circuits = [circuit_0, circuit_1, circuit_0]
+    serialized_circuits = qss.serialization.serialize_circuits(circuits, cache=cache)
+    assert serialized_circuits == qss.serialization.serialize_circuits(circuits)
+    assert qss.serialization.deserialize_circuits(serialized_circuits) == circuits
+    assert cache.cache_info()[:4] == (1, 2, 0, 2)
+
+    assert qss.serialization.serialize_circuits(circuit_1, cache=cache) == (
+        qss.serialization.serialize_circuits(circuit_1)
+    )
+    assert cache.cache_info()[:4] == (2, 2, 0, 2)
+
+    assert qss.serialization.serialize_circuits([], cache=cache) == (
+        qss.serialization.serialize_circuits([])
+    )
+
+    # cached files are reused for other circuits with generated names, under their own names
+    other_circuit_0 = circuit_0.copy(name=f"circuit-{qiskit.QuantumCircuit.cls_instances()}")
+    serialized_circuit = qss.serialization.serialize_circuits(other_circuit_0, cache=cache)
+    assert cache.cache_info()[:4] == (3, 2, 0, 2)
+    assert serialized_circuit == qss.serialization.serialize_circuits(other_circuit_0)
+    assert qss.serialization.deserialize_circuits(serialized_circuit)[0].name == (
+        other_circuit_0.name
+    )
+
+    # the cache is keyed by fixed-size digests
+    assert all(isinstance(key, str) and len(key) == 64 for key in cache._data)
+
+    # uncacheable circuits are still serialized
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.add_calibration("x", [0], qiskit.pulse.Schedule())
+    circuit.x(0)
+    serialized_circuit = qss.serialization.serialize_circuits(circuit, cache=cache)
+    assert serialized_circuit == qss.serialization.serialize_circuits(circuit)
+    assert len(cache) == 2
+
+    class LocalGate(qiskit.circuit.Gate):
+        def __init__(self) -> None:
+            super().__init__("local_gate", 1, [])
+
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.append(LocalGate(), [0])
+    assert qss.serialization._circuit_key(circuit) is not None
+    assert qss.serialization._cache_key(circuit) is None
+    serialized_circuit = qss.serialization.serialize_circuits(circuit, cache=cache)
+    assert serialized_circuit == qss.serialization.serialize_circuits(circuit)
+    assert len(cache) == 2
+
+
+def test_deduplicate_circuits() -> None:
+    circuit_0 = qiskit.QuantumCircuit(2, name="circuit_0")
+    circuit_0.cx(0, 1)
+    circuit_1 = qiskit.QuantumCircuit(2, name="circuit_1")
+    circuit_1.cx(1, 0)
+    circuit_2 = qiskit.QuantumCircuit(2, name="circuit_0")
+    circuit_2.cx(0, 1)
+
+    unique_circuits, indices = qss.serialization.deduplicate_circuits(
+        [circuit_0, circuit_1, circuit_2, circuit_1]
+    )
+    assert unique_circuits == [circuit_0, circuit_1]
+    assert unique_circuits[0] is circuit_0
+    assert indices == [0, 1, 0, 1]
+
+    assert qss.serialization.deduplicate_circuits([]) == ([], [])
+
+    # a conditioned instruction shared between circuits is keyed by its clbit in each circuit
+    clbit = qiskit.circuit.Clbit()
+    inst = qiskit.circuit.library.XGate().c_if(clbit, 1)
+    circuit_0 = qiskit.QuantumCircuit(1, name="circuit")
+    circuit_0.add_bits([qiskit.circuit.Clbit(), clbit])
+    circuit_1 = qiskit.QuantumCircuit(1, name="circuit")
+    circuit_1.add_bits([clbit, qiskit.circuit.Clbit()])
+    circuit_0.append(inst, [0])
+    circuit_1.append(inst, [0])
+    unique_circuits, indices = qss.serialization.deduplicate_circuits([circuit_0, circuit_1])
+    assert unique_circuits == [circuit_0, circuit_1]
+    assert indices == [0, 1]
+
+    # circuits which can't be keyed are never merged
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.add_calibration("x", [0], qiskit.pulse.Schedule())
+    assert qss.serialization.deduplicate_circuits([circuit, circuit]) == (
+        [circuit, circuit],
+        [0, 1],
+    )
+
+    fanned_out = qss.serialization.fan_out(["a", ["b"]], [1, 0, 1])
+    assert fanned_out == [["b"], "a", ["b"]]
+    assert fanned_out[0] is not fanned_out[2]
+
+
+def test_parallel_serialization() -> None:
+    circuits = []
+    for i in range(6):
+        circuit = qiskit.QuantumCircuit(3)
+        circuit.cx(2, 1)
+        circuit.append(qss.ZZSwapGate(0.1 * i), [0, 1])
+        circuit.append(qss.ZZSwapGate(0.2), [1, 2])
+        circuits.append(circuit)
+
+    serialized_circuits = qss.serialization.serialize_circuits(circuits)
+    assert qss.serialization._circuits_to_qpy_files(circuits[:1]) == [
+        applications_superstaq.converters._str_to_bytes(
+            qss.serialization.serialize_circuits(circuits[0])
+        )
+    ]
+
+    with mock.patch("qiskit_superstaq.serialization.PARALLEL_SERIALIZATION_THRESHOLD", 4):
+        assert (
+            qss.serialization.serialize_circuits(circuits, num_processes=4) == serialized_circuits
+        )
+
+        # with a cache, only the missing circuits are sent to the worker processes
+        cache = qss.caching.LRUCache(10**6, sizeof=len)
+        assert qss.serialization.serialize_circuits(circuits[:2], cache=cache) == (
+            qss.serialization.serialize_circuits(circuits[:2])
+        )
+        assert (
+            qss.serialization.serialize_circuits(circuits, cache=cache, num_processes=4)
+            == serialized_circuits
+        )
+        assert cache.cache_info()[:4] == (2, 6, 0, 6)
+
+        # batches with too few missing circuits are serialized serially
+        new_circuits = circuits + [qiskit.QuantumCircuit(2)]
+        with mock.patch("concurrent.futures.ProcessPoolExecutor") as mock_executor:
+            assert qss.serialization.serialize_circuits(
+                new_circuits, cache=cache, num_processes=4
+            ) == qss.serialization.serialize_circuits(new_circuits)
+            mock_executor.assert_not_called()
+        assert cache.cache_info()[:4] == (8, 7, 0, 7)
+
+        circuits.append(qiskit.QuantumCircuit(2))
+        assert qss.serialization.serialize_circuits(circuits, num_processes=4) == (
+            qss.serialization.serialize_circuits(circuits)
+        )
+
+    assert qss.serialization.deserialize_circuits(serialized_circuits) == circuits[:6]
+
+
+def test_serialize_circuit_chunks() -> None:
+    circuits = []
+    for i in range(5):
+        circuit = qiskit.QuantumCircuit(2, name=f"qc{i}")
+        circuit.rx(0.1 * i, 0)
+        circuit.cx(0, 1)
+        circuits.append(circuit)
+
+    serialized_circuit = qss.serialization.serialize_circuits(circuits[0])
+    assert qss.serialization.serialize_circuit_chunks(circuits[0]) == [(1, serialized_circuit)]
+    assert qss.serialization.serialize_circuit_chunks(circuits) == [
+        (5, qss.serialization.serialize_circuits(circuits))
+    ]
+
+    chunks = qss.serialization.serialize_circuit_chunks(circuits, max_circuits_per_chunk=2)
+    assert [num_circuits for num_circuits, _ in chunks] == [2, 2, 1]
+    assert [qss.serialization.deserialize_circuits(chunk) for _, chunk in chunks] == [
+        circuits[:2],
+        circuits[2:4],
+        circuits[4:],
+    ]
+
+    # a circuit larger than the size limit gets a chunk of its own
+    chunks = qss.serialization.serialize_circuit_chunks(circuits, max_size_per_chunk=1)
+    assert chunks == [(1, qss.serialization.serialize_circuits(circuit)) for circuit in circuits]
+
+    with mock.patch("qiskit_superstaq.serialization.PARALLEL_SERIALIZATION_THRESHOLD", 4):
+        assert qss.serialization.serialize_circuit_chunks(
+            circuits, max_circuits_per_chunk=2, num_processes=2
+        ) == qss.serialization.serialize_circuit_chunks(circuits, max_circuits_per_chunk=2)
+
+
+def test_resolve_custom_gates() -> None:
+    circuit = qiskit.QuantumCircuit(3, 1)
+    for _ in range(3):
+        circuit.append(qss.ZZSwapGate(0.1), [0, 1])
+        circuit.append(qss.ZZSwapGate(0.2), [1, 2])
+        circuit.append(qss.AceCR("+-"), [0, 1])
+        circuit.cx(0, 1)
+        circuit.barrier()
+    circuit.append(qss.AceCR("+-", label="label"), [0, 1])
+    circuit.measure(0, 0)
+
+    serialized_circuit = qss.serialization.serialize_circuits(circuit)
+    with mock.patch(
+        "qiskit_superstaq.custom_gates.custom_resolver",
+        wraps=qss.custom_gates.custom_resolver,
+    ) as mock_resolver:
+        (new_circuit,) = qss.serialization.deserialize_circuits(serialized_circuit)
+
+    # each unique custom gate is resolved once (and standard gates aren't resolved at all)
+    assert mock_resolver.call_count == 4
+    assert new_circuit == circuit
+    assert isinstance(new_circuit[0][0], qss.ZZSwapGate)
+    assert new_circuit[5][0] == new_circuit[0][0]
+    assert new_circuit[6][0] == new_circuit[1][0]
+    assert new_circuit[15][0].label == "label"
+
+    # but every occurrence is a distinct instance
+    assert new_circuit[5][0] is not new_circuit[0][0]
+    assert new_circuit[5][0].params is not new_circuit[0][0].params
+    new_circuit[5][0].label = "new_label"
+    assert new_circuit[0][0].label is None
+    assert new_circuit[15][0] is not new_circuit[2][0]
+
+    # instructions with unhashable parameters are resolved individually
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.append(qiskit.circuit.Instruction("custom", 1, 0, [[1, 2]]), [0])
+    circuit.append(qiskit.circuit.Instruction("custom", 1, 0, [[1, 2]]), [0])
+    with mock.patch("qiskit_superstaq.custom_gates.custom_resolver") as mock_resolver:
+        mock_resolver.return_value = None
+        qss.serialization._resolve_custom_gates(circuit)
+    assert mock_resolver.call_count == 2
+
+    # unresolved instructions (with hashable parameters) are only looked up once, and kept as is
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.append(qiskit.circuit.Instruction("custom", 1, 0, [1]), [0])
+    circuit.append(qiskit.circuit.Instruction("custom", 1, 0, [1]), [0])
+    insts = [inst for inst, _, _ in circuit]
+    with mock.patch("qiskit_superstaq.custom_gates.custom_resolver") as mock_resolver:
+        mock_resolver.return_value = None
+        qss.serialization._resolve_custom_gates(circuit)
+    assert mock_resolver.call_count == 1
+    assert all(inst is old_inst for (inst, _, _), old_inst in zip(circuit, insts))
+
+
+def test_lazy_circuit_list() -> None:
+    circuits = []
+    for i in range(4):
+        circuit = qiskit.QuantumCircuit(2)
+        circuit.append(qss.ZZSwapGate(0.1 * i), [0, 1])
+        circuit.h(0)
+        circuits.append(circuit)
+
+    serialized_circuits = qss.serialization.serialize_circuits(circuits)
+    lazy_circuits = qss.serialization.LazyCircuitList(serialized_circuits)
+    assert len(lazy_circuits) == 4
+    assert lazy_circuits.num_decoded() == 0
+
+    assert lazy_circuits[1] == circuits[1]
+    assert isinstance(lazy_circuits[1][0][0], qss.ZZSwapGate)
+    assert lazy_circuits.num_decoded() == 2
+    assert lazy_circuits.serialized_circuits == serialized_circuits
+
+    assert lazy_circuits[-3] is lazy_circuits[1]
+    assert lazy_circuits[1:3] == circuits[1:3]
+    assert lazy_circuits.num_decoded() == 3
+
+    with pytest.raises(IndexError, match="out of range"):
+        _ = lazy_circuits[4]
+    with pytest.raises(IndexError, match="out of range"):
+        _ = lazy_circuits[-5]
+
+    assert lazy_circuits == circuits
+    assert circuits == lazy_circuits
+    assert lazy_circuits == qss.serialization.LazyCircuitList(serialized_circuits)
+    assert lazy_circuits != circuits[:3]
+    assert lazy_circuits != tuple(circuits)
+    assert repr(lazy_circuits) == repr(list(lazy_circuits))
+
+    # the payload is dropped once every circuit has been deserialized
+    assert lazy_circuits.num_decoded() == 4
+    assert lazy_circuits.serialized_circuits is None
+
+    lazy_circuits = qss.serialization.LazyCircuitList(serialized_circuits, keep_payload=True)
+    assert list(lazy_circuits) == circuits
+    assert lazy_circuits.serialized_circuits == serialized_circuits
+
+    lazy_circuits = qss.serialization.LazyCircuitList(serialized_circuits)
+    new_lazy_circuits = pickle.loads(pickle.dumps(lazy_circuits))
+    assert new_lazy_circuits.num_decoded() == 4
+    assert new_lazy_circuits == circuits
+
+    lazy_circuits = qss.serialization.LazyCircuitList(qss.serialization.serialize_circuits([]))
+    assert len(lazy_circuits) == 0
+    assert lazy_circuits == []
+    assert lazy_circuits.serialized_circuits is None
+
+    with pytest.raises(ValueError, match="not a valid serialization"):
+        _ = qss.serialization.LazyCircuitList(applications_superstaq.converters.serialize("x" * 32))
+
+
+def test_lazy_object_list() -> None:
+    objects = [{"a": i} for i in range(3)]
+    serialized_objects = [applications_superstaq.converters.serialize(obj) for obj in objects]
+    lazy_objects = qss.serialization.LazyObjectList(serialized_objects)
+    assert len(lazy_objects) == 3
+    assert lazy_objects.num_decoded() == 0
+
+    assert lazy_objects[1] == {"a": 1}
+    assert lazy_objects.num_decoded() == 1
+    assert lazy_objects[-2] is lazy_objects[1]
+    assert lazy_objects[:2] == objects[:2]
+    assert lazy_objects.num_decoded() == 2
+
+    with pytest.raises(IndexError, match="out of range"):
+        _ = lazy_objects[3]
+
+    assert lazy_objects == objects
+    assert objects == lazy_objects
+    assert lazy_objects == qss.serialization.LazyObjectList(serialized_objects)
+    assert lazy_objects != objects[:2]
+    assert lazy_objects != tuple(objects)
+    assert repr(lazy_objects) == repr(objects)
+    assert lazy_objects.num_decoded() == 3
+
+    # a single serialized list is deserialized as a whole
+    lazy_objects = qss.serialization.LazyObjectList(
+        applications_superstaq.converters.serialize(objects)
+    )
+    assert lazy_objects.num_decoded() == 0
+    assert lazy_objects[2] == {"a": 2}
+    assert lazy_objects.num_decoded() == 3
+    assert lazy_objects == objects
+
+    cache = qss.caching.LRUCache(10)
+    lazy_objects = qss.serialization.LazyObjectList(serialized_objects, cache=cache)
+    other_lazy_objects = qss.serialization.LazyObjectList(serialized_objects, cache=cache)
+    assert other_lazy_objects[0] == lazy_objects[0]
+    assert cache.cache_info().hits == 1
+    assert cache.cache_info().misses == 1
+
+    # cached payloads are unpickled into distinct objects
+    assert other_lazy_objects[0] is not lazy_objects[0]
+    other_lazy_objects[0]["a"] = 3
+    assert lazy_objects[0] == {"a": 0}
+    assert qss.serialization.LazyObjectList(serialized_objects, cache=cache)[0] == {"a": 0}
+
+    new_lazy_objects = pickle.loads(pickle.dumps(lazy_objects))
+    assert new_lazy_objects.num_decoded() == 3
+    assert new_lazy_objects == objects
+    assert new_lazy_objects[0] is not lazy_objects[0]
+
+    serialized_mock = applications_superstaq.converters.serialize(mock.DEFAULT)
+    lazy_objects = qss.serialization.LazyObjectList([serialized_mock], context="my_context")
+    with mock.patch.dict("sys.modules", {"unittest": None}):
+        with pytest.raises(
+            applications_superstaq.SuperstaQModuleNotFoundException,
+            match="'my_context' requires module 'unittest'",
+        ):
+            _ = lazy_objects[0]
+
+        with pytest.raises(ModuleNotFoundError):
+            _ = qss.serialization.LazyObjectList([serialized_mock])[0]
+
+    assert lazy_objects[0] is mock.DEFAULT
+
+
+def test_compression() -> None:
+    circuit = qiskit.QuantumCircuit(3)
+    for _ in range(20):
+        circuit.append(qss.ZZSwapGate(0.1), [0, 1])
+        circuit.cx(1, 2)
+    circuits = [circuit, circuit]
+
+    serialized_circuits = qss.serialization.serialize_circuits(circuits)
+    compressed_circuits = qss.serialization.serialize_circuits(circuits, compression="zlib")
+    assert len(compressed_circuits) < len(serialized_circuits)
+    assert qss.serialization.deserialize_circuits(compressed_circuits) == circuits
+    assert qss.serialization.LazyCircuitList(compressed_circuits) == circuits
+
+    cache = qss.caching.LRUCache(10**6, sizeof=len)
+    assert (
+        qss.serialization.serialize_circuits(circuits, cache=cache, compression="zlib")
+        == compressed_circuits
+    )
+    assert (
+        qss.serialization.serialize_circuit_chunks(
+            circuits, max_circuits_per_chunk=1, compression="zlib"
+        )
+        == [(1, qss.serialization.serialize_circuits(circuit, compression="zlib"))] * 2
+    )
+
+    serialized_obj = applications_superstaq.converters.serialize({"a": [1, 2]})
+    assert qss.serialization.deserialize_object(serialized_obj) == {"a": [1, 2]}
+    compressed_obj = applications_superstaq.converters._bytes_to_str(
+        qss.serialization._compress(pickle.dumps({"a": [1, 2]}), "zlib")
+    )
+    assert qss.serialization.deserialize_object(compressed_obj) == {"a": [1, 2]}
+
+    # compressed payloads are marked explicitly, so uncompressed data is never mistaken for them
+    compressed_data = applications_superstaq.converters._str_to_bytes(compressed_circuits)
+    assert compressed_data.startswith(b"QSS-COMPRESSED:zlib\n")
+    assert qss.serialization._decompress(b"\x78\x9c data") == b"\x78\x9c data"
+
+    with pytest.raises(ValueError, match="Unsupported compression"):
+        _ = qss.serialization.serialize_circuits(circuits, compression="gzip")
+    with pytest.raises(ValueError, match="Unsupported compression 'gzip'"):
+        _ = qss.serialization._decompress(b"QSS-COMPRESSED:gzip\ndata")
+
+    with mock.patch("importlib.util.find_spec", return_value=None):
+        with pytest.raises(
+            applications_superstaq.SuperstaQModuleNotFoundException, match="zstandard"
+        ):
+            _ = qss.serialization.serialize_circuits(circuits, compression="zstd")
+        with pytest.raises(
+            applications_superstaq.SuperstaQModuleNotFoundException, match="zstandard"
+        ):
+            _ = qss.serialization._decompress(b"QSS-COMPRESSED:zstd\ndata")
+
+
+def test_zstd_compression() -> None:
+    pytest.importorskip("zstandard")
+
+    circuit = qiskit.QuantumCircuit(2)
+    circuit.append(qss.AceCR("+-"), [0, 1])
+
+    compressed_circuit = qss.serialization.serialize_circuits(circuit, compression="zstd")
+    assert applications_superstaq.converters._str_to_bytes(compressed_circuit).startswith(
+        b"QSS-COMPRESSED:zstd\n"
+    )
+    assert qss.serialization.deserialize_circuits(compressed_circuit) == [circuit]
+
+
+def test_parameter_values_serialization() -> None:
+    theta = qiskit.circuit.Parameter("theta")
+    phi = qiskit.circuit.Parameter("phi")
+    circuit = qiskit.QuantumCircuit(1)
+    circuit.rx(theta, 0)
+    circuit.rz(phi, 0)
+
+    values = np.random.uniform(size=(100, 2))
+    fields = qss.serialization.serialize_parameter_values(circuit, values)
+    assert fields["parameters"] == ["phi", "theta"]
+    deserialized_values = qss.serialization.deserialize_parameter_values(fields["parameter_values"])
+    assert np.array_equal(deserialized_values, values)
+
+    fields = qss.serialization.serialize_parameter_values(circuit, [[1, 2]], compression="zlib")
+    deserialized_values = qss.serialization.deserialize_parameter_values(fields["parameter_values"])
+    assert deserialized_values.tolist() == [[1.0, 2.0]]
+
+    for invalid_values in ([1, 2], [[1, 2, 3]], np.zeros((0, 2)), 1):
+        with pytest.raises(ValueError, match="parameter_values must be a 2D array"):
+            qss.serialization.serialize_parameter_values(circuit, invalid_values)  # type: ignore
+
+
 def test_warning_suppression() -> None:
     circuit = qiskit.QuantumCircuit(3)
     circuit.cx(2, 1)
@@ -11,12 +11,83 @@
 # Any modifications or derivative works of this code must retain this
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
-from typing import Any, List, Optional, Union
+import asyncio
+import concurrent.futures
+import itertools
+from typing import Any, Dict, List, Optional, Sequence, Tuple, Union
 
+import applications_superstaq
+import numpy as np
 import qiskit
+import requests
 
 import qiskit_superstaq as qss
 
+# Limits on the circuits submitted in a single request by `SuperstaQBackend.run` (larger batches
+# are split into several requests, uploaded concurrently by up to `MAX_UPLOAD_THREADS` threads)
+MAX_CIRCUITS_PER_REQUEST = 1000
+MAX_REQUEST_SIZE = 64 * 2**20  # characters of serialized circuits
+MAX_UPLOAD_THREADS = 4
+
+
+class SuperstaQPartialSubmissionException(applications_superstaq.SuperstaQException):
+    """An exception for batches of circuits which were only partially submitted, because some (but
+    not all) of the requests submitting them failed.
+
+    Attributes:
+        job_ids: the ID of the job created for each circuit (or binding) of the batch, or None for
+            those which were not submitted
+        errors: the exceptions raised by the failed requests
+    """
+
+    def __init__(self, job_ids: List[Optional[str]], errors: List[BaseException]) -> None:
+        num_failed = job_ids.count(None)
+        super().__init__(
+            f"{num_failed} of the {len(job_ids)} circuits could not be submitted: {errors[0]}",
+            getattr(errors[0], "status_code", None),
+        )
+        self.job_ids = job_ids
+        self.errors = errors
+
+    @property
+    def failed_indices(self) -> List[int]:
+        """The indices of the circuits (or bindings) of the batch which were not submitted."""
+        return [index for index, job_id in enumerate(self.job_ids) if job_id is None]
+
+
+def _merge_job_ids(
+    sizes: List[int], outcomes: Sequence[Union[List[str], BaseException]]
+) -> List[str]:
+    """Merges the job IDs returned by several requests (submitting `sizes[i]` circuits each).
+
+    Raises:
+        SuperstaQPartialSubmissionException: if some of the requests failed, but others created
+            jobs (whose IDs are then carried by the exception).
+        Exception: the error of the first request, if all of them failed.
+    """
+    job_ids: List[Optional[str]] = []
+    errors: List[BaseException] = []
+    for size, outcome in zip(sizes, outcomes):
+        if isinstance(outcome, SuperstaQPartialSubmissionException):
+            job_ids += outcome.job_ids
+            errors += outcome.errors
+        elif isinstance(outcome, BaseException):
+            job_ids += [None] * size
+            errors.append(outcome)
+        else:
+            job_ids += outcome
+
+    if not errors:
+        return [job_id for job_id in job_ids if job_id is not None]
+    if job_ids.count(None) == len(job_ids):
+        raise errors[0]
+    raise SuperstaQPartialSubmissionException(job_ids, errors)
+
+
+def _future_outcome(future: concurrent.futures.Future) -> Union[List[str], BaseException]:
+    exception = future.exception()
+    return future.result() if exception is None else exception
+
 
 class SuperstaQBackend(qiskit.providers.BackendV1):
     def __init__(self, provider: "qss.SuperstaQProvider", remote_host: str, backend: str) -> None:
@@ -61,23 +132,268 @@ class SuperstaQBackend(qiskit.providers.BackendV1):
         circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
         shots: int,
         ibmq_pulse: Optional[bool] = None,
+        parameter_values: Optional[Union[np.ndarray, Sequence[Sequence[float]]]] = None,
     ) -> "qss.SuperstaQJob":
+        """Submits circuit(s) to be run on this backend.
+
+        Large batches are split into several requests of at most `MAX_CIRCUITS_PER_REQUEST`
+        circuits and `MAX_REQUEST_SIZE` characters of serialized circuits each, which are uploaded
+        concurrently. Requests rejected by the server as too large are split further.
+
+        If the provider's `deduplicate_circuits` is set, repeated circuits are only submitted once,
+        and the aggregated job refers to the same sub-job at each of their positions.
+
+        If some of the requests fail while others succeed, the other requests still complete, and
+        a `SuperstaQPartialSubmissionException` carrying the IDs of the jobs that were created is
+        raised.
+
+        Args:
+            circuits: the qiskit.QuantumCircuit(s) to run
+            shots: the number of shots to run each circuit for
+            ibmq_pulse: whether to run the job using SuperstaQ's pulse-level optimizations
+            parameter_values: optional 2D array of values for the parameters of a single
+                (parameterized) circuit, with one row per binding and one column per parameter (in
+                the order of `circuits.parameters`). The circuit is then serialized once and sent
+                along with this binding table, instead of as one bound circuit per binding.
+        Returns:
+            a single qss.SuperstaQJob aggregating the jobs of all circuits (or bindings)
+        """
+        if parameter_values is not None:
+            job_ids = self._submit_parameter_values(circuits, parameter_values, shots, ibmq_pulse)
+            return qss.SuperstaQJob(self, ",".join(job_ids))
 
         if isinstance(circuits, qiskit.QuantumCircuit):
             circuits = [circuits]
 
-        qiskit_circuits = qss.serialization.serialize_circuits(circuits)
+        unique_circuits, indices = self._provider._deduplicate(circuits)
+        chunks = self._provider._serialize_circuit_chunks(
+            unique_circuits, MAX_CIRCUITS_PER_REQUEST, MAX_REQUEST_SIZE
+        )
+        try:
+            job_ids = self._submit_chunks(unique_circuits, chunks, shots, ibmq_pulse)
+        except SuperstaQPartialSubmissionException as e:
+            if indices is not None:
+                e.job_ids = [e.job_ids[index] for index in indices]
+            raise
+
+        if indices is not None:
+            # repeated circuits share the sub-job of their first occurrence
+            job_ids = [job_ids[index] for index in indices]
+
+        #  we make a virtual job_id that aggregates all of the individual jobs
+        # into a single one, that comma-separates the individual jobs:
+        job_id = ",".join(job_ids)
+        job = qss.SuperstaQJob(self, job_id)
+
+        return job
+
+    def _submit_chunks(
+        self,
+        circuits: List[qiskit.QuantumCircuit],
+        chunks: List[Tuple[int, str]],
+        shots: int,
+        ibmq_pulse: Optional[bool],
+    ) -> List[str]:
+        """Submits each chunk of serialized circuits in its own request (concurrently), returning
+        the IDs of all of the created jobs (in order).
+
+        Every chunk is submitted even if others fail, so that the IDs of the jobs which were
+        created can be reported in a `SuperstaQPartialSubmissionException`.
+        """
+        circuits_iter = iter(circuits)
+        args = [
+            (
+                list(itertools.islice(circuits_iter, num_circuits)),
+                qiskit_circuits,
+                shots,
+                ibmq_pulse,
+            )
+            for num_circuits, qiskit_circuits in chunks
+        ]
+        if len(args) == 1:
+            return self._submit_chunk(*args[0])
+
+        with concurrent.futures.ThreadPoolExecutor(min(MAX_UPLOAD_THREADS, len(args))) as executor:
+            futures = [executor.submit(self._submit_chunk, *chunk_args) for chunk_args in args]
+            outcomes = [_future_outcome(future) for future in futures]
+        return _merge_job_ids([num_circuits for num_circuits, _ in chunks], outcomes)
+
+    def _submit_chunk(
+        self,
+        circuits: List[qiskit.QuantumCircuit],
+        qiskit_circuits: str,
+        shots: int,
+        ibmq_pulse: Optional[bool],
+    ) -> List[str]:
+        """Submits a single chunk of serialized circuits, splitting it in two if the request is
+        rejected for being too large. Other errors are retried by the client."""
+        try:
+            return self._create_job({"qiskit_circuits": qiskit_circuits}, shots, ibmq_pulse)
+        except applications_superstaq.SuperstaQException as e:
+            if e.status_code != requests.codes.request_entity_too_large or len(circuits) < 2:
+                raise
+
+            chunks = self._provider._serialize_circuit_chunks(circuits, -(-len(circuits) // 2))
+            return self._submit_chunks(circuits, chunks, shots, ibmq_pulse)
 
+    def _create_job(
+        self, request_json: Dict[str, Any], shots: int, ibmq_pulse: Optional[bool]
+    ) -> List[str]:
+        """Submits a single request to the job endpoint, returning the IDs of the created jobs."""
         result = self._provider._client.create_job(
-            serialized_circuits={"qiskit_circuits": qiskit_circuits},
+            serialized_circuits=request_json,
             repetitions=shots,
             target=self.name(),
             ibmq_pulse=ibmq_pulse,
         )
+        self._provider.invalidate_metadata("balance")
+        return result["job_ids"]
 
-        #  we make a virtual job_id that aggregates all of the individual jobs
-        # into a single one, that comma-separates the individual jobs:
-        job_id = ",".join(result["job_ids"])
-        job = qss.SuperstaQJob(self, job_id)
+    def _parameter_values_requests(
+        self,
+        circuit: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        parameter_values: Union[np.ndarray, Sequence[Sequence[float]]],
+    ) -> List[Tuple[int, Dict[str, Any]]]:
+        """Builds the requests submitting a template circuit with a table of parameter bindings,
+        split into requests of at most `MAX_CIRCUITS_PER_REQUEST` bindings each.
 
-        return job
+        Returns:
+            the number of bindings and JSON body of each request
+        """
+        values = np.asarray(parameter_values, dtype=float)
+        chunks = [values]  # (invalid tables are rejected by `_parameter_values_json`)
+        if values.ndim == 2 and len(values):
+            num_chunks = -(-len(values) // MAX_CIRCUITS_PER_REQUEST)
+            chunks = np.array_split(values, num_chunks)
+
+        parameter_values_json = [
+            self._provider._parameter_values_json(circuit, chunk) for chunk in chunks
+        ]
+        qiskit_circuits = self._provider._serialize_circuits(circuit)
+        return [
+            (len(chunk), {"qiskit_circuits": qiskit_circuits, **fields})
+            for chunk, fields in zip(chunks, parameter_values_json)
+        ]
+
+    def _submit_parameter_values(
+        self,
+        circuit: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        parameter_values: Union[np.ndarray, Sequence[Sequence[float]]],
+        shots: int,
+        ibmq_pulse: Optional[bool],
+    ) -> List[str]:
+        """Submits a template circuit with a table of parameter bindings (concurrently, if it is
+        split into several requests), returning the IDs of the jobs of each binding (in order)."""
+        requests_json = self._parameter_values_requests(circuit, parameter_values)
+        if len(requests_json) == 1:
+            return self._create_job(requests_json[0][1], shots, ibmq_pulse)
+
+        num_threads = min(MAX_UPLOAD_THREADS, len(requests_json))
+        with concurrent.futures.ThreadPoolExecutor(num_threads) as executor:
+            futures = [
+                executor.submit(self._create_job, request_json, shots, ibmq_pulse)
+                for _, request_json in requests_json
+            ]
+            outcomes = [_future_outcome(future) for future in futures]
+        return _merge_job_ids([num_bindings for num_bindings, _ in requests_json], outcomes)
+
+    async def arun(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        shots: int,
+        ibmq_pulse: Optional[bool] = None,
+        parameter_values: Optional[Union[np.ndarray, Sequence[Sequence[float]]]] = None,
+    ) -> "qss.SuperstaQJob":
+        """Asynchronous counterpart of `run`."""
+        if parameter_values is not None:
+            requests_json = await self._provider._run_in_executor(
+                self._parameter_values_requests, circuits, parameter_values
+            )
+            outcomes = await asyncio.gather(
+                *(
+                    self._acreate_job(request_json, shots, ibmq_pulse)
+                    for _, request_json in requests_json
+                ),
+                return_exceptions=True,
+            )
+            job_ids = _merge_job_ids([num_bindings for num_bindings, _ in requests_json], outcomes)
+            return qss.SuperstaQJob(self, ",".join(job_ids))
+
+        if isinstance(circuits, qiskit.QuantumCircuit):
+            circuits = [circuits]
+
+        unique_circuits, indices = self._provider._deduplicate(circuits)
+        chunks = await self._provider._run_in_executor(
+            self._provider._serialize_circuit_chunks,
+            unique_circuits,
+            MAX_CIRCUITS_PER_REQUEST,
+            MAX_REQUEST_SIZE,
+        )
+        try:
+            job_ids = await self._asubmit_chunks(unique_circuits, chunks, shots, ibmq_pulse)
+        except SuperstaQPartialSubmissionException as e:
+            if indices is not None:
+                e.job_ids = [e.job_ids[index] for index in indices]
+            raise
+
+        if indices is not None:
+            job_ids = [job_ids[index] for index in indices]
+        return qss.SuperstaQJob(self, ",".join(job_ids))
+
+    async def _asubmit_chunks(
+        self,
+        circuits: List[qiskit.QuantumCircuit],
+        chunks: List[Tuple[int, str]],
+        shots: int,
+        ibmq_pulse: Optional[bool],
+    ) -> List[str]:
+        """Asynchronous counterpart of `_submit_chunks`."""
+        circuits_iter = iter(circuits)
+        outcomes = await asyncio.gather(
+            *(
+                self._asubmit_chunk(
+                    list(itertools.islice(circuits_iter, num_circuits)),
+                    qiskit_circuits,
+                    shots,
+                    ibmq_pulse,
+                )
+                for num_circuits, qiskit_circuits in chunks
+            ),
+            return_exceptions=True,
+        )
+        return _merge_job_ids([num_circuits for num_circuits, _ in chunks], outcomes)
+
+    async def _asubmit_chunk(
+        self,
+        circuits: List[qiskit.QuantumCircuit],
+        qiskit_circuits: str,
+        shots: int,
+        ibmq_pulse: Optional[bool],
+    ) -> List[str]:
+        """Asynchronous counterpart of `_submit_chunk`."""
+        try:
+            return await self._acreate_job({"qiskit_circuits": qiskit_circuits}, shots, ibmq_pulse)
+        except applications_superstaq.SuperstaQException as e:
+            if e.status_code != requests.codes.request_entity_too_large or len(circuits) < 2:
+                raise
+
+            chunks = await self._provider._run_in_executor(
+                self._provider._serialize_circuit_chunks, circuits, -(-len(circuits) // 2)
+            )
+            return await self._asubmit_chunks(circuits, chunks, shots, ibmq_pulse)
+
+    async def _acreate_job(
+        self, request_json: Dict[str, Any], shots: int, ibmq_pulse: Optional[bool]
+    ) -> List[str]:
+        """Asynchronous counterpart of `_create_job`."""
+        json_dict: Dict[str, Any] = {
+            **request_json,
+            "backend": self.name(),
+            "shots": int(shots),
+        }
+        if ibmq_pulse:
+            json_dict["ibmq_pulse"] = ibmq_pulse
+
+        result = await self._provider._apost("/jobs", json_dict)
+        self._provider.invalidate_metadata("balance")
+        return result["job_ids"]
@@ -1,5 +1,10 @@
-from unittest.mock import MagicMock
+import asyncio
+from typing import Any, Dict, List, Optional
+from unittest.mock import MagicMock, patch
 
+import applications_superstaq
+import numpy as np
+import pytest
 import qiskit
 
 import qiskit_superstaq as qss
@@ -72,6 +77,201 @@ def test_multi_circuit_run() -> None:
     assert answer == expected
 
 
+def test_arun() -> None:
+    qc = qiskit.QuantumCircuit(1, 1)
+    qc.measure(0, 0)
+    device = MockDevice()
+    requests = []
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        requests.append((endpoint, json_dict))
+        return {"job_ids": ["job_id1", "job_id2"], "status": "ready"}
+
+    device._provider._apost = mock_apost  # type: ignore
+
+    answer = asyncio.run(device.arun(circuits=[qc, qc], shots=100, ibmq_pulse=True))
+    assert answer == qss.SuperstaQJob(device, "job_id1,job_id2")
+
+    # (like the synchronous client, a false ibmq_pulse is not sent)
+    answer = asyncio.run(device.arun(circuits=qc, shots=100, ibmq_pulse=False))
+    assert [json_dict["shots"] for _, json_dict in requests] == [100, 100]
+    assert requests[0][0] == "/jobs"
+    assert requests[0][1]["backend"] == "mock_backend"
+    assert requests[0][1]["ibmq_pulse"] is True
+    assert "ibmq_pulse" not in requests[1][1]
+    assert qss.serialization.deserialize_circuits(requests[1][1]["qiskit_circuits"]) == [qc]
+
+
+def _make_circuits(num_circuits: int) -> List[qiskit.QuantumCircuit]:
+    circuits = []
+    for i in range(num_circuits):
+        qc = qiskit.QuantumCircuit(1, 1, name=f"qc{i}")
+        qc.rx(0.1 * i, 0)
+        qc.measure(0, 0)
+        circuits.append(qc)
+    return circuits
+
+
+def _mock_submission(
+    serialized_circuits: str, max_circuits: int, failing_circuit: Optional[str] = None
+) -> List[str]:
+    circuits = qss.serialization.deserialize_circuits(serialized_circuits)
+    if len(circuits) > max_circuits:
+        raise applications_superstaq.SuperstaQException("Request entity too large", 413)
+    if failing_circuit in [qc.name for qc in circuits]:
+        raise applications_superstaq.SuperstaQException("error", 400)
+    return [f"{qc.name}_job" for qc in circuits]
+
+
+@patch("qiskit_superstaq.superstaq_backend.MAX_CIRCUITS_PER_REQUEST", 2)
+def test_chunked_run() -> None:
+    device = MockDevice()
+    circuits = _make_circuits(5)
+    expected = qss.SuperstaQJob(device, ",".join(f"qc{i}_job" for i in range(5)))
+
+    mock_client = MagicMock()
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 2)
+    }
+    device._provider._client = mock_client
+
+    assert device.run(circuits, shots=100) == expected
+    assert mock_client.create_job.call_count == 3
+
+    # requests rejected for being too large are split
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 1)
+    }
+    mock_client.create_job.reset_mock()
+    assert device.run(circuits, shots=100) == expected
+    assert mock_client.create_job.call_count == 7
+
+    # (but single circuits can't be split)
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 0)
+    }
+    with pytest.raises(applications_superstaq.SuperstaQException, match="too large"):
+        _ = device.run(circuits, shots=100)
+
+    mock_client.create_job.side_effect = applications_superstaq.SuperstaQException("error", 400)
+    with pytest.raises(applications_superstaq.SuperstaQException, match="error") as e:
+        _ = device.run(circuits, shots=100)
+    assert not isinstance(e.value, qss.SuperstaQPartialSubmissionException)
+
+    # the other chunks are still submitted if one of them fails, and their job IDs are reported
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 2, "qc2")
+    }
+    mock_client.create_job.reset_mock()
+    with pytest.raises(qss.SuperstaQPartialSubmissionException, match="2 of the 5") as e:
+        _ = device.run(circuits, shots=100)
+    assert mock_client.create_job.call_count == 3
+    assert e.value.job_ids == ["qc0_job", "qc1_job", None, None, "qc4_job"]
+    assert e.value.failed_indices == [2, 3]
+    assert e.value.status_code == 400
+    assert len(e.value.errors) == 1
+
+    # (including within chunks which were split for being too large)
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 1, "qc2")
+    }
+    with pytest.raises(qss.SuperstaQPartialSubmissionException, match="1 of the 5") as e:
+        _ = device.run(circuits, shots=100)
+    assert e.value.job_ids == ["qc0_job", "qc1_job", None, "qc3_job", "qc4_job"]
+
+    # (and they are mapped back to the original batch if it was deduplicated)
+    device._provider.deduplicate_circuits = True
+    with pytest.raises(qss.SuperstaQPartialSubmissionException) as e:
+        _ = device.run(circuits + circuits[2:4], shots=100)
+    assert e.value.failed_indices == [2, 5]
+    device._provider.deduplicate_circuits = False
+
+    # chunks are also limited by their size
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 2)
+    }
+    mock_client.create_job.reset_mock()
+    max_size = len(qss.serialization.serialize_circuits(circuits[:1])) + 1
+    with patch("qiskit_superstaq.superstaq_backend.MAX_REQUEST_SIZE", max_size):
+        assert device.run(circuits, shots=100) == expected
+    assert mock_client.create_job.call_count == 5
+
+
+def test_deduplicated_run() -> None:
+    device = MockDevice()
+    circuits = _make_circuits(3)
+    circuits = [circuits[0], circuits[1], circuits[0], circuits[2], circuits[1]]
+    expected = qss.SuperstaQJob(device, "qc0_job,qc1_job,qc0_job,qc2_job,qc1_job")
+
+    mock_client = MagicMock()
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: {
+        "job_ids": _mock_submission(serialized_circuits["qiskit_circuits"], 5)
+    }
+    device._provider._client = mock_client
+
+    # circuits are only deduplicated if the provider is configured to
+    assert device.run(circuits, shots=100) == qss.SuperstaQJob(
+        device, ",".join(f"{qc.name}_job" for qc in circuits)
+    )
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert len(qss.serialization.deserialize_circuits(serialized_circuits["qiskit_circuits"])) == 5
+
+    device._provider.deduplicate_circuits = True
+    assert device.run(circuits, shots=100) == expected
+    serialized_circuits = mock_client.create_job.call_args[1]["serialized_circuits"]
+    assert qss.serialization.deserialize_circuits(serialized_circuits["qiskit_circuits"]) == [
+        circuits[0],
+        circuits[1],
+        circuits[3],
+    ]
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return {"job_ids": _mock_submission(json_dict["qiskit_circuits"], 5)}
+
+    device._provider._apost = mock_apost  # type: ignore
+    assert asyncio.run(device.arun(circuits, shots=100)) == expected
+
+
+@patch("qiskit_superstaq.superstaq_backend.MAX_CIRCUITS_PER_REQUEST", 2)
+def test_chunked_arun() -> None:
+    device = MockDevice()
+    circuits = _make_circuits(5)
+    expected = qss.SuperstaQJob(device, ",".join(f"qc{i}_job" for i in range(5)))
+    requests = []
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        requests.append(json_dict)
+        return {
+            "job_ids": _mock_submission(json_dict["qiskit_circuits"], max_circuits, failing_circuit)
+        }
+
+    device._provider._apost = mock_apost  # type: ignore
+
+    max_circuits = 2
+    failing_circuit = None
+    assert asyncio.run(device.arun(circuits, shots=100)) == expected
+    assert len(requests) == 3
+
+    max_circuits = 1
+    assert asyncio.run(device.arun(circuits, shots=100)) == expected
+    assert len(requests) == 10
+
+    max_circuits = 0
+    with pytest.raises(applications_superstaq.SuperstaQException, match="too large"):
+        _ = asyncio.run(device.arun(circuits, shots=100))
+
+    max_circuits = 2
+    failing_circuit = "qc2"
+    with pytest.raises(qss.SuperstaQPartialSubmissionException) as e:
+        _ = asyncio.run(device.arun(circuits, shots=100))
+    assert e.value.job_ids == ["qc0_job", "qc1_job", None, None, "qc4_job"]
+
+    device._provider.deduplicate_circuits = True
+    with pytest.raises(qss.SuperstaQPartialSubmissionException) as e:
+        _ = asyncio.run(device.arun(circuits + circuits[:1], shots=100))
+    assert e.value.job_ids == ["qc0_job", "qc1_job", None, None, "qc4_job", "qc0_job"]
+
+
 def test_eq() -> None:
 
     assert MockDevice() != 3
@@ -90,3 +290,65 @@ def test_eq() -> None:
         provider=provider, backend="ibmq_qasm_simulator", remote_host=qss.API_URL
     )
     assert backend1 == backend3
+
+
+@patch("qiskit_superstaq.superstaq_backend.MAX_CIRCUITS_PER_REQUEST", 2)
+def test_run_parameter_values() -> None:
+    device = MockDevice()
+    theta = qiskit.circuit.Parameter("theta")
+    qc = qiskit.QuantumCircuit(1, 1)
+    qc.rx(theta, 0)
+    qc.measure(0, 0)
+    values = np.array([[0.1], [0.2], [0.3]])
+    expected = qss.SuperstaQJob(device, "job_0.1,job_0.2,job_0.3")
+
+    def mock_submission(json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        assert qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"]) == [qc]
+        assert json_dict["parameters"] == ["theta"]
+        values = qss.serialization.deserialize_parameter_values(json_dict["parameter_values"])
+        return {"job_ids": [f"job_{value}" for value, in values]}
+
+    mock_client = MagicMock()
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: mock_submission(
+        serialized_circuits
+    )
+    device._provider._client = mock_client
+    assert device.run(qc, shots=100, parameter_values=values) == expected
+    assert mock_client.create_job.call_count == 2
+
+    def failing_submission(serialized_circuits: Dict[str, Any], **_: Any) -> Dict[str, Any]:
+        if "0.3" in str(mock_submission(serialized_circuits)):
+            raise applications_superstaq.SuperstaQException("error", 400)
+        return mock_submission(serialized_circuits)
+
+    mock_client.create_job.side_effect = failing_submission
+    with pytest.raises(qss.SuperstaQPartialSubmissionException) as e:
+        _ = device.run(qc, shots=100, parameter_values=values)
+    assert e.value.job_ids == ["job_0.1", "job_0.2", None]
+
+    mock_client.create_job.side_effect = lambda serialized_circuits, **_: mock_submission(
+        serialized_circuits
+    )
+
+    mock_client.create_job.reset_mock()
+    assert device.run(qc, shots=100, parameter_values=[[0.1]]) == qss.SuperstaQJob(
+        device, "job_0.1"
+    )
+    mock_client.create_job.assert_called_once()
+
+    requests = []
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        requests.append(json_dict)
+        return mock_submission(json_dict)
+
+    device._provider._apost = mock_apost  # type: ignore
+    assert asyncio.run(device.arun(qc, shots=100, parameter_values=values)) == expected
+    assert len(requests) == 2
+    assert requests[0]["backend"] == "mock_backend"
+
+    with pytest.raises(ValueError, match="single"):
+        _ = device.run([qc, qc], shots=100, parameter_values=values)
+
+    with pytest.raises(ValueError, match="2D array"):
+        _ = device.run(qc, shots=100, parameter_values=np.zeros((0, 1)))
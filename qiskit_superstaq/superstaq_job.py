@@ -12,14 +12,25 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import asyncio
+import concurrent.futures
+import itertools
+import json
 import time
-from typing import Any, Dict, List, Optional
+from typing import Any, AsyncIterator, Dict, Iterator, List, Optional, Tuple
 
+import applications_superstaq
 import qiskit
 import requests
 
 import qiskit_superstaq as qss
 
+# Maximum number of sub-jobs polled simultaneously when waiting for the results of a batch
+MAX_POLLING_THREADS = 16
+
+# Maximum number of sub-job IDs sent in a single request to the bulk job endpoint
+MAX_JOB_IDS_PER_REQUEST = 200
+
 
 class SuperstaQJob(qiskit.providers.JobV1):
     def __init__(
@@ -45,44 +56,249 @@ class SuperstaQJob(qiskit.providers.JobV1):
 
         return self._job_id == other._job_id
 
-    def _wait_for_results(self, timeout: Optional[float] = None, wait: float = 5) -> List[Dict]:
+    def _fetch_job(self, job_id: str) -> requests.Response:
+        get_url = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{job_id}"
+        return self._backend._provider._session.get(
+            get_url, verify=(self._backend.remote_host == qss.API_URL)
+        )
 
-        result_list: List[Dict] = []
-        job_ids = self._job_id.split(",")  # separate aggregated job_ids
+    def _result_store_key(self, job_id: str) -> str:
+        return f"{self._backend.remote_host}/job/{job_id}"
+
+    def _get_stored_job(self, job_id: str) -> Optional[Dict]:
+        """Returns the data of a finished sub-job from the provider's result store (if any)."""
+        result_store = self._backend._provider.result_store
+        if result_store is None:
+            return None
 
-        for jid in job_ids:
-            start_time = time.time()
-            result = None
+        job_data = result_store.get(self._result_store_key(job_id))
+        return None if job_data is None else json.loads(job_data)
 
-            while True:
-                elapsed = time.time() - start_time
+    def _store_job(self, job_id: str, job: Dict) -> None:
+        """Saves the data of a sub-job in the provider's result store (if any), if it is done."""
+        result_store = self._backend._provider.result_store
+        if result_store is not None and job["status"] == "Done":
+            result_store.put(self._result_store_key(job_id), json.dumps(job).encode())
 
-                if timeout and elapsed >= timeout:
-                    raise qiskit.providers.JobTimeoutError(
-                        "Timed out waiting for result"
-                    )  # pragma: no cover b/c don't want slow test or mocking time
+    def _get_jobs(self, job_ids: List[str]) -> List[Dict]:
+        """Returns the data of several sub-jobs, serving finished sub-jobs from the provider's
+        result store when possible, and fetching all others with `_fetch_jobs`.
 
-                getstr = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{jid}"
-                result = requests.get(
-                    getstr,
-                    headers=self._backend._provider._http_headers(),
+        Args:
+            job_ids: list of the (non-aggregated) IDs of the sub-jobs
+        Returns:
+            list of the JSON data of each sub-job, in the same order as `job_ids`
+        """
+        jobs: Dict[str, Dict] = {}
+        for job_id in job_ids:
+            stored_job = self._get_stored_job(job_id)
+            if stored_job is not None:
+                jobs[job_id] = stored_job
+
+        missing_ids = list(dict.fromkeys(job_id for job_id in job_ids if job_id not in jobs))
+        if missing_ids:
+            for job_id, job in zip(missing_ids, self._fetch_jobs(missing_ids)):
+                self._store_job(job_id, job)
+                jobs[job_id] = job
+
+        return [jobs[job_id] for job_id in job_ids]
+
+    def _fetch_jobs(self, job_ids: List[str]) -> List[Dict]:
+        """Fetches the data of several sub-jobs in as few round trips as possible.
+
+        The bulk job endpoint is queried with (chunks of) all of the given job IDs at once. If the
+        server does not provide this endpoint, the sub-jobs are instead fetched concurrently.
+
+        Args:
+            job_ids: list of the (non-aggregated) IDs of the sub-jobs to fetch
+        Returns:
+            list of the JSON data of each sub-job, in the same order as `job_ids`
+        """
+        provider = self._backend._provider
+        if provider._use_bulk_job_endpoint:
+            post_url = f"{self._backend.remote_host}/{qss.API_VERSION}/get_jobs"
+            jobs: Dict[str, Dict] = {}
+            for start in range(0, len(job_ids), MAX_JOB_IDS_PER_REQUEST):
+                end = start + MAX_JOB_IDS_PER_REQUEST
+                response = provider._session.post(
+                    post_url,
+                    json={"job_ids": job_ids[start:end]},
                     verify=(self._backend.remote_host == qss.API_URL),
-                ).json()
+                )
+                if response.status_code in (
+                    requests.codes.not_found,
+                    requests.codes.method_not_allowed,
+                ):
+                    provider._use_bulk_job_endpoint = False
+                    break
+                if not response.ok:
+                    raise applications_superstaq.SuperstaQException(
+                        f"Request to /get_jobs failed with status {response.status_code}: "
+                        f"{response.text}",
+                        response.status_code,
+                    )
+                jobs.update(response.json())
+            else:
+                return [jobs[job_id] for job_id in job_ids]
+
+        max_workers = min(len(job_ids), MAX_POLLING_THREADS)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return [response.json() for response in executor.map(self._fetch_job, job_ids)]
+
+    def _polling_strategy(
+        self, wait: Optional[float], polling: Optional["qss.polling.PollingStrategy"]
+    ) -> "qss.polling.PollingStrategy":
+        if wait is not None:
+            return qss.polling.FixedInterval(wait)
+        return polling or self._backend._provider.polling_strategy
+
+    def _poll_pending(
+        self, executor: concurrent.futures.Executor, job_ids: List[str], pending: List[int]
+    ) -> Tuple[List[Tuple[int, Dict]], List[int], Optional[float], Optional[int]]:
+        """Polls all pending sub-jobs once (concurrently).
+
+        Returns:
+            the (index, result) pairs of the sub-jobs which are done, the indices of the sub-jobs
+            which are still pending, and the longest `Retry-After` delay and smallest queue
+            position reported by the server for the latter (if any)
+        """
+        finished = []
+        still_pending = []
+        retry_afters = []
+        queue_positions = []
+
+        # a sub-job may appear several times in the batch (if it was deduplicated)
+        pending_ids = list(dict.fromkeys(job_ids[i] for i in pending))
+        responses = dict(zip(pending_ids, executor.map(self._fetch_job, pending_ids)))
+        for index in pending:
+            response = responses[job_ids[index]]
+            result = response.json()
+            if result["status"] == "Done":
+                self._store_job(job_ids[index], result)
+                finished.append((index, result))
+                continue
+            if result["status"] == "Error":
+                raise qiskit.providers.JobError("API returned error:\n" + str(result))
+
+            still_pending.append(index)
+            retry_after = qss.polling.parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                retry_afters.append(retry_after)
+            if result.get("queue_position") is not None:
+                queue_positions.append(result["queue_position"])
+
+        return (
+            finished,
+            still_pending,
+            max(retry_afters, default=None),
+            min(queue_positions, default=None),
+        )
 
-                if result["status"] == "Done":
+    def _iter_job_results(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> Iterator[Tuple[int, Dict]]:
+        """Yields (index, result) pairs for each sub-job as soon as it is done."""
+
+        polling = self._polling_strategy(wait, polling)
+        job_ids = self._job_id.split(",")  # separate aggregated job_ids
+
+        # all sub-jobs share a single deadline, and every round of polling queries the pending
+        # sub-jobs concurrently (using a bounded number of threads)
+        deadline = time.time() + timeout if timeout else None
+        pending = []
+        for index, job_id in enumerate(job_ids):
+            stored_result = self._get_stored_job(job_id)
+            if stored_result is None:
+                pending.append(index)
+            else:
+                yield index, stored_result
+
+        if not pending:
+            return
+
+        max_workers = min(len(pending), MAX_POLLING_THREADS)
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for num_polls in itertools.count(1):
+                if deadline and time.time() >= deadline:
+                    raise qiskit.providers.JobTimeoutError("Timed out waiting for result")
+
+                finished, pending, retry_after, queue_position = self._poll_pending(
+                    executor, job_ids, pending
+                )
+                yield from finished
+                if not pending:
                     break
-                if result["status"] == "Error":
-                    raise qiskit.providers.JobError("API returned error:\n" + str(result))
-                time.sleep(wait)  # pragma: no cover b/c don't want slow test or mocking time
 
-            result_list.append(result)
+                wait_time = polling.wait_time(num_polls, retry_after, queue_position)
+                if deadline:
+                    wait_time = min(wait_time, max(deadline - time.time(), 0))
+                time.sleep(wait_time)
 
-        return result_list
+    def _wait_for_results(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> List[Dict]:
+        results: List[Dict] = [{}] * len(self._job_id.split(","))
+        for index, result in self._iter_job_results(timeout, wait, polling):
+            results[index] = result
+        return results
+
+    def iter_results(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> Iterator[Tuple[int, Dict[str, int]]]:
+        """Yields the counts of each circuit as soon as its sub-job is done.
+
+        This allows post-processing the results of large batches while the remaining circuits
+        are still queued or running:
+
+            for index, counts in job.iter_results():
+                ...
+
+        Args:
+            timeout: the maximum number of seconds to wait for all of the sub-jobs (if falsy, wait
+                indefinitely)
+            wait: if provided, poll at this fixed interval (in seconds) instead of using a polling
+                strategy
+            polling: the polling strategy deciding how long to wait between polls. Defaults to the
+                provider's `polling_strategy`.
+        Yields:
+            (index, counts) tuples, where index is the position of the circuit in the submitted
+            batch, in the order in which sub-jobs finish
+        """
+        for index, result in self._iter_job_results(timeout, wait, polling):
+            yield index, result["samples"]
 
-    def result(self, timeout: Optional[float] = None, wait: float = 5) -> qiskit.result.Result:
-        # Get the result data of a circuit.
-        results = self._wait_for_results(timeout, wait)
+    def result(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> qiskit.result.Result:
+        """Waits for all sub-jobs to finish, and returns their results.
+
+        Args:
+            timeout: the maximum number of seconds to wait for all of the sub-jobs (if falsy, wait
+                indefinitely)
+            wait: if provided, poll at this fixed interval (in seconds) instead of using a polling
+                strategy
+            polling: the polling strategy deciding how long to wait between polls. Defaults to the
+                provider's `polling_strategy`.
+        Returns:
+            a qiskit Result object, with one experiment result per circuit in the batch
+        """
+        results = self._wait_for_results(timeout, wait, polling)
+        return self._make_result(results)
 
+    def _make_result(self, results: List[Dict]) -> qiskit.result.Result:
         # create list of result dictionaries
         results_list = []
         for result in results:
@@ -101,6 +317,145 @@ class SuperstaQJob(qiskit.providers.JobV1):
             }
         )
 
+    def compact_result(
+        self,
+        timeout: Optional[float] = None,
+        wait: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> "qss.compact_result.CompactResult":
+        """Waits for all sub-jobs to finish, and returns their results in compact form.
+
+        Unlike `result`, this doesn't build a dictionary of counts for every circuit. The counts
+        of each circuit are instead stored as arrays of (packed) outcomes and their counts, which
+        can be marginalized and turned into expectation values efficiently. The equivalent qiskit
+        Result is only built when requested via `CompactResult.to_result`.
+
+        Args:
+            timeout: the maximum number of seconds to wait for all of the sub-jobs (if falsy, wait
+                indefinitely)
+            wait: if provided, poll at this fixed interval (in seconds) instead of using a polling
+                strategy
+            polling: the polling strategy deciding how long to wait between polls. Defaults to the
+                provider's `polling_strategy`.
+        Returns:
+            a qss.compact_result.CompactResult, with the counts of each circuit in the batch
+        """
+        results = self._wait_for_results(timeout, wait, polling)
+        return self._make_compact_result(results)
+
+    def _make_compact_result(self, results: List[Dict]) -> "qss.compact_result.CompactResult":
+        return qss.compact_result.CompactResult(
+            [qss.compact_result.CompactCounts.from_counts(result["samples"]) for result in results],
+            [result["shots"] for result in results],
+            job_id=self._job_id,
+            backend_name=self._backend._configuration.backend_name,
+            backend_version=self._backend._configuration.backend_version,
+        )
+
+    async def _apoll_job(
+        self, index: int, job_id: str, polling: "qss.polling.PollingStrategy"
+    ) -> Tuple[int, Dict]:
+        """Asynchronously polls a single sub-job until it is done."""
+        get_url = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{job_id}"
+        verify = self._backend.remote_host == qss.API_URL
+
+        stored_result = self._get_stored_job(job_id)
+        if stored_result is not None:
+            return index, stored_result
+
+        num_polls = 0
+        while True:
+            num_polls += 1
+            status_code, headers, result = await self._backend._provider._arequest(
+                "GET", get_url, verify=verify
+            )
+            if status_code != requests.codes.ok or result["status"] == "Error":
+                raise qiskit.providers.JobError("API returned error:\n" + str(result))
+            if result["status"] == "Done":
+                self._store_job(job_id, result)
+                return index, result
+
+            retry_after = qss.polling.parse_retry_after(headers.get("Retry-After"))
+            await asyncio.sleep(
+                polling.wait_time(num_polls, retry_after, result.get("queue_position"))
+            )
+
+    async def _aiter_results(
+        self, timeout: Optional[float], polling: Optional["qss.polling.PollingStrategy"]
+    ) -> AsyncIterator[Tuple[int, Dict]]:
+        polling = self._polling_strategy(None, polling)
+        job_ids = self._job_id.split(",")  # separate aggregated job_ids
+
+        # a sub-job may appear several times in the batch (if it was deduplicated)
+        indices: Dict[str, List[int]] = {}
+        for index, job_id in enumerate(job_ids):
+            indices.setdefault(job_id, []).append(index)
+
+        # every sub-job is polled in its own task, sharing the deadline of as_completed()
+        tasks = [
+            asyncio.ensure_future(self._apoll_job(job_indices[0], job_id, polling))
+            for job_id, job_indices in indices.items()
+        ]
+        try:
+            for next_result in asyncio.as_completed(tasks, timeout=timeout or None):
+                try:
+                    index, result = await next_result
+                except asyncio.TimeoutError:
+                    raise qiskit.providers.JobTimeoutError("Timed out waiting for result")
+                for job_index in indices[job_ids[index]]:
+                    yield job_index, result
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def aresult(
+        self,
+        timeout: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> qiskit.result.Result:
+        """Asynchronous counterpart of `result`.
+
+        All sub-jobs are polled concurrently in the running event loop, without using threads.
+        """
+        results: List[Dict] = [{}] * len(self._job_id.split(","))
+        async for index, result in self._aiter_results(timeout, polling):
+            results[index] = result
+        return self._make_result(results)
+
+    async def acompact_result(
+        self,
+        timeout: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> "qss.compact_result.CompactResult":
+        """Asynchronous counterpart of `compact_result`."""
+        results: List[Dict] = [{}] * len(self._job_id.split(","))
+        async for index, result in self._aiter_results(timeout, polling):
+            results[index] = result
+        return self._make_compact_result(results)
+
+    async def aresults(
+        self,
+        timeout: Optional[float] = None,
+        polling: Optional["qss.polling.PollingStrategy"] = None,
+    ) -> AsyncIterator[Tuple[int, Dict[str, int]]]:
+        """Asynchronously yields the counts of each circuit as soon as its sub-job is done.
+
+        Usage:
+            async for index, counts in job.aresults():
+                ...
+
+        Args:
+            timeout: the maximum number of seconds to wait for all of the sub-jobs (if falsy, wait
+                indefinitely)
+            polling: the polling strategy deciding how long to wait between polls. Defaults to the
+                provider's `polling_strategy`.
+        Yields:
+            (index, counts) tuples, where index is the position of the circuit in the submitted
+            batch, in the order in which sub-jobs finish
+        """
+        async for index, result in self._aiter_results(timeout, polling):
+            yield index, result["samples"]
+
     def status(self) -> qiskit.providers.jobstatus.JobStatus:
         """Query for the job status."""
 
@@ -111,15 +466,8 @@ class SuperstaQJob(qiskit.providers.JobV1):
         # when we have multiple jobs, we will take the "worst status" among the jobs
         # For example, if any of the jobs are still queued, we report Queued as the status
         # for the entire batch.
-        for job_id in job_id_list:
-            get_url = f"{self._backend.remote_host}/{qss.API_VERSION}/job/{job_id}"
-            result = requests.get(
-                get_url,
-                headers=self._backend._provider._http_headers(),
-                verify=(self._backend.remote_host == qss.API_URL),
-            )
-
-            temp_status = result.json()["status"]
+        for job in self._get_jobs(job_id_list):
+            temp_status = job["status"]
 
             if temp_status == "Queued":
                 status = "Queued"
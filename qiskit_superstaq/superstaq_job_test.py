@@ -1,6 +1,11 @@
+import asyncio
 import json
-from typing import Any, Dict
+import pathlib
+from typing import Any, Dict, List, Optional, Tuple
+from unittest import mock
+from unittest.mock import MagicMock
 
+import applications_superstaq
 import pytest
 import qiskit
 import requests
@@ -16,6 +21,8 @@ class MockConfiguration:
 class MockProvider(qss.SuperstaQProvider):
     def __init__(self) -> None:
         self.api_key = "very.tech"
+        self._session = requests.Session()
+        self.polling_strategy = qss.polling.FixedInterval(0)
 
 
 class MockDevice(qss.SuperstaQBackend):
@@ -43,38 +50,156 @@ class MockJobs(qss.SuperstaQJob):
 
 
 class MockResponse:
-    def __init__(self, status_str: str) -> None:
-        self.content = json.dumps({"status": status_str, "samples": None, "shots": 100})
+    def __init__(
+        self,
+        status_str: str,
+        headers: Optional[Dict[str, str]] = None,
+        queue_position: Optional[int] = None,
+    ) -> None:
+        job_data = {"status": status_str, "samples": None, "shots": 100}
+        if queue_position is not None:
+            job_data["queue_position"] = queue_position
+        self.content = json.dumps(job_data)
+        self.status_code = requests.codes.ok
+        self.headers = headers or {}
 
     def json(self) -> Dict:
         return json.loads(self.content)
 
 
+class MockBulkResponse:
+    def __init__(self, statuses: Dict[str, str]) -> None:
+        self.content = json.dumps(
+            {
+                job_id: {"status": status_str, "samples": None, "shots": 100}
+                for job_id, status_str in statuses.items()
+            }
+        )
+        self.status_code = requests.codes.ok
+        self.ok = True
+
+    def json(self) -> Dict:
+        return json.loads(self.content)
+
+
+class MockNotFoundResponse:
+    status_code = requests.codes.not_found
+
+
 def test_wait_for_results(monkeypatch: Any) -> None:
 
     job = MockJob()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
     assert job._wait_for_results() == [{"status": "Done", "samples": None, "shots": 100}]
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Error"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Error"))
 
     with pytest.raises(qiskit.providers.JobError, match="API returned error"):
         job._wait_for_results()
 
     jobs = MockJobs()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
     assert jobs._wait_for_results() == [
         {"status": "Done", "samples": None, "shots": 100},
         {"status": "Done", "samples": None, "shots": 100},
     ]
 
 
+def test_wait_for_results_polls_until_done(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+    num_polls = {"123abc": 0, "456def": 0}
+
+    def mock_get(_: requests.Session, url: str, **__: Any) -> MockResponse:
+        job_id = url.split("/")[-1]
+        num_polls[job_id] += 1
+        if job_id == "456def" and num_polls[job_id] < 3:
+            return MockResponse("Running")
+        return MockResponse("Done")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    assert jobs._wait_for_results(wait=0) == [
+        {"status": "Done", "samples": None, "shots": 100},
+        {"status": "Done", "samples": None, "shots": 100},
+    ]
+
+    # finished sub-jobs are not polled again
+    assert num_polls == {"123abc": 1, "456def": 3}
+
+
+def test_wait_for_results_timeout(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Queued"))
+    with pytest.raises(qiskit.providers.JobTimeoutError, match="Timed out"):
+        jobs._wait_for_results(timeout=0.05, wait=0.01)
+
+
+def test_wait_for_results_polling_strategy(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+    responses = {
+        "123abc": [
+            MockResponse("Queued", {"Retry-After": "0.02"}, queue_position=3),
+            MockResponse("Running"),
+            MockResponse("Done"),
+        ],
+        "456def": [MockResponse("Running", {"Retry-After": "0.01"}), MockResponse("Done")],
+    }
+    monkeypatch.setattr(
+        requests.Session, "get", lambda _, url, **__: responses[url.split("/")[-1]].pop(0)
+    )
+
+    mock_strategy = MagicMock(spec=qss.polling.PollingStrategy)
+    mock_strategy.wait_time.return_value = 0
+    assert len(jobs._wait_for_results(polling=mock_strategy)) == 2
+    assert mock_strategy.wait_time.call_args_list == [
+        mock.call(1, 0.02, 3),
+        mock.call(2, None, None),
+    ]
+
+    # the provider's strategy is used by default
+    responses["123abc"] = [MockResponse("Running"), MockResponse("Done")]
+    responses["456def"] = [MockResponse("Done")]
+    jobs._backend._provider.polling_strategy = mock_strategy
+    assert len(jobs.result().results) == 2
+    mock_strategy.wait_time.assert_called_with(1, None, None)
+
+    # an explicit wait overrides polling strategies
+    responses["123abc"] = [MockResponse("Running"), MockResponse("Done")]
+    responses["456def"] = [MockResponse("Done")]
+    mock_strategy.reset_mock()
+    assert len(jobs.result(wait=0, polling=mock_strategy).results) == 2
+    mock_strategy.wait_time.assert_not_called()
+
+
+def test_iter_results(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+    num_polls = {"123abc": 0, "456def": 0}
+
+    def mock_get(_: requests.Session, url: str, **__: Any) -> MockResponse:
+        job_id = url.split("/")[-1]
+        num_polls[job_id] += 1
+        if job_id == "123abc" and num_polls[job_id] < 2:
+            return MockResponse("Running")
+        return MockResponse("Done")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    results = jobs.iter_results()
+    assert next(results) == (1, None)
+    assert num_polls == {"123abc": 1, "456def": 1}
+
+    # the remaining sub-job is only polled again when the next result is requested
+    assert next(results) == (0, None)
+    assert num_polls == {"123abc": 2, "456def": 1}
+    assert next(results, "exhausted") == "exhausted"
+
+
 def test_result(monkeypatch: Any) -> None:
     job = MockJob()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
 
     expected_results = [{"success": True, "shots": 100, "data": {"counts": None}}]
 
@@ -95,17 +220,263 @@ def test_result(monkeypatch: Any) -> None:
     assert ans.job_id == expected.job_id
 
 
+def test_compact_result(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+    samples = {"123abc": {"00": 40, "11": 60}, "456def": {"0 1": 100}}
+
+    def mock_get(_: Any, url: str, **__: Any) -> MockResponse:
+        response = MockResponse("Done")
+        job_id = url.split("/")[-1]
+        response.content = json.dumps({"status": "Done", "samples": samples[job_id], "shots": 100})
+        return response
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+
+    result = jobs.compact_result()
+    assert [counts.to_dict() for counts in result] == [samples["123abc"], samples["456def"]]
+    assert result.shots == [100, 100]
+    assert result.expectation_values([0]).tolist() == [-0.2, -1.0]
+    assert result.to_result().get_counts() == jobs.result().get_counts()
+    assert result.to_result().job_id == "123abc,456def"
+    assert result.to_result().backend_name == "superstaq_backend"
+
+    async def mock_arequest(method: str, url: str, **_: Any) -> Any:
+        job_id = url.split("/")[-1]
+        return requests.codes.ok, {}, {"status": "Done", "samples": samples[job_id], "shots": 100}
+
+    jobs._backend._provider._arequest = mock_arequest  # type: ignore
+    result = asyncio.run(jobs.acompact_result())
+    assert [counts.to_dict() for counts in result] == [samples["123abc"], samples["456def"]]
+
+
 def test_status(monkeypatch: Any) -> None:
     job = MockJob()
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Queued"))
+    # fall back to per-ID requests when there is no bulk job endpoint
+    monkeypatch.setattr(requests.Session, "post", lambda *_, **__: MockNotFoundResponse())
+
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Queued"))
     assert job.status() == qiskit.providers.JobStatus.QUEUED
+    assert not job._backend._provider._use_bulk_job_endpoint
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Running"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Running"))
     assert job.status() == qiskit.providers.JobStatus.RUNNING
 
-    monkeypatch.setattr(requests, "get", lambda *_, **__: MockResponse("Done"))
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
+    assert job.status() == qiskit.providers.JobStatus.DONE
+
+
+def test_bulk_status(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+    monkeypatch.setattr(qss.superstaq_job, "MAX_JOB_IDS_PER_REQUEST", 1)
+
+    statuses = {"123abc": "Done", "456def": "Done"}
+    requested_ids = []
+
+    def mock_post(*_: Any, **kwargs: Any) -> MockBulkResponse:
+        job_ids = kwargs["json"]["job_ids"]
+        requested_ids.append(job_ids)
+        return MockBulkResponse({job_id: statuses[job_id] for job_id in job_ids})
+
+    monkeypatch.setattr(requests.Session, "post", mock_post)
+    monkeypatch.setattr(requests.Session, "get", None)  # individual jobs should never be requested
+
+    assert jobs.status() == qiskit.providers.JobStatus.DONE
+    assert requested_ids == [["123abc"], ["456def"]]
+
+    statuses["456def"] = "Running"
+    assert jobs.status() == qiskit.providers.JobStatus.RUNNING
+
+    statuses["123abc"] = "Queued"
+    assert jobs.status() == qiskit.providers.JobStatus.QUEUED
+    assert jobs._backend._provider._use_bulk_job_endpoint
+
+
+def test_bulk_status_error(monkeypatch: Any) -> None:
+    jobs = MockJobs()
+
+    error_response = MagicMock(ok=False, status_code=500, text="Internal Server Error")
+    monkeypatch.setattr(requests.Session, "post", lambda *_, **__: error_response)
+    monkeypatch.setattr(requests.Session, "get", None)  # no fallback to individual requests
+
+    with pytest.raises(applications_superstaq.SuperstaQException, match="status 500") as e:
+        jobs.status()
+    assert e.value.status_code == 500
+    assert jobs._backend._provider._use_bulk_job_endpoint
+
+
+def test_bulk_endpoint_shared_by_provider(monkeypatch: Any) -> None:
+    job = MockJob()
+    other_job = qss.SuperstaQJob(job._backend, "456def")
+    num_posts = 0
+
+    def mock_post(*_: Any, **__: Any) -> MockNotFoundResponse:
+        nonlocal num_posts
+        num_posts += 1
+        return MockNotFoundResponse()
+
+    monkeypatch.setattr(requests.Session, "post", mock_post)
+    monkeypatch.setattr(requests.Session, "get", lambda *_, **__: MockResponse("Done"))
+
     assert job.status() == qiskit.providers.JobStatus.DONE
+    assert other_job.status() == qiskit.providers.JobStatus.DONE
+    assert num_posts == 1
+
+
+def test_result_store(monkeypatch: Any, tmp_path: pathlib.Path) -> None:
+    jobs = MockJobs()
+    result_store = qss.caching.DiskCache(str(tmp_path / "results.db"), 10**6)
+    monkeypatch.setattr(jobs._backend._provider, "result_store", result_store)
+
+    statuses = {"123abc": "Done", "456def": "Running"}
+    requested_ids = []
+
+    def mock_get(_: Any, url: str, **__: Any) -> MockResponse:
+        job_id = url.split("/")[-1]
+        requested_ids.append(job_id)
+        return MockResponse(statuses[job_id])
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    monkeypatch.setattr(jobs._backend._provider, "_use_bulk_job_endpoint", False)
+
+    # only finished sub-jobs are stored
+    assert jobs.status() == qiskit.providers.JobStatus.RUNNING
+    assert sorted(requested_ids) == ["123abc", "456def"]
+    assert "super.tech/job/123abc" in result_store
+    assert "super.tech/job/456def" not in result_store
+
+    statuses["456def"] = "Done"
+    assert jobs.result().job_id == "123abc,456def"
+    assert requested_ids[2:] == ["456def"]
+    assert len(result_store) == 2
+
+    # finished sub-jobs are then served locally
+    assert jobs.status() == qiskit.providers.JobStatus.DONE
+    assert jobs.result().job_id == "123abc,456def"
+    assert list(jobs.iter_results()) == [(0, None), (1, None)]
+    assert asyncio.run(jobs.aresult()).job_id == "123abc,456def"
+    assert len(requested_ids) == 3
+
+    # the result store is persistent
+    new_result_store = qss.caching.DiskCache(str(tmp_path / "results.db"), 10**6)
+    monkeypatch.setattr(jobs._backend._provider, "result_store", new_result_store)
+    assert jobs.status() == qiskit.providers.JobStatus.DONE
+    assert len(requested_ids) == 3
+
+    new_result_store.clear()
+    assert jobs.status() == qiskit.providers.JobStatus.DONE
+    assert "super.tech/job/456def" in new_result_store
+    assert len(requested_ids) == 5
+
+
+def test_aresult_result_store(tmp_path: pathlib.Path) -> None:
+    job = MockJob()
+    job._backend._provider.result_store = qss.caching.DiskCache(
+        str(tmp_path / "results.db"), 10**6
+    )
+    num_requests = 0
+
+    async def mock_arequest(method: str, url: str, **_: Any) -> Any:
+        nonlocal num_requests
+        num_requests += 1
+        return requests.codes.ok, {}, {"status": "Done", "samples": {"0": 1}, "shots": 1}
+
+    job._backend._provider._arequest = mock_arequest  # type: ignore
+
+    assert asyncio.run(job.aresult()).get_counts() == {"0": 1}
+    assert asyncio.run(job.aresult()).get_counts() == {"0": 1}
+    assert num_requests == 1
+
+
+def test_aresult() -> None:
+    jobs = MockJobs()
+    responses: Dict[str, List[Tuple[Dict[str, str], str]]] = {
+        "123abc": [({"Retry-After": "0"}, "Running"), ({}, "Running"), ({}, "Done")],
+        "456def": [({}, "Done")],
+    }
+    requested_urls = []
+
+    async def mock_arequest(method: str, url: str, **_: Any) -> Any:
+        requested_urls.append(url)
+        headers, status_str = responses[url.split("/")[-1]].pop(0)
+        return requests.codes.ok, headers, {"status": status_str, "samples": {"0": 1}, "shots": 1}
+
+    jobs._backend._provider._arequest = mock_arequest  # type: ignore
+
+    result = asyncio.run(jobs.aresult())
+    assert result.job_id == "123abc,456def"
+    assert len(result.results) == 2
+    assert requested_urls[0] == "super.tech/v0.1.0/job/123abc"
+    assert len(requested_urls) == 4
+
+
+def test_aresults() -> None:
+    jobs = MockJobs()
+    num_polls = {"123abc": 0, "456def": 0}
+
+    async def mock_arequest(method: str, url: str, **_: Any) -> Any:
+        job_id = url.split("/")[-1]
+        num_polls[job_id] += 1
+        status_str = "Running" if job_id == "123abc" and num_polls[job_id] < 3 else "Done"
+        return requests.codes.ok, {}, {"status": status_str, "samples": {job_id: 1}, "shots": 1}
+
+    jobs._backend._provider._arequest = mock_arequest  # type: ignore
+
+    async def collect() -> List[Any]:
+        return [partial async for partial in jobs.aresults()]
+
+    # the second sub-job finishes first
+    assert asyncio.run(collect()) == [(1, {"456def": 1}), (0, {"123abc": 1})]
+
+
+def test_aresult_errors() -> None:
+    jobs = MockJobs()
+
+    async def mock_arequest_error(method: str, url: str, **_: Any) -> Any:
+        return requests.codes.ok, {}, {"status": "Error"}
+
+    jobs._backend._provider._arequest = mock_arequest_error  # type: ignore
+    with pytest.raises(qiskit.providers.JobError, match="API returned error"):
+        asyncio.run(jobs.aresult())
+
+    async def mock_arequest_not_found(method: str, url: str, **_: Any) -> Any:
+        return requests.codes.not_found, {}, "Not found"
+
+    jobs._backend._provider._arequest = mock_arequest_not_found  # type: ignore
+    with pytest.raises(qiskit.providers.JobError, match="Not found"):
+        asyncio.run(jobs.aresult())
+
+    async def mock_arequest_queued(method: str, url: str, **_: Any) -> Any:
+        return requests.codes.ok, {}, {"status": "Queued"}
+
+    jobs._backend._provider._arequest = mock_arequest_queued  # type: ignore
+    with pytest.raises(qiskit.providers.JobTimeoutError, match="Timed out"):
+        asyncio.run(jobs.aresult(timeout=0.05, polling=qss.polling.FixedInterval(0.01)))
+
+
+def test_repeated_job_ids(monkeypatch: Any) -> None:
+    # (batches with repeated circuits may be deduplicated into repeated sub-jobs)
+    job = qss.SuperstaQJob(backend=MockDevice(), job_id="123abc,456def,123abc")
+    requested_ids = []
+
+    def mock_get(_: Any, url: str, **__: Any) -> MockResponse:
+        requested_ids.append(url.split("/")[-1])
+        return MockResponse("Done")
+
+    monkeypatch.setattr(requests.Session, "get", mock_get)
+    assert len(job.result().results) == 3
+    assert sorted(requested_ids) == ["123abc", "456def"]
+
+    async def mock_arequest(method: str, url: str, **_: Any) -> Any:
+        job_id = url.split("/")[-1]
+        requested_ids.append(job_id)
+        return requests.codes.ok, {}, {"status": "Done", "samples": {job_id: 1}, "shots": 1}
+
+    job._backend._provider._arequest = mock_arequest
+    requested_ids.clear()
+    result = asyncio.run(job.aresult())
+    assert [result.get_counts(i) for i in range(3)] == [{"123abc": 1}, {"456def": 1}, {"123abc": 1}]
+    assert sorted(requested_ids) == ["123abc", "456def"]
 
 
 def test_submit() -> None:
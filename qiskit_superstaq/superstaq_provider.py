@@ -12,11 +12,30 @@
 # copyright notice, and modified files need to carry a notice indicating
 # that they have been altered from the originals.
 
+import asyncio
+import hashlib
+import importlib
+import json
 import os
-from typing import List, Optional, Union
+import weakref
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    FrozenSet,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Tuple,
+    TypeVar,
+    Union,
+)
 
 import applications_superstaq
+import numpy as np
 import qiskit
+import requests
 from applications_superstaq import finance
 from applications_superstaq import logistics
 from applications_superstaq import ResourceEstimate
@@ -25,6 +44,29 @@ from applications_superstaq import user_config
 
 import qiskit_superstaq as qss
 
+try:
+    import aiohttp
+except ModuleNotFoundError:  # pragma: no cover, b/c aiohttp is in dev-requirements.txt
+    pass
+
+T = TypeVar("T")
+
+# Status codes on which asynchronous requests are retried, and the initial delay between retries
+_RETRIABLE_STATUS_CODES = (502, 503, 504)
+_RETRY_BACKOFF_SECONDS = 0.5
+
+# Endpoints whose POST requests have no side effects, and can therefore be retried automatically
+# (unlike e.g. "/jobs", which would create the same jobs again). Of these, only "/get_jobs" is
+# requested through the synchronous session; the others are only sent by asynchronous methods.
+_READ_ONLY_POST_ENDPOINTS = (
+    "/get_jobs",
+    "/aqt_compile",
+    "/qscout_compile",
+    "/cq_compile",
+    "/ibmq_compile",
+    "/neutral_atom_compile",
+)
+
 
 class SuperstaQProvider(
     qiskit.providers.ProviderV1, finance.Finance, logistics.Logistics, user_config.UserConfig
@@ -44,6 +86,9 @@ class SuperstaQProvider(
     where `'MY_TOKEN'` is the access token provided by SuperstaQ,
     and 'my_backend' is the name of the desired backend.
 
+    Compilation methods, `SuperstaQBackend.run` and `SuperstaQJob.result` also have asynchronous
+    counterparts (e.g. `await ss_provider.acq_compile(...)`), which require aiohttp.
+
     Args:
          Args:
             api_key: A string key which allows access to the API. If this is None,
@@ -61,11 +106,101 @@ class SuperstaQProvider(
             api_version: Version of the API.
             max_retry_seconds: The number of seconds to retry calls for. Defaults to one hour.
             verbose: Whether to print to stdio and stderr on retriable errors.
+            connection_pool_size: The maximum number of connections to keep alive (per host) in the
+                HTTP session shared by all of the backends and jobs created from this provider.
+            max_http_retries: The number of times requests made through the shared HTTP session
+                are retried on connection errors or on 502, 503 and 504 responses. Only GET
+                requests and POST requests to read-only endpoints (such as the compilation
+                endpoints) are retried on error responses, so that jobs are never created twice.
+            polling_strategy: The default `qss.polling.PollingStrategy` used by jobs to decide how
+                long to wait between polls while waiting for results. Defaults to an exponential
+                backoff starting at 0.1 seconds.
+            serialization_cache_size: If positive, the serialization of every circuit sent to the
+                server is cached (keyed by the structure of the circuit) in an LRU cache holding up
+                to this many bytes of serialized circuits. The cache is available through the
+                `serialization_cache` attribute.
+            serialization_processes: If greater than one, large batches of circuits (see
+                `qss.serialization.PARALLEL_SERIALIZATION_THRESHOLD`) are serialized in parallel by
+                this many worker processes before being sent to the server.
+            compression: Optional codec (one of `qss.serialization.SUPPORTED_COMPRESSIONS`) with
+                which to compress the circuits sent to the server. It is announced to the server
+                in the `qss.serialization.COMPRESSION_HEADER` header of every request, so that the
+                server can compress the payloads in its responses in the same way. Payloads are
+                only sent compressed if the server advertises support for this codec (which is
+                checked once, before the first compressed request).
+            result_store_path: The path of a SQLite database in which the results of finished jobs
+                are stored (keyed by job ID), so that they are served locally by later calls to
+                `SuperstaQJob.result()` and `SuperstaQJob.status()`, including in later sessions.
+                If this is None, then this uses the environment variable
+                `SUPERSTAQ_RESULT_STORE_PATH`. If that variable is not set, results are not stored.
+            result_store_size: The maximum number of bytes of job results kept in the result store
+                (the least recently used results are evicted first).
+            compile_cache_size: If positive, the responses of the compilation endpoints are cached
+                in memory (in an LRU cache holding up to this many bytes), keyed by a hash of the
+                serialized circuits, target and options. Compiling the same circuits for the same
+                target again then returns a new CompilerOutput without contacting the server.
+            compile_cache_path: The path of an optional SQLite database in which compilation
+                responses are also cached, so that they persist across sessions.
+            compile_cache_disk_size: The maximum number of bytes of compilation responses kept in
+                the database at `compile_cache_path`.
+            compile_cache_max_age: The number of seconds after which compilation responses cached
+                in the database at `compile_cache_path` expire (or None for no expiry). Both
+                compile caches are keyed by API key, and are cleared whenever new AQT configs are
+                uploaded (as these change the results of AQT compilation).
+            deduplicate_circuits: If True, structurally identical circuits in a batch passed to
+                `SuperstaQBackend.run` or the compilation methods (except AQT compilation, whose
+                pulse sequence covers the whole batch) are only sent to the server once. Their
+                results are mapped back to every position of the batch, so that the returned
+                objects look exactly as they would without deduplication.
+            pulse_cache_size: The pulse sequences returned by `ibmq_compile` and
+                `neutral_atom_compile` are only deserialized when accessed. If this is positive, up
+                to this many of them are also memoized in decoded form (keyed by the hash of their
+                serialization), so that identical pulse sequences returned by different calls are
+                only decoded once. Each call still returns its own pulse sequence objects.
+            metadata_ttl: If positive, the backend list, AQT configs and balance are cached for
+                this many seconds, and `get_backend` returns a single shared instance per backend.
+                The cached balance is invalidated whenever a job is submitted, and the cached AQT
+                configs whenever new ones are uploaded. `invalidate_metadata` clears the cache.
+            metadata_refresh_after: If set (to less than `metadata_ttl`), cached metadata older
+                than this many seconds is refreshed in a background thread when it is accessed,
+                while the cached value keeps being returned.
         Raises:
             EnvironmentError: if the `api_key` is None and has no corresponding environment
                 variable set.
     """
 
+    # optional cache for the serialization of the circuits sent to the server
+    serialization_cache: Optional["qss.caching.LRUCache"] = None
+
+    # number of worker processes used to serialize large batches of circuits (if greater than one)
+    serialization_processes: Optional[int] = None
+
+    # optional codec used to compress the payloads exchanged with the server
+    compression: Optional[str] = None
+
+    # the codecs the server accepts in requests (or None until it has been queried)
+    _server_compressions: Optional[FrozenSet[str]] = None
+
+    # optional persistent store for the results of finished jobs
+    result_store: Optional["qss.caching.DiskCache"] = None
+
+    # optional cache of deserialized pulse sequences, keyed by the hash of their serialization
+    pulse_cache: Optional["qss.caching.LRUCache"] = None
+
+    # whether to send each distinct circuit of a batch only once
+    deduplicate_circuits = False
+
+    # optional cache of the backend list, AQT configs and balance
+    metadata_cache: Optional["qss.caching.TTLCache"] = None
+
+    # optional in-memory and on-disk caches of compilation responses
+    compile_cache: Optional["qss.caching.LRUCache"] = None
+    compile_disk_cache: Optional["qss.caching.DiskCache"] = None
+
+    # set to False (for all jobs of this provider) once the server reports that it has no bulk job
+    # endpoint
+    _use_bulk_job_endpoint = True
+
     def __init__(
         self,
         api_key: Optional[str] = None,
@@ -74,6 +209,22 @@ class SuperstaQProvider(
         api_version: str = applications_superstaq.API_VERSION,
         max_retry_seconds: int = 3600,
         verbose: bool = False,
+        connection_pool_size: int = 16,
+        max_http_retries: int = 3,
+        polling_strategy: Optional["qss.polling.PollingStrategy"] = None,
+        serialization_cache_size: int = 0,
+        serialization_processes: Optional[int] = None,
+        compression: Optional[str] = None,
+        result_store_path: Optional[str] = None,
+        result_store_size: int = 2**30,
+        compile_cache_size: int = 0,
+        compile_cache_path: Optional[str] = None,
+        compile_cache_disk_size: int = 2**30,
+        compile_cache_max_age: Optional[float] = 7 * 24 * 3600,
+        deduplicate_circuits: bool = False,
+        pulse_cache_size: int = 0,
+        metadata_ttl: float = 0,
+        metadata_refresh_after: Optional[float] = None,
     ) -> None:
         self._name = "superstaq_provider"
         self.remote_host = (
@@ -96,6 +247,44 @@ class SuperstaQProvider(
             verbose=verbose,
         )
 
+        if compression is not None:
+            if compression not in qss.serialization.SUPPORTED_COMPRESSIONS:
+                raise ValueError(
+                    f"Unsupported compression {compression!r} (must be one of "
+                    f"{qss.serialization.SUPPORTED_COMPRESSIONS})."
+                )
+            self.compression = compression
+            self._client.headers[qss.serialization.COMPRESSION_HEADER] = compression
+
+        self._api_version = api_version
+        self._connection_pool_size = connection_pool_size
+        self._max_http_retries = max_http_retries
+        self._session = self._create_session(connection_pool_size, max_http_retries)
+        self._async_sessions: weakref.WeakKeyDictionary = weakref.WeakKeyDictionary()
+        self.polling_strategy = polling_strategy or qss.polling.ExponentialBackoff()
+        if serialization_cache_size > 0:
+            self.serialization_cache = qss.caching.LRUCache(serialization_cache_size, sizeof=len)
+        self.serialization_processes = serialization_processes
+
+        result_store_path = result_store_path or os.getenv("SUPERSTAQ_RESULT_STORE_PATH")
+        if result_store_path:
+            self.result_store = qss.caching.DiskCache(result_store_path, result_store_size)
+
+        self.deduplicate_circuits = deduplicate_circuits
+        if pulse_cache_size > 0:
+            self.pulse_cache = qss.caching.LRUCache(pulse_cache_size)
+
+        self._backend_instances: Dict[str, qss.SuperstaQBackend] = {}
+        if metadata_ttl > 0:
+            self.metadata_cache = qss.caching.TTLCache(metadata_ttl, metadata_refresh_after)
+
+        if compile_cache_size > 0:
+            self.compile_cache = qss.caching.LRUCache(compile_cache_size, sizeof=len)
+        if compile_cache_path:
+            self.compile_disk_cache = qss.caching.DiskCache(
+                compile_cache_path, compile_cache_disk_size, max_age=compile_cache_max_age
+            )
+
     def __str__(self) -> str:
         return f"<SuperstaQProvider {self._name}>"
 
@@ -104,25 +293,358 @@ class SuperstaQProvider(
         return repr1 + f"name={self._name})>"
 
     def get_backend(self, backend: str) -> "qss.SuperstaQBackend":
-        return qss.SuperstaQBackend(provider=self, remote_host=self.remote_host, backend=backend)
+        if self.metadata_cache is None:
+            return qss.SuperstaQBackend(
+                provider=self, remote_host=self.remote_host, backend=backend
+            )
+
+        # (a benign race may build an extra instance, but only the first one is ever returned)
+        if backend not in self._backend_instances:
+            instance = qss.SuperstaQBackend(
+                provider=self, remote_host=self.remote_host, backend=backend
+            )
+            self._backend_instances.setdefault(backend, instance)
+        return self._backend_instances[backend]
 
     def get_access_token(self) -> Optional[str]:
         return self.api_key
 
     def backends(self) -> List[qss.SuperstaQBackend]:
-        ss_backends = self._client.get_backends()["superstaq_backends"]
+        ss_backends = self._cached_metadata(
+            "backends", lambda: self._client.get_backends()["superstaq_backends"]
+        )
         backends = []
         for backend_str in ss_backends["compile-and-run"]:
             backends.append(self.get_backend(backend_str))
         return backends
 
+    def get_balance(self, pretty_output: bool = True) -> Union[str, float]:
+        """Get the querying user's account balance in USD.
+
+        Args:
+            pretty_output: whether to return a pretty string or a float of the balance.
+        Returns:
+            If pretty_output is True, returns the balance as a nicely formatted string ($-prefix,
+                commas on LHS every three digits, and two digits after period). Otherwise, simply
+                returns a float of the balance.
+        """
+        balance = self._cached_metadata("balance", lambda: self._client.get_balance()["balance"])
+        if pretty_output:
+            return f"${balance:,.2f}"
+        return balance
+
+    def aqt_get_configs(self) -> Dict[str, str]:
+        """Returns the current AQT configs, as a dictionary with "pulses" and "variables" keys."""
+        return dict(self._cached_metadata("aqt_configs", self._client.aqt_get_configs))
+
+    def aqt_upload_configs(self, pulses_file_path: str, variables_file_path: str) -> Dict[str, str]:
+        """Uploads configs for AQT.
+
+        Args:
+            pulses_file_path: The filepath for Pulses.yaml
+            variables_file_path: The filepath for Variables.yaml
+        Returns:
+            A dictionary of of the status of the update (Whether or not it failed)
+        """
+        try:
+            return super().aqt_upload_configs(pulses_file_path, variables_file_path)
+        finally:
+            self.invalidate_metadata("aqt_configs")
+            if self.compile_cache is not None:
+                self.compile_cache.clear()
+            if self.compile_disk_cache is not None:
+                self.compile_disk_cache.clear()
+
+    def _cached_metadata(self, key: str, loader: Callable[[], Any]) -> Any:
+        """Returns `loader()`, through the metadata cache if there is one."""
+        if self.metadata_cache is None:
+            return loader()
+        return self.metadata_cache.get(key, loader)
+
+    def invalidate_metadata(self, key: Optional[str] = None) -> None:
+        """Clears cached metadata, so that it is fetched again on its next access.
+
+        Args:
+            key: the metadata to clear (one of "backends", "balance" and "aqt_configs"), or None to
+                clear all of it (along with the shared backend instances)
+        """
+        if self.metadata_cache is not None:
+            self.metadata_cache.invalidate(key)
+        if key is None:
+            self._backend_instances.clear()
+
     def _http_headers(self) -> dict:
-        return {
+        headers = {
             "Authorization": self.get_access_token(),
             "Content-Type": "application/json",
             "X-Client-Name": "qiskit-superstaq",
             "X-Client-Version": qss.API_VERSION,
         }
+        if self.compression is not None:
+            headers[qss.serialization.COMPRESSION_HEADER] = self.compression
+        return headers
+
+    def _create_session(self, pool_size: int, max_retries: int) -> requests.Session:
+        """Creates the persistent HTTP session shared by all backends and jobs of this provider.
+
+        The session is fully configured here and never modified afterwards, so it can safely be
+        used concurrently from worker threads (e.g. when polling the sub-jobs of a batch).
+
+        Error responses are only retried for GET requests, and for POST requests to "/get_jobs"
+        (which is mounted with its own adapter). Compilation and job creation requests are sent by
+        `self._client` instead, and are not retried by this session.
+        """
+        retry = requests.adapters.Retry(
+            total=max_retries,
+            backoff_factor=_RETRY_BACKOFF_SECONDS,
+            status_forcelist=_RETRIABLE_STATUS_CODES,
+            allowed_methods=frozenset({"GET"}),
+            raise_on_status=False,
+        )
+        adapter = requests.adapters.HTTPAdapter(pool_maxsize=pool_size, max_retries=retry)
+        read_only_adapter = requests.adapters.HTTPAdapter(
+            pool_maxsize=pool_size,
+            max_retries=retry.new(allowed_methods=frozenset({"GET", "POST"})),
+        )
+
+        session = requests.Session()
+        session.mount("https://", adapter)
+        session.mount("http://", adapter)
+        session.mount(f"{self.remote_host}/{qss.API_VERSION}/get_jobs", read_only_adapter)
+        session.headers.update(self._http_headers())
+        return session
+
+    def _request_compression(self) -> Optional[str]:
+        """Returns the codec with which to compress the payloads sent to the server, i.e.
+        `compression` if the server advertises support for it, or None otherwise.
+
+        The server advertises the codecs it accepts in the
+        `qss.serialization.ACCEPT_COMPRESSION_HEADER` header of its responses. It is read from the
+        response to a request for the list of backends, which is sent (once) on first use.
+        """
+        if self.compression is None:
+            return None
+
+        if self._server_compressions is None:
+            try:
+                response = self._session.get(
+                    f"{self.remote_host}/{self._api_version}/backends",
+                    verify=(self.remote_host == qss.API_URL),
+                )
+            except requests.RequestException:
+                return None  # (the server will be queried again for the next request)
+
+            header = response.headers.get(qss.serialization.ACCEPT_COMPRESSION_HEADER, "")
+            self._server_compressions = frozenset(codec.strip() for codec in header.split(","))
+
+        return self.compression if self.compression in self._server_compressions else None
+
+    def _serialize_circuits(
+        self, circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]
+    ) -> str:
+        return qss.serialization.serialize_circuits(
+            circuits,
+            cache=self.serialization_cache,
+            num_processes=self.serialization_processes,
+            compression=self._request_compression(),
+        )
+
+    def _serialize_circuit_chunks(
+        self,
+        circuits: List[qiskit.QuantumCircuit],
+        max_circuits_per_chunk: Optional[int] = None,
+        max_size_per_chunk: Optional[int] = None,
+    ) -> List[Tuple[int, str]]:
+        return qss.serialization.serialize_circuit_chunks(
+            circuits,
+            max_circuits_per_chunk=max_circuits_per_chunk,
+            max_size_per_chunk=max_size_per_chunk,
+            cache=self.serialization_cache,
+            num_processes=self.serialization_processes,
+            compression=self._request_compression(),
+        )
+
+    def _deduplicate(
+        self, circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]
+    ) -> Tuple[Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]], Optional[List[int]]]:
+        """Removes repeated circuits from a batch if `deduplicate_circuits` is set.
+
+        Returns:
+            the circuits to send to the server, and the indices with which to map their outputs
+            back to the original batch using `qss.serialization.fan_out` (or None if the batch was
+            left unchanged)
+        """
+        if not self.deduplicate_circuits or isinstance(circuits, qiskit.QuantumCircuit):
+            return circuits, None
+
+        unique_circuits, indices = qss.serialization.deduplicate_circuits(circuits)
+        if len(unique_circuits) == len(circuits):
+            return circuits, None
+        return unique_circuits, indices
+
+    def _compile_cache_key(self, endpoint: str, request_json: Dict[str, Any]) -> Optional[str]:
+        """Returns the key of a compilation request in the compile cache(s), or None if there is no
+        compile cache."""
+        if self.compile_cache is None and self.compile_disk_cache is None:
+            return None
+
+        # the API key is hashed so that it is not recoverable from (or stored alongside) the keys
+        api_key_hash = hashlib.sha256(str(self.api_key).encode()).hexdigest()
+        request_str = json.dumps(
+            [api_key_hash, self.remote_host, self._api_version, endpoint, request_json],
+            sort_keys=True,
+        )
+        return hashlib.sha256(request_str.encode()).hexdigest()
+
+    def _get_cached_compile(self, key: Optional[str]) -> Optional[dict]:
+        """Returns the cached response to a compilation request (if any)."""
+        if key is None:
+            return None
+
+        response = self.compile_cache.get(key) if self.compile_cache is not None else None
+        if response is None and self.compile_disk_cache is not None:
+            response = self.compile_disk_cache.get(key)
+            if response is not None and self.compile_cache is not None:
+                self.compile_cache.put(key, response)
+
+        return None if response is None else json.loads(response)
+
+    def _cache_compile(self, key: Optional[str], json_dict: dict) -> None:
+        """Caches the response to a compilation request."""
+        if key is None:
+            return
+
+        response = json.dumps(json_dict).encode()
+        if self.compile_cache is not None:
+            self.compile_cache.put(key, response)
+        if self.compile_disk_cache is not None:
+            self.compile_disk_cache.put(key, response)
+
+    def _compile(
+        self,
+        endpoint: str,
+        request_json: Dict[str, Any],
+        post: Optional[Callable[[Dict[str, Any]], dict]] = None,
+    ) -> dict:
+        """Sends a compilation request, unless an identical request is in the compile cache(s).
+
+        Args:
+            endpoint: the compilation endpoint (e.g. "/aqt_compile")
+            request_json: the JSON body of the request
+            post: the client method sending the request (defaults to a POST to `endpoint`)
+        Returns:
+            the JSON response of the server
+        """
+        key = self._compile_cache_key(endpoint, request_json)
+        json_dict = self._get_cached_compile(key)
+        if json_dict is None:
+            if post is None:
+                json_dict = self._client.post_request(endpoint, request_json)
+            else:
+                json_dict = post(request_json)
+            self._cache_compile(key, json_dict)
+        return json_dict
+
+    async def _acompile(self, endpoint: str, request_json: Dict[str, Any]) -> dict:
+        """Asynchronous counterpart of `_compile`."""
+        key = self._compile_cache_key(endpoint, request_json)
+        json_dict = self._get_cached_compile(key)
+        if json_dict is None:
+            json_dict = await self._apost(endpoint, request_json)
+            self._cache_compile(key, json_dict)
+        return json_dict
+
+    async def _run_in_executor(self, func: Callable[..., T], *args: Any) -> T:
+        """Runs a blocking call in the default executor of the running event loop, so that it does
+        not block the loop. This is used for serialization (which is CPU-bound, and may also probe
+        the server's supported compressions with a synchronous request)."""
+        return await asyncio.get_running_loop().run_in_executor(None, func, *args)
+
+    async def _async_session(self) -> "aiohttp.ClientSession":
+        """Returns the aiohttp session used for asynchronous requests in the running event loop.
+
+        aiohttp sessions are bound to the event loop they were created in, so one session (with a
+        connection pool of the same size as the synchronous session) is created per event loop.
+        """
+        if not importlib.util.find_spec("aiohttp"):
+            raise applications_superstaq.SuperstaQModuleNotFoundException(
+                name="aiohttp", context="asynchronous requests"
+            )
+
+        loop = asyncio.get_running_loop()
+        session = self._async_sessions.get(loop)
+        if session is None or session.closed:
+            session = aiohttp.ClientSession(
+                headers=self._http_headers(),
+                connector=aiohttp.TCPConnector(limit=self._connection_pool_size),
+            )
+            self._async_sessions[loop] = session
+        return session
+
+    async def aclose(self) -> None:
+        """Closes the aiohttp session used for asynchronous requests in the running event loop."""
+        session = self._async_sessions.pop(asyncio.get_running_loop(), None)
+        if session is not None:
+            await session.close()
+
+    async def _arequest(
+        self,
+        method: str,
+        url: str,
+        json_dict: Optional[dict] = None,
+        verify: bool = True,
+        retry: bool = True,
+    ) -> Tuple[int, Mapping[str, str], Any]:
+        """Makes an asynchronous HTTP request, retrying on 502, 503 and 504 responses.
+
+        Args:
+            method: the HTTP method (e.g. "GET" or "POST")
+            url: the URL to request
+            json_dict: optional JSON body of the request
+            verify: whether to verify the server's TLS certificate
+            retry: whether to retry on 502, 503 and 504 responses (which must only be done for
+                requests without side effects)
+        Returns:
+            the status code, headers, and body of the response. The body is decoded from JSON if
+            the request was successful, and is the raw text of the response otherwise.
+        """
+        session = await self._async_session()
+        attempt = 0
+        while True:
+            async with session.request(
+                method, url, json=json_dict, ssl=None if verify else False
+            ) as response:
+                if (
+                    not retry
+                    or response.status not in _RETRIABLE_STATUS_CODES
+                    or attempt >= self._max_http_retries
+                ):
+                    if response.status >= 400:
+                        return response.status, response.headers, await response.text()
+                    return response.status, response.headers, await response.json(content_type=None)
+
+            await asyncio.sleep(_RETRY_BACKOFF_SECONDS * 2**attempt)
+            attempt += 1
+
+    async def _apost(self, endpoint: str, json_dict: dict) -> dict:
+        """Asynchronous counterpart of `self._client.post_request`.
+
+        The request is only retried (on 502, 503 and 504 responses) if `endpoint` is read-only, so
+        that e.g. jobs are never created twice.
+        """
+        url = f"{self.remote_host}/{self._api_version}{endpoint}"
+        status, _, body = await self._arequest(
+            "POST",
+            url,
+            json_dict,
+            verify=(self.remote_host == qss.API_URL),
+            retry=(endpoint in _READ_ONLY_POST_ENDPOINTS),
+        )
+        if status != 200:
+            raise applications_superstaq.SuperstaQException(
+                f"Request to {endpoint} failed with status {status}: {body}", status
+            )
+        return body
 
     def resource_estimate(
         self, circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]], target: str
@@ -136,7 +658,7 @@ class SuperstaQProvider(
             ResourceEstimate(s) containing resource costs (after compilation)
             for running circuit(s) on target.
         """
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        serialized_circuits = self._serialize_circuits(circuits)
         circuit_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
 
         request_json = {
@@ -154,28 +676,71 @@ class SuperstaQProvider(
             return resource_estimates
         return resource_estimates[0]
 
+    def _parameter_values_json(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        parameter_values: Union[np.ndarray, Sequence[Sequence[float]]],
+    ) -> Dict[str, Any]:
+        """Returns the request fields sending a table of parameter bindings for a template
+        circuit (which is itself only serialized once)."""
+        if not isinstance(circuits, qiskit.QuantumCircuit):
+            raise ValueError("parameter_values can only be used with a single (template) circuit.")
+
+        return qss.serialization.serialize_parameter_values(
+            circuits, parameter_values, compression=self._request_compression()
+        )
+
     def aqt_compile(
         self,
         circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
         target: str = "keysight",
+        parameter_values: Optional[Union[np.ndarray, Sequence[Sequence[float]]]] = None,
     ) -> "qss.compiler_output.CompilerOutput":
         """Compiles the given circuit(s) to AQT device, optimized to its native gate set.
 
         Args:
             circuits: qiskit QuantumCircuit(s)
+            target: string of target backend AQT device
+            parameter_values: optional 2D array of values for the parameters of a single
+                (parameterized) circuit, with one row per binding and one column per parameter (in
+                the order of `circuits.parameters`). The circuit is then sent once along with this
+                binding table, and compiled for every binding.
         Returns:
-            object whose .circuit(s) attribute is an optimized qiskit QuantumCircuit(s)
+            object whose .circuit(s) attribute is an optimized qiskit QuantumCircuit(s) (with one
+            circuit per binding if `parameter_values` is given)
             If qtrl is installed, the object's .seq attribute is a qtrl Sequence object of the
             pulse sequence corresponding to the optimized qiskit.QuantumCircuit(s) and the
             .pulse_list(s) attribute is the list(s) of cycles.
         """
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        serialized_circuits = self._serialize_circuits(circuits)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
 
-        json_dict = self._client.aqt_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
-        )
+        request_json: Dict[str, Any] = {"qiskit_circuits": serialized_circuits, "backend": target}
+        if parameter_values is not None:
+            request_json.update(self._parameter_values_json(circuits, parameter_values))
+            circuits_is_list = True
+
+        json_dict = self._compile("/aqt_compile", request_json, self._client.aqt_compile)
+        return qss.compiler_output.read_json_aqt(json_dict, circuits_is_list)
+
+    async def aaqt_compile(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "keysight",
+        parameter_values: Optional[Union[np.ndarray, Sequence[Sequence[float]]]] = None,
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous counterpart of `aqt_compile`."""
+        serialized_circuits = await self._run_in_executor(self._serialize_circuits, circuits)
+        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
 
+        request_json: Dict[str, Any] = {"qiskit_circuits": serialized_circuits, "backend": target}
+        if parameter_values is not None:
+            request_json.update(
+                await self._run_in_executor(self._parameter_values_json, circuits, parameter_values)
+            )
+            circuits_is_list = True
+
+        json_dict = await self._acompile("/aqt_compile", request_json)
         return qss.compiler_output.read_json_aqt(json_dict, circuits_is_list)
 
     def aqt_compile_eca(
@@ -200,7 +765,7 @@ class SuperstaQProvider(
             pulse sequence corresponding to the QuantumCircuits and the .pulse_list(s) attribute is
             the list(s) of cycles.
         """
-        serialized_circuit = qss.serialization.serialize_circuits(circuit)
+        serialized_circuit = self._serialize_circuits(circuit)
 
         request_json = {
             "qiskit_circuits": serialized_circuit,
@@ -208,10 +773,13 @@ class SuperstaQProvider(
             "num_eca_circuits": num_equivalent_circuits,
         }
 
-        if random_seed is not None:
+        if random_seed is None:
+            # unseeded ECA is random, so its results are never cached
+            json_dict = self._client.post_request("/aqt_compile", request_json)
+        else:
             request_json["random_seed"] = random_seed
+            json_dict = self._compile("/aqt_compile", request_json)
 
-        json_dict = self._client.post_request("/aqt_compile", request_json)
         return qss.compiler_output.read_json_aqt(json_dict, True)
 
     def ibmq_compile(
@@ -220,18 +788,43 @@ class SuperstaQProvider(
         target: str = "ibmq_qasm_simulator",
     ) -> "qss.compiler_output.CompilerOutput":
         """Returns pulse schedule(s) for the given circuit(s) and target."""
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = self._serialize_circuits(circuits)
+
+        json_dict = self._compile(
+            "/ibmq_compile",
+            {"qiskit_circuits": serialized_circuits, "backend": target},
+            self._client.ibmq_compile,
+        )
+        return qss.compiler_output.fan_out(self._read_json_ibmq(json_dict, circuits), indices)
 
-        json_dict = self._client.ibmq_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+    async def aibmq_compile(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "ibmq_qasm_simulator",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous counterpart of `ibmq_compile`."""
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = await self._run_in_executor(self._serialize_circuits, circuits)
+
+        json_dict = await self._acompile(
+            "/ibmq_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
         )
+        return qss.compiler_output.fan_out(self._read_json_ibmq(json_dict, circuits), indices)
+
+    def _read_json_ibmq(
+        self,
+        json_dict: dict,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+    ) -> "qss.compiler_output.CompilerOutput":
         compiled_circuits = qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])
-        pulses = applications_superstaq.converters.deserialize(json_dict["pulses"])
+        pulses = qss.serialization.LazyObjectList(json_dict["pulses"], cache=self.pulse_cache)
 
         if isinstance(circuits, qiskit.QuantumCircuit):
-            return qss.compiler_output.CompilerOutput(
-                circuits=compiled_circuits[0], pulse_sequences=pulses[0]
-            )
+            compiler_output = qss.compiler_output.CompilerOutput(circuits=compiled_circuits[0])
+            compiler_output._set_lazy_attribute("pulse_sequence", lambda: pulses[0])
+            return compiler_output
+
         return qss.compiler_output.CompilerOutput(
             circuits=compiled_circuits, pulse_sequences=pulses
         )
@@ -251,12 +844,33 @@ class SuperstaQProvider(
             pulse sequence corresponding to the optimized qiskit.QuantumCircuit(s) and the
             .pulse_list(s) attribute is the list(s) of cycles.
         """
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = self._serialize_circuits(circuits)
+        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
+        json_dict = self._compile(
+            "/qscout_compile",
+            {"qiskit_circuits": serialized_circuits, "backend": target},
+            self._client.qscout_compile,
+        )
+        return qss.compiler_output.fan_out(
+            qss.compiler_output.read_json_qscout(json_dict, circuits_is_list), indices
+        )
+
+    async def aqscout_compile(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "qscout",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous counterpart of `qscout_compile`."""
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = await self._run_in_executor(self._serialize_circuits, circuits)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        json_dict = self._client.qscout_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = await self._acompile(
+            "/qscout_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
+        )
+        return qss.compiler_output.fan_out(
+            qss.compiler_output.read_json_qscout(json_dict, circuits_is_list), indices
         )
-        return qss.compiler_output.read_json_qscout(json_dict, circuits_is_list)
 
     def cq_compile(
         self,
@@ -271,35 +885,93 @@ class SuperstaQProvider(
         Returns:
             object whose .circuit(s) attribute is an optimized qiskit QuantumCircuit(s)
         """
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = self._serialize_circuits(circuits)
         circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
-        json_dict = self._client.cq_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "/cq_compile",
+            {"qiskit_circuits": serialized_circuits, "backend": target},
+            self._client.cq_compile,
         )
 
-        return qss.compiler_output.read_json_only_circuits(json_dict, circuits_is_list)
+        return qss.compiler_output.fan_out(
+            qss.compiler_output.read_json_only_circuits(json_dict, circuits_is_list), indices
+        )
+
+    async def acq_compile(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "cq",
+    ) -> "qss.compiler_output.CompilerOutput":
+        """Asynchronous counterpart of `cq_compile`."""
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = await self._run_in_executor(self._serialize_circuits, circuits)
+        circuits_is_list = not isinstance(circuits, qiskit.QuantumCircuit)
+        json_dict = await self._acompile(
+            "/cq_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
+        )
+        return qss.compiler_output.fan_out(
+            qss.compiler_output.read_json_only_circuits(json_dict, circuits_is_list), indices
+        )
 
     def neutral_atom_compile(
         self,
         circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
         target: str = "neutral_atom_qpu",
-    ) -> Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]]:
+        lazy: bool = False,
+    ) -> Union[Any, Sequence[Any]]:
         """Returns pulse schedule for the given circuit and target.
 
         Pulser must be installed for returned object to correctly deserialize to a pulse schedule.
+
+        Args:
+            circuits: qiskit QuantumCircuit(s)
+            target: string of target representing target device
+            lazy: if True, the pulse schedules of a list of circuits are returned in a read-only
+                qss.serialization.LazyObjectList, which only deserializes each schedule when it is
+                first accessed
+        Returns:
+            the pulse schedule of a single circuit, or the list of pulse schedules of a list of
+            circuits (or a qss.serialization.LazyObjectList of them if `lazy` is True)
         """
-        serialized_circuits = qss.serialization.serialize_circuits(circuits)
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = self._serialize_circuits(circuits)
 
-        json_dict = self._client.neutral_atom_compile(
-            {"qiskit_circuits": serialized_circuits, "backend": target}
+        json_dict = self._compile(
+            "/neutral_atom_compile",
+            {"qiskit_circuits": serialized_circuits, "backend": target},
+            self._client.neutral_atom_compile,
+        )
+        return self._read_json_neutral_atom(json_dict, circuits, indices, lazy)
+
+    async def aneutral_atom_compile(
+        self,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        target: str = "neutral_atom_qpu",
+        lazy: bool = False,
+    ) -> Union[Any, Sequence[Any]]:
+        """Asynchronous counterpart of `neutral_atom_compile`."""
+        circuits, indices = self._deduplicate(circuits)
+        serialized_circuits = await self._run_in_executor(self._serialize_circuits, circuits)
+
+        json_dict = await self._acompile(
+            "/neutral_atom_compile", {"qiskit_circuits": serialized_circuits, "backend": target}
+        )
+        return self._read_json_neutral_atom(json_dict, circuits, indices, lazy)
+
+    def _read_json_neutral_atom(
+        self,
+        json_dict: dict,
+        circuits: Union[qiskit.QuantumCircuit, List[qiskit.QuantumCircuit]],
+        indices: Optional[List[int]] = None,
+        lazy: bool = False,
+    ) -> Union[Any, Sequence[Any]]:
+        pulses = qss.serialization.LazyObjectList(
+            json_dict["pulses"], cache=self.pulse_cache, context="neutral_atom_compile"
         )
-        try:
-            pulses = applications_superstaq.converters.deserialize(json_dict["pulses"])
-        except ModuleNotFoundError as e:
-            raise applications_superstaq.SuperstaQModuleNotFoundException(
-                name=str(e.name), context="neutral_atom_compile"
-            )
 
         if isinstance(circuits, qiskit.QuantumCircuit):
             return pulses[0]
-        return pulses
+        if indices is not None:
+            return qss.serialization.fan_out(pulses, indices)
+        return pulses if lazy else list(pulses)
@@ -1,11 +1,16 @@
+import asyncio
 import os
+import pathlib
 import textwrap
+import threading
+from typing import Any, Dict, List
 from unittest import mock
 from unittest.mock import MagicMock, patch
 
 import applications_superstaq
 import pytest
 import qiskit
+import requests
 from applications_superstaq import ResourceEstimate
 
 import qiskit_superstaq as qss
@@ -71,6 +76,384 @@ def test_provider() -> None:
     assert ss_provider.backends() == expected_backends
 
 
+def test_http_session() -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", connection_pool_size=4, max_http_retries=2)
+    assert provider._session.headers["Authorization"] == "MY_TOKEN"
+    assert provider._session.headers["X-Client-Name"] == "qiskit-superstaq"
+
+    adapter = provider._session.get_adapter(qss.API_URL)
+    assert isinstance(adapter, requests.adapters.HTTPAdapter)
+    assert adapter._pool_maxsize == 4  # type: ignore[attr-defined]
+    assert adapter.max_retries.total == 2
+    assert adapter is provider._session.get_adapter("http://localhost")
+
+    # error responses to POST requests are only retried for read-only endpoints
+    assert adapter.max_retries.allowed_methods == {"GET"}
+    for endpoint in ("/jobs", "/aqt_compile"):
+        assert (
+            provider._session.get_adapter(f"{qss.API_URL}/{qss.API_VERSION}{endpoint}") is adapter
+        )
+
+    read_only_adapter = provider._session.get_adapter(f"{qss.API_URL}/{qss.API_VERSION}/get_jobs")
+    assert isinstance(read_only_adapter, requests.adapters.HTTPAdapter)
+    assert read_only_adapter._pool_maxsize == 4  # type: ignore[attr-defined]
+    assert read_only_adapter.max_retries.total == 2
+    assert read_only_adapter.max_retries.allowed_methods == {"GET", "POST"}
+
+    # backends and jobs share their provider's session
+    job = qss.SuperstaQJob(provider.get_backend("ibmq_qasm_simulator"), "job_id")
+    assert job._backend._provider._session is provider._session
+
+
+@patch("requests.post")
+def test_serialization_cache(mock_post: MagicMock) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert provider.serialization_cache is None
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", serialization_cache_size=10**6)
+    assert provider.serialization_cache is not None
+    assert provider.serialization_cache.max_size == 10**6
+
+    qc = qiskit.QuantumCircuit(1)
+    qc.h(0)
+
+    mock_post.return_value.json = lambda: {
+        "qiskit_circuits": qss.serialization.serialize_circuits(qc)
+    }
+    assert provider.cq_compile(qc).circuit == qc
+    assert provider.cq_compile(qc).circuit == qc
+    assert provider.serialization_cache.cache_info()[:2] == (1, 1)
+
+
+@patch("qiskit_superstaq.serialization.serialize_circuits")
+def test_serialization_processes(mock_serialize_circuits: MagicMock) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", serialization_processes=4)
+    assert provider.serialization_processes == 4
+
+    qc = qiskit.QuantumCircuit(1)
+    provider._serialize_circuits(qc)
+    mock_serialize_circuits.assert_called_once_with(
+        qc, cache=None, num_processes=4, compression=None
+    )
+
+
+@patch(
+    "applications_superstaq.superstaq_client._SuperstaQClient.ibmq_compile",
+)
+def test_compression(mock_ibmq_compile: MagicMock) -> None:
+    with pytest.raises(ValueError, match="Unsupported compression 'gzip'"):
+        _ = qss.SuperstaQProvider(api_key="MY_TOKEN", compression="gzip")
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert provider.compression is None
+    assert provider._request_compression() is None
+    assert qss.serialization.COMPRESSION_HEADER not in provider._session.headers
+    assert qss.serialization.COMPRESSION_HEADER not in provider._client.headers
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compression="zlib")
+    assert provider._session.headers[qss.serialization.COMPRESSION_HEADER] == "zlib"
+    assert provider._client.headers[qss.serialization.COMPRESSION_HEADER] == "zlib"
+
+    qc = qiskit.QuantumCircuit(8)
+    qc.cz(4, 5)
+    pulses = applications_superstaq.converters.serialize([mock.DEFAULT])
+    compressed_pulses = qss.serialization._compress(
+        applications_superstaq.converters._str_to_bytes(pulses), "zlib"
+    )
+    mock_ibmq_compile.return_value = {
+        "qiskit_circuits": qss.serialization.serialize_circuits(qc, compression="zlib"),
+        "pulses": applications_superstaq.converters._bytes_to_str(compressed_pulses),
+    }
+
+    # circuits are sent compressed if the server advertises support for the codec (which is only
+    # checked once)
+    accept_header = {qss.serialization.ACCEPT_COMPRESSION_HEADER: "zstd, zlib"}
+    with patch("requests.Session.get", return_value=MagicMock(headers=accept_header)) as mock_get:
+        assert provider.ibmq_compile(qc) == qss.compiler_output.CompilerOutput(qc, mock.DEFAULT)
+        assert provider.ibmq_compile(qc) == qss.compiler_output.CompilerOutput(qc, mock.DEFAULT)
+    mock_get.assert_called_once()
+    assert mock_get.call_args[0][0] == f"{qss.API_URL}/v0.1.0/backends"
+
+    serialized_circuits = mock_ibmq_compile.call_args[0][0]["qiskit_circuits"]
+    assert serialized_circuits == qss.serialization.serialize_circuits(qc, compression="zlib")
+
+    # and uncompressed otherwise
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compression="zstd")
+    with patch("requests.Session.get", return_value=MagicMock(headers=accept_header)):
+        assert provider._request_compression() == "zstd"
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compression="zlib")
+    with patch("requests.Session.get", return_value=MagicMock(headers={})):
+        assert provider.ibmq_compile(qc) == qss.compiler_output.CompilerOutput(qc, mock.DEFAULT)
+    serialized_circuits = mock_ibmq_compile.call_args[0][0]["qiskit_circuits"]
+    assert serialized_circuits == qss.serialization.serialize_circuits(qc)
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compression="zlib")
+    with patch("requests.Session.get", side_effect=requests.ConnectionError):
+        assert provider._request_compression() is None
+    assert provider._server_compressions is None
+
+
+def test_result_store(tmp_path: pathlib.Path) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert provider.result_store is None
+
+    path = str(tmp_path / "results.db")
+    provider = qss.SuperstaQProvider(
+        api_key="MY_TOKEN", result_store_path=path, result_store_size=1000
+    )
+    assert provider.result_store is not None
+    assert provider.result_store.path == path
+    assert provider.result_store.max_size == 1000
+
+    with patch.dict(os.environ, {"SUPERSTAQ_RESULT_STORE_PATH": path}):
+        provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+        assert provider.result_store is not None
+        assert provider.result_store.path == path
+
+
+@patch(
+    "applications_superstaq.superstaq_client._SuperstaQClient.cq_compile",
+)
+def test_compile_cache(mock_cq_compile: MagicMock, tmp_path: pathlib.Path) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert provider.compile_cache is None and provider.compile_disk_cache is None
+    assert provider._compile_cache_key("/cq_compile", {}) is None
+
+    path = str(tmp_path / "compile.db")
+    provider = qss.SuperstaQProvider(
+        api_key="MY_TOKEN", compile_cache_size=10**6, compile_cache_path=path
+    )
+    assert provider.compile_cache is not None and provider.compile_disk_cache is not None
+
+    qc = qiskit.QuantumCircuit(2)
+    qc.cx(0, 1)
+    mock_cq_compile.return_value = {"qiskit_circuits": qss.serialization.serialize_circuits(qc)}
+
+    out = provider.cq_compile(qc)
+    assert out.circuit == qc
+    assert provider.cq_compile(qc) == out
+    assert provider.cq_compile(qc) is not out
+    mock_cq_compile.assert_called_once()
+
+    # different targets and circuits are compiled separately
+    _ = provider.cq_compile(qc, target="cq_other_qpu")
+    _ = provider.cq_compile([qc, qc])
+    assert mock_cq_compile.call_count == 3
+
+    # responses persist on disk
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compile_cache_path=path)
+    assert provider.compile_cache is None
+    assert provider.cq_compile(qc).circuit == qc
+    assert mock_cq_compile.call_count == 3
+
+    # ...and are promoted into the in-memory cache
+    provider = qss.SuperstaQProvider(
+        api_key="MY_TOKEN", compile_cache_size=10**6, compile_cache_path=path
+    )
+    assert provider.cq_compile(qc).circuit == qc
+    assert provider.compile_cache is not None and len(provider.compile_cache) == 1
+    assert mock_cq_compile.call_count == 3
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        return mock_cq_compile.return_value
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compile_cache_size=10**6)
+    provider._apost = MagicMock(side_effect=mock_apost)  # type: ignore
+    assert asyncio.run(provider.acq_compile(qc)).circuit == qc
+    assert asyncio.run(provider.acq_compile(qc)).circuit == qc
+    provider._apost.assert_called_once()
+    assert provider.cq_compile(qc).circuit == qc
+    assert mock_cq_compile.call_count == 3
+
+
+def test_compile_cache_invalidation(tmp_path: pathlib.Path) -> None:
+    path = str(tmp_path / "compile.db")
+    provider = qss.SuperstaQProvider(
+        api_key="MY_TOKEN", compile_cache_size=10**6, compile_cache_path=path
+    )
+    assert provider.compile_disk_cache is not None
+    assert provider.compile_disk_cache.max_age == 7 * 24 * 3600
+    disk_cache = qss.SuperstaQProvider(
+        api_key="MY_TOKEN", compile_cache_path=path, compile_cache_max_age=None
+    ).compile_disk_cache
+    assert disk_cache is not None and disk_cache.max_age is None
+
+    # responses are not shared between API keys
+    key = provider._compile_cache_key("/cq_compile", {})
+    assert key is not None and key == provider._compile_cache_key("/cq_compile", {})
+    other_provider = qss.SuperstaQProvider(api_key="OTHER_TOKEN", compile_cache_size=10**6)
+    assert other_provider._compile_cache_key("/cq_compile", {}) != key
+    assert "MY_TOKEN" not in str(key)
+
+    # uploading new AQT configs clears both tiers
+    provider._cache_compile(key, {"qiskit_circuits": "abc"})
+    assert provider._get_cached_compile(key) == {"qiskit_circuits": "abc"}
+    provider._client = MagicMock()
+    pulses_file = tmp_path / "Pulses.yaml"
+    variables_file = tmp_path / "Variables.yaml"
+    pulses_file.write_text("def")
+    variables_file.write_text("uvw")
+    _ = provider.aqt_upload_configs(str(pulses_file), str(variables_file))
+    assert provider.compile_cache is not None and len(provider.compile_cache) == 0
+    assert key not in provider.compile_disk_cache
+    assert provider._get_cached_compile(key) is None
+
+
+@patch("requests.post")
+def test_compile_cache_eca(mock_post: MagicMock) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", compile_cache_size=10**6)
+
+    qc = qiskit.QuantumCircuit(1)
+    qc.h(0)
+    mock_post.return_value.json = lambda: {
+        "qiskit_circuits": qss.serialization.serialize_circuits([qc]),
+        "state_jp": applications_superstaq.converters.serialize({}),
+        "pulse_lists_jp": applications_superstaq.converters.serialize([[[]]]),
+    }
+
+    # unseeded requests are not cached
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1)
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1)
+    assert mock_post.call_count == 2
+
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1, random_seed=1234)
+    _ = provider.aqt_compile_eca(qc, num_equivalent_circuits=1, random_seed=1234)
+    assert mock_post.call_count == 3
+
+
+@patch(
+    "applications_superstaq.superstaq_client._SuperstaQClient.ibmq_compile",
+)
+def test_pulse_cache(mock_ibmq_compile: MagicMock) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert provider.pulse_cache is None
+
+    qc = qiskit.QuantumCircuit(2)
+    qc.cx(0, 1)
+    mock_ibmq_compile.return_value = {
+        "qiskit_circuits": qss.serialization.serialize_circuits([qc, qc]),
+        "pulses": applications_superstaq.converters.serialize([{"a": 0}, {"a": 1}]),
+    }
+
+    # pulse sequences are only deserialized when accessed
+    out = provider.ibmq_compile([qc, qc])
+    assert isinstance(out.pulse_sequences, qss.serialization.LazyObjectList)
+    assert out.pulse_sequences.num_decoded() == 0
+    assert out.pulse_sequences == [{"a": 0}, {"a": 1}]
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", pulse_cache_size=10)
+    assert provider.pulse_cache is not None
+
+    pulse_sequences = provider.ibmq_compile([qc, qc]).pulse_sequences
+    other_pulse_sequences = provider.ibmq_compile([qc, qc]).pulse_sequences
+    assert other_pulse_sequences[1] == pulse_sequences[1]
+    assert provider.pulse_cache.cache_info().hits == 1
+
+    # but each call gets its own objects
+    assert other_pulse_sequences[1] is not pulse_sequences[1]
+    pulse_sequences[1]["a"] = 2
+    assert provider.ibmq_compile([qc, qc]).pulse_sequences[1] == {"a": 1}
+
+    mock_ibmq_compile.return_value = {
+        "qiskit_circuits": qss.serialization.serialize_circuits([qc]),
+        "pulses": applications_superstaq.converters.serialize([{"a": 2}]),
+    }
+    out = provider.ibmq_compile(qc)
+    assert "pulse_sequence" not in out.__dict__
+    assert out.pulse_sequence == {"a": 2}
+    assert out == qss.compiler_output.CompilerOutput(qc, {"a": 2})
+
+
+@patch(
+    "applications_superstaq.superstaq_client._SuperstaQClient.ibmq_compile",
+)
+@patch(
+    "applications_superstaq.superstaq_client._SuperstaQClient.qscout_compile",
+)
+def test_deduplicate_circuits(mock_qscout_compile: MagicMock, mock_ibmq_compile: MagicMock) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert not provider.deduplicate_circuits
+
+    qc_0 = qiskit.QuantumCircuit(2)
+    qc_0.cx(0, 1)
+    qc_1 = qiskit.QuantumCircuit(2)
+    qc_1.cz(0, 1)
+    circuits = [qc_0, qc_1, qc_0]
+    assert provider._deduplicate(circuits) == (circuits, None)
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", deduplicate_circuits=True)
+    assert provider._deduplicate(circuits) == ([qc_0, qc_1], [0, 1, 0])
+    assert provider._deduplicate(qc_0) == (qc_0, None)
+    assert provider._deduplicate([qc_0, qc_1]) == ([qc_0, qc_1], None)
+
+    mock_qscout_compile.return_value = {
+        "qiskit_circuits": qss.serialization.serialize_circuits([qc_0, qc_1]),
+        "jaqal_programs": ["jaqal_0", "jaqal_1"],
+    }
+    out = provider.qscout_compile(circuits)
+    assert out == qss.compiler_output.CompilerOutput(
+        circuits, jaqal_programs=["jaqal_0", "jaqal_1", "jaqal_0"]
+    )
+    serialized_circuits = mock_qscout_compile.call_args[0][0]["qiskit_circuits"]
+    assert qss.serialization.deserialize_circuits(serialized_circuits) == [qc_0, qc_1]
+
+    mock_ibmq_compile.return_value = {
+        "qiskit_circuits": qss.serialization.serialize_circuits([qc_0, qc_1]),
+        "pulses": applications_superstaq.converters.serialize([0, 1]),
+    }
+    out = provider.ibmq_compile(circuits)
+    assert out == qss.compiler_output.CompilerOutput(circuits, pulse_sequences=[0, 1, 0])
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        assert len(qss.serialization.deserialize_circuits(json_dict["qiskit_circuits"])) == 2
+        return {
+            "qiskit_circuits": qss.serialization.serialize_circuits([qc_0, qc_1]),
+            "pulses": applications_superstaq.converters.serialize([0, 1]),
+        }
+
+    provider._apost = mock_apost  # type: ignore
+    assert asyncio.run(provider.acq_compile(circuits)).circuits == circuits
+    assert asyncio.run(provider.aneutral_atom_compile(circuits)) == [0, 1, 0]
+
+
+@patch(
+    "applications_superstaq.superstaq_client._SuperstaQClient.aqt_compile",
+)
+def test_aqt_compile_parameter_values(mock_aqt_compile: MagicMock) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+
+    theta = qiskit.circuit.Parameter("theta")
+    qc = qiskit.QuantumCircuit(1)
+    qc.rx(theta, 0)
+    compiled_circuits = [qc.bind_parameters({theta: value}) for value in (0.1, 0.2)]
+
+    mock_aqt_compile.return_value = {
+        "qiskit_circuits": qss.serialization.serialize_circuits(compiled_circuits),
+        "state_jp": applications_superstaq.converters.serialize({}),
+        "pulse_lists_jp": applications_superstaq.converters.serialize([[[]], [[]]]),
+    }
+    out = provider.aqt_compile(qc, parameter_values=[[0.1], [0.2]])
+    assert out.circuits == compiled_circuits
+
+    request_json = mock_aqt_compile.call_args[0][0]
+    assert qss.serialization.deserialize_circuits(request_json["qiskit_circuits"]) == [qc]
+    assert request_json["parameters"] == ["theta"]
+    values = qss.serialization.deserialize_parameter_values(request_json["parameter_values"])
+    assert values.tolist() == [[0.1], [0.2]]
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        assert json_dict == {**request_json, "backend": "keysight"}
+        return mock_aqt_compile.return_value
+
+    provider._apost = mock_apost  # type: ignore
+    out = asyncio.run(provider.aaqt_compile(qc, parameter_values=[[0.1], [0.2]]))
+    assert out.circuits == compiled_circuits
+
+    with pytest.raises(ValueError, match="single"):
+        _ = provider.aqt_compile([qc], parameter_values=[[0.1]])
+
+
 @patch.dict(os.environ, {"SUPERSTAQ_API_KEY": ""})
 def test_get_balance() -> None:
     ss_provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
@@ -82,6 +465,63 @@ def test_get_balance() -> None:
     assert ss_provider.get_balance(pretty_output=False) == 12345.6789
 
 
+def test_metadata_cache(tmp_path: pathlib.Path) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    assert provider.metadata_cache is None
+    assert provider.get_backend("ibmq_qasm_simulator") is not provider.get_backend(
+        "ibmq_qasm_simulator"
+    )
+
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", metadata_ttl=60)
+    assert provider.metadata_cache is not None
+    mock_client = MagicMock()
+    mock_client.get_backends.return_value = {
+        "superstaq_backends": {"compile-and-run": ["ibmq_qasm_simulator", "aws_sv1_simulator"]}
+    }
+    mock_client.get_balance.return_value = {"balance": 12.0}
+    mock_client.aqt_get_configs.return_value = {"pulses": "abc", "variables": "xyz"}
+    mock_client.aqt_upload_configs.return_value = {
+        "status": "Your AQT configuration has been updated"
+    }
+    provider._client = mock_client
+
+    backends = provider.backends()
+    assert provider.backends() == backends
+    assert provider.backends()[0] is backends[0] is provider.get_backend("ibmq_qasm_simulator")
+    mock_client.get_backends.assert_called_once()
+
+    assert provider.get_balance() == "$12.00"
+    assert provider.get_balance(pretty_output=False) == 12.0
+    mock_client.get_balance.assert_called_once()
+
+    assert provider.aqt_get_configs() == {"pulses": "abc", "variables": "xyz"}
+    assert provider.aqt_get_configs() == {"pulses": "abc", "variables": "xyz"}
+    mock_client.aqt_get_configs.assert_called_once()
+
+    # uploading new configs invalidates the cached ones
+    pulses_file = tmp_path / "Pulses.yaml"
+    variables_file = tmp_path / "Variables.yaml"
+    pulses_file.write_text("def")
+    variables_file.write_text("uvw")
+    _ = provider.aqt_upload_configs(str(pulses_file), str(variables_file))
+    mock_client.aqt_upload_configs.assert_called_once_with({"pulses": "def", "variables": "uvw"})
+    mock_client.aqt_get_configs.return_value = {"pulses": "def", "variables": "uvw"}
+    assert provider.aqt_get_configs() == {"pulses": "def", "variables": "uvw"}
+    assert mock_client.aqt_get_configs.call_count == 2
+
+    # submitting jobs invalidates the cached balance
+    mock_client.create_job.return_value = {"job_ids": ["job_id"]}
+    mock_client.get_balance.return_value = {"balance": 10.0}
+    _ = backends[0].run(qiskit.QuantumCircuit(1, 1), shots=10)
+    assert provider.get_balance(pretty_output=False) == 10.0
+    assert mock_client.get_balance.call_count == 2
+
+    provider.invalidate_metadata()
+    assert provider.backends() == backends
+    assert provider.backends()[0] is not backends[0]
+    assert mock_client.get_backends.call_count == 2
+
+
 @patch("requests.post")
 def test_aqt_compile(mock_post: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
@@ -254,10 +694,191 @@ def test_cq_compile(mock_post: MagicMock) -> None:
 def test_neutral_atom_compile(mock_ibmq_compile: MagicMock) -> None:
     provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
     assert provider.neutral_atom_compile(qiskit.QuantumCircuit()) == mock.DEFAULT
-    assert provider.neutral_atom_compile([qiskit.QuantumCircuit()]) == [mock.DEFAULT]
+    pulses = provider.neutral_atom_compile([qiskit.QuantumCircuit()])
+    assert isinstance(pulses, list) and pulses == [mock.DEFAULT]
+
+    pulses = provider.neutral_atom_compile([qiskit.QuantumCircuit()], lazy=True)
+    assert isinstance(pulses, qss.serialization.LazyObjectList)
+    assert list(pulses) == [mock.DEFAULT]
 
     with mock.patch.dict("sys.modules", {"unittest": None}), pytest.raises(
         applications_superstaq.SuperstaQModuleNotFoundException,
         match="'neutral_atom_compile' requires module 'unittest'",
     ):
         _ = provider.neutral_atom_compile(qiskit.QuantumCircuit())
+
+
+class MockAsyncResponse:
+    def __init__(self, status: int, body: Any) -> None:
+        self.status = status
+        self.headers = {"Retry-After": "1"}
+        self.body = body
+
+    async def __aenter__(self) -> "MockAsyncResponse":
+        return self
+
+    async def __aexit__(self, *_: Any) -> None:
+        pass
+
+    async def json(self, content_type: Any = None) -> Any:
+        return self.body
+
+    async def text(self) -> str:
+        return str(self.body)
+
+
+class MockAsyncSession:
+    def __init__(self, responses: List[MockAsyncResponse]) -> None:
+        self.responses = responses
+        self.requests: List[Any] = []
+
+    def request(self, method: str, url: str, **kwargs: Any) -> MockAsyncResponse:
+        self.requests.append((method, url, kwargs))
+        return self.responses.pop(0)
+
+
+def test_async_session() -> None:
+    pytest.importorskip("aiohttp")
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", connection_pool_size=4)
+
+    async def get_sessions() -> List[Any]:
+        session = await provider._async_session()
+        same_session = await provider._async_session()
+        # (the connector of a session is detached when it is closed)
+        assert session.connector is not None
+        limit = session.connector.limit
+        await provider.aclose()
+        new_session = await provider._async_session()
+        await provider.aclose()
+        await provider.aclose()
+        return [session, same_session, new_session, limit]
+
+    session, same_session, new_session, limit = asyncio.run(get_sessions())
+    assert session is same_session
+    assert session is not new_session
+    assert session.closed and new_session.closed
+    assert session.headers["Authorization"] == "MY_TOKEN"
+    assert limit == 4
+
+    with mock.patch.dict("sys.modules", {"aiohttp": None}), pytest.raises(
+        applications_superstaq.SuperstaQModuleNotFoundException,
+        match="'asynchronous requests' requires module 'aiohttp'",
+    ):
+        asyncio.run(provider._async_session())
+
+
+def test_arequest(monkeypatch: Any) -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN", max_http_retries=1)
+    monkeypatch.setattr(qss.superstaq_provider, "_RETRY_BACKOFF_SECONDS", 0)
+
+    session = MockAsyncSession(
+        [
+            MockAsyncResponse(503, "unavailable"),
+            MockAsyncResponse(200, {"foo": "bar"}),
+            MockAsyncResponse(503, "unavailable"),
+            MockAsyncResponse(503, "still unavailable"),
+            MockAsyncResponse(404, "not found"),
+            MockAsyncResponse(503, "unavailable"),
+        ]
+    )
+
+    async def mock_async_session() -> MockAsyncSession:
+        return session
+
+    provider._async_session = mock_async_session  # type: ignore
+
+    status, headers, body = asyncio.run(provider._arequest("GET", "url", verify=False))
+    assert (status, body) == (200, {"foo": "bar"})
+    assert headers["Retry-After"] == "1"
+    assert session.requests[0] == ("GET", "url", {"json": None, "ssl": False})
+
+    status, _, body = asyncio.run(provider._arequest("POST", "url", {"a": 1}))
+    assert (status, body) == (503, "still unavailable")
+    assert session.requests[-1] == ("POST", "url", {"json": {"a": 1}, "ssl": None})
+
+    status, _, body = asyncio.run(provider._arequest("GET", "url"))
+    assert (status, body) == (404, "not found")
+
+    # requests with side effects are never retried
+    status, _, body = asyncio.run(provider._arequest("POST", "url", {"a": 1}, retry=False))
+    assert (status, body) == (503, "unavailable")
+    assert len(session.requests) == 6
+
+
+def test_apost() -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+    responses: List[Any] = [(200, {}, {"foo": "bar"}), (500, {}, "oops"), (200, {}, {})]
+    retries: List[bool] = []
+
+    async def mock_arequest(
+        method: str, url: str, json_dict: Dict, verify: bool, retry: bool
+    ) -> Any:
+        assert (method, url, json_dict, verify) == (
+            "POST",
+            f"{qss.API_URL}/v0.1.0{endpoint}",
+            {},
+            True,
+        )
+        retries.append(retry)
+        return responses.pop(0)
+
+    provider._arequest = mock_arequest  # type: ignore
+
+    endpoint = "/jobs"
+    assert asyncio.run(provider._apost(endpoint, {})) == {"foo": "bar"}
+    with pytest.raises(applications_superstaq.SuperstaQException, match="status 500: oops"):
+        asyncio.run(provider._apost(endpoint, {}))
+
+    endpoint = "/cq_compile"
+    assert asyncio.run(provider._apost(endpoint, {})) == {}
+    assert retries == [False, False, True]
+
+
+def test_async_compile() -> None:
+    provider = qss.SuperstaQProvider(api_key="MY_TOKEN")
+
+    qc = qiskit.QuantumCircuit(1)
+    qc.h(0)
+    serialized_circuit = qss.serialization.serialize_circuits(qc)
+    requests = []
+
+    async def mock_apost(endpoint: str, json_dict: Dict[str, Any]) -> Dict[str, Any]:
+        requests.append((endpoint, json_dict))
+        return {
+            "qiskit_circuits": serialized_circuit,
+            "state_jp": applications_superstaq.converters.serialize({}),
+            "pulse_lists_jp": applications_superstaq.converters.serialize([[[]]]),
+            "jaqal_programs": ["jaqal"],
+            "pulses": applications_superstaq.converters.serialize([mock.DEFAULT]),
+        }
+
+    provider._apost = mock_apost  # type: ignore
+
+    # serialization (which may probe the server with a synchronous request) runs off the loop
+    serialize_circuits = provider._serialize_circuits
+    serialization_threads = []
+
+    def mock_serialize_circuits(circuits: Any) -> str:
+        serialization_threads.append(threading.get_ident())
+        return serialize_circuits(circuits)
+
+    provider._serialize_circuits = mock_serialize_circuits  # type: ignore
+
+    assert asyncio.run(provider.aaqt_compile(qc)).circuit == qc
+    assert asyncio.run(provider.aqscout_compile([qc])).jaqal_programs == ["jaqal"]
+    assert asyncio.run(provider.acq_compile([qc])).circuits == [qc]
+    assert asyncio.run(provider.aibmq_compile(qc)) == qss.compiler_output.CompilerOutput(
+        qc, mock.DEFAULT
+    )
+    assert asyncio.run(provider.aneutral_atom_compile([qc])) == [mock.DEFAULT]
+
+    assert [endpoint for endpoint, _ in requests] == [
+        "/aqt_compile",
+        "/qscout_compile",
+        "/cq_compile",
+        "/ibmq_compile",
+        "/neutral_atom_compile",
+    ]
+    assert requests[0][1] == {"qiskit_circuits": serialized_circuit, "backend": "keysight"}
+    assert len(serialization_threads) == 5
+    assert threading.get_ident() not in serialization_threads